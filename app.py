@@ -1,39 +1,311 @@
+import time
+
+# Yeniden çalıştırma süresi betiğin en başından ölçülür
+_RUN_STARTED = time.perf_counter()
+
 import streamlit as st
 
 # Streamlit sayfa yapılandırması en başta olmalı
 st.set_page_config(layout="wide")
 
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-from data_processor import DataProcessor
-from simulator import Simulator
-import json
-import os
-
-def load_saved_configs():
-    if os.path.exists('saved_configs.json'):
-        with open('saved_configs.json', 'r') as f:
-            return json.load(f)
-    return {'tracks': {}, 'cars': {}}
-
-def save_config(configs, config_type, name, data):
-    configs[config_type][name] = data
-    with open('saved_configs.json', 'w') as f:
-        json.dump(configs, f)
+import io
+
+# numpy, pandas, matplotlib ve simülasyon modülleri yalnızca gerektiğinde,
+# ilgili önbellekli fonksiyonların içinde içe aktarılır.
+
+CONFIG_PATH = 'saved_configs.json'
+
+@st.cache_resource(show_spinner=False)
+def get_config_store():
+    """Yeniden çalıştırmalar arasında paylaşılan yapılandırma deposu (ilk açılışta JSON'dan doldurulur)"""
+    from config_store import open_store
+    return open_store(import_from=CONFIG_PATH)
+
+@st.cache_data(show_spinner=False)
+def parse_input(data_input):
+    """Metin alanı içeriğini ayrıştırır (aynı içerik için önbellekli)"""
+    from data_processor import DataProcessor
+    return DataProcessor().process_data(data_input)
+
+@st.cache_resource(show_spinner=False)
+def get_result_cache():
+    from result_cache import default_cache
+    return default_cache()
+
+@st.cache_data(show_spinner=False)
+def run_simulation(track_data, car_data, trace=False):
+    """Simülasyonu çalıştırır; sonuç girdi içeriğine göre önbelleklenir"""
+    from simulator import Simulator
+    simulator = Simulator(track_data, car_data)
+    simulator.result_cache = get_result_cache()
+    return simulator.run(trace=trace)
+
+@st.cache_data(show_spinner=False)
+def run_comparison(track_data, car_data_list, trace=False):
+    """Tüm araçları tek toplu çağrıda çalıştırır; sonuç girdi içeriğine göre önbelleklenir"""
+    from batch_runner import run_cars
+    cache = get_result_cache()
+    return run_cars(track_data, car_data_list, cache_path=cache.path if cache is not None else None, trace=trace)
+
+def comparison_table(labels, results_list, reference):
+    """Araçları tur süresine göre sıralar; farklar referans araca göredir"""
+    import pandas as pd
+    performance_metrics = ['temel_sure', 'viraj_etkisi', 'duz_yol_etkisi', 'hava_direnci', 'yakit_tuketimi', 'lastik_asinmasi']
+    table = pd.DataFrame({
+        'Araç': labels,
+        'Tur Süresi': [float(results['tur_suresi']) for results in results_list],
+        **{metric: [float(results['detaylar'][metric]) for results in results_list] for metric in performance_metrics}
+    })
+    table.insert(2, 'Referansa Fark', table['Tur Süresi'] - table['Tur Süresi'][reference])
+    table = table.sort_values('Tur Süresi', kind='stable').reset_index(drop=True)
+    table.insert(0, 'Sıra', range(1, len(table) + 1))
+    return table
+
+def _figure_png(fig):
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', bbox_inches='tight')
+    return buffer.getvalue()
+
+@st.cache_data(show_spinner=False)
+def run_setup_optimization(track_data, car_data, generations, population):
+    """Vites oranları, son dişli ve aerodinamik ayarını arar (girdilere göre önbellekli)"""
+    from setup_optimizer import SetupOptimizer
+    return SetupOptimizer(track_data, car_data).optimize(generations=generations, population=population)
+
+def show_setup_optimizer(track_data, car_data):
+    """Ayar optimizasyonu modu: en iyi ayar, Pareto cephesi ve değerlendirme hızı"""
+    col1, col2 = st.columns(2)
+    with col1:
+        generations = st.number_input("Nesil Sayısı", min_value=1, max_value=50, value=8)
+    with col2:
+        population = st.number_input("Nesil Başına Aday", min_value=4, max_value=512, value=48)
+
+    if st.button("⚙️ Optimizasyonu Başlat", type="primary"):
+        st.header("⚙️ Optimizasyon Sonuçları")
+        with st.spinner("Ayarlar değerlendiriliyor..."):
+            result = run_setup_optimization(track_data, car_data, int(generations), int(population))
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            best_time = result.pareto['tur_suresi'].min() if len(result.pareto) else float('nan')
+            st.metric("En İyi Tur Süresi", f"{best_time:.2f} saniye")
+        with col2:
+            st.metric("Değerlendirme", f"{result.stats['evaluations']} aday")
+        with col3:
+            st.metric("Değerlendirme Hızı", f"{result.stats['evals_per_s']:.0f} aday/s")
+        st.subheader("En İyi Ayar")
+        st.json(result.best)
+        st.subheader("Tur Süresi / Yakıt / Aşınma Pareto Cephesi")
+        st.dataframe(result.pareto)
+
+@st.cache_data(show_spinner=False)
+def run_strategy_plan(track_data, car_data, race_laps, pit_loss, scenarios, mandatory_change):
+    """Her hava senaryosu için en hızlı pit planını bulur (girdilere göre önbellekli)"""
+    from strategy_planner import StrategyPlanner
+    planner = StrategyPlanner(track_data, car_data, pit_loss=pit_loss)
+    return planner.plan_scenarios(race_laps, scenarios, mandatory_change), planner.stats()
+
+def show_strategy_planner(track_data, car_data):
+    """Strateji planlama modu: yarış mesafesi, pit kaybı ve hava değişimine göre pit planı"""
+    from strategy_planner import DRY
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        race_laps = st.number_input("Yarış Tur Sayısı", min_value=1, max_value=200, value=50)
+    with col2:
+        pit_loss = st.number_input("Pit Kaybı (saniye)", min_value=0.0, max_value=120.0, value=20.0)
+    with col3:
+        mandatory_change = st.checkbox("En Az İki Farklı Lastik", value=True)
+
+    scenarios = {'Kuru': DRY}
+    if st.checkbox("Hava Değişimi Senaryosu"):
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            rain_start = st.number_input("Yağmur Başlangıç Turu", min_value=1, max_value=int(race_laps), value=1)
+        with col2:
+            rain_end = st.number_input("Yağmur Bitiş Turu", min_value=1, max_value=int(race_laps) + 1,
+                                       value=int(race_laps) + 1, help="Yarış sonuna kadar sürmesi için son tur + 1")
+        with col3:
+            rain_intensity = st.slider("Yağmur Yoğunluğu", 0.0, 1.0, 0.6)
+        with col4:
+            track_wetness = st.slider("Pist Islaklığı", 0.0, 1.0, 0.8)
+        weather = [(0, {'rain_intensity': 0.0, 'track_wetness': 0.0}),
+                   (int(rain_start) - 1, {'rain_intensity': rain_intensity, 'track_wetness': track_wetness})]
+        if rain_end > rain_start:
+            weather.append((int(rain_end) - 1, {'rain_intensity': 0.0, 'track_wetness': track_wetness / 2}))
+        scenarios['Hava Değişimi'] = tuple(weather)
+
+    if st.button("🛞 Stratejiyi Planla", type="primary"):
+        st.header("🛞 Pit Stratejisi")
+        try:
+            with st.spinner("Stint süreleri hesaplanıyor..."):
+                plans, stats = run_strategy_plan(track_data, car_data, int(race_laps), float(pit_loss),
+                                                 scenarios, mandatory_change)
+        except ValueError as e:
+            st.error(str(e))
+            return
+        for name, plan in plans.items():
+            st.subheader(name)
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Yarış Süresi", f"{plan.total_time:.2f} saniye")
+            with col2:
+                st.metric("Pit Durağı", plan.stops)
+            st.dataframe(plan.to_rows(), hide_index=True)
+        st.caption(f"{stats['cached_stints']} stint, {stats['lap_solves']} tur çözümü, "
+                   f"{stats['transitions']} plan geçişi")
+
+def show_performance_panel(track_data, car_data_list):
+    """Simülasyonu profil açıkken (önbelleksiz) yeniden çalıştırıp ölçümleri yan menüde gösterir"""
+    import pandas as pd
+    from profiling import Profiler
+    from simulator import Simulator
+    profiler = Profiler()
+    for car_data in car_data_list:
+        simulator = Simulator(track_data, car_data)
+        with simulator.profile(profiler):
+            simulator.run()
+    report = profiler.to_dict()
+
+    with st.sidebar:
+        st.subheader("⏱️ Performans")
+        table = pd.DataFrame(report['timings']).T.sort_values('total', ascending=False)
+        for column in ['total', 'mean', 'p50', 'p90', 'p99', 'max']:
+            table[column] = table[column] * 1000  # ms
+        table['calls'] = table['calls'].astype(int)
+        st.dataframe(table.round(3))
+        st.caption("Süreler milisaniye cinsindendir ve iç içe çağrıları kapsar.")
+        st.json(report['counters'])
+        st.download_button("Profili JSON Olarak İndir", profiler.to_json(indent=2),
+                           file_name='profil.json', mime='application/json')
+
+@st.cache_data(show_spinner=False)
+def render_details_chart(detaylar):
+    """Tur süresi faktörleri grafiğini PNG olarak çizer"""
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    # İç içe sözlükler (hava/pist koşulları) süre değildir, grafiğe alınmaz
+    factors = {name: float(value) for name, value in detaylar.items()
+               if isinstance(value, (int, float)) and not isinstance(value, bool)}
+    ax.bar(list(factors.keys()), list(factors.values()), color='skyblue')
+    ax.set_title("Tur Süresine Etki Eden Faktörler")
+    ax.set_ylabel("Süre (saniye)")
+    ax.tick_params(axis='x', labelrotation=45)
+    return _figure_png(fig)
+
+@st.cache_data(show_spinner=False)
+def render_ranking_chart(labels, deltas):
+    """Araçların referansa göre tur süresi farkını tek bir yatay çubuk grafikte çizer"""
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=(12, max(3, 0.35 * len(labels) + 1)))
+    ax = fig.subplots()
+    colors = ['tab:green' if delta < 0 else 'tab:red' if delta > 0 else 'tab:gray' for delta in deltas]
+    ax.barh(range(len(labels)), deltas, color=colors)
+    ax.set_yticks(range(len(labels)), labels)
+    ax.invert_yaxis()  # En hızlı araç en üstte
+    ax.axvline(0, color='black', linewidth=0.8)
+    ax.set_title("Referans Araca Göre Tur Süresi Farkı")
+    ax.set_xlabel("Fark (saniye)")
+    return _figure_png(fig)
+
+TRACE_POINTS = 1500  # Grafik başına seri noktası; daha uzun izler LTTB ile indirgenir
+
+@st.cache_data(show_spinner=False)
+def render_trace_chart(labels, traces, points=TRACE_POINTS):
+    """
+    Araçların mesafeye bağlı hız, ivme (g) ve vites izlerini üst üste çizer.
+    Her seri LTTB ile en fazla `points` noktaya indirgenir.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.ticker import MaxNLocator
+    from decimation import lttb
+    fig = Figure(figsize=(12, 9))
+    speed_ax, g_ax, gear_ax = fig.subplots(3, 1, sharex=True)
+    for i, (label, trace) in enumerate(zip(labels, traces)):
+        color = f'C{i % 10}'
+        distance = trace['mesafe'] / 1000
+        for ax, channel, scale, style, name in (
+            (speed_ax, 'hiz', 3.6, '-', label),
+            (g_ax, 'boylamsal_g', 1, '-', f'{label} boylamsal'),
+            (g_ax, 'yanal_g', 1, '--', f'{label} yanal'),
+            (gear_ax, 'vites', 1, '-', label),
+        ):
+            values = trace[channel] * scale + (1 if channel == 'vites' else 0)
+            keep = lttb(distance, values, points)
+            ax.plot(distance[keep], values[keep], style, color=color, linewidth=1, label=name,
+                    drawstyle='steps-post' if channel == 'vites' else 'default')
+    speed_ax.set_title("Tur İzi")
+    speed_ax.set_ylabel("Hız (km/sa)")
+    g_ax.set_ylabel("İvme (g)")
+    gear_ax.set_ylabel("Vites")
+    gear_ax.yaxis.set_major_locator(MaxNLocator(integer=True))
+    gear_ax.set_xlabel("Mesafe (km)")
+    for ax in (speed_ax, g_ax, gear_ax):
+        ax.grid(alpha=0.3)
+    speed_ax.legend(loc='upper right', fontsize='small', ncol=min(len(labels), 4))
+    g_ax.legend(loc='upper right', fontsize='small', ncol=min(2 * len(labels), 4))
+    return _figure_png(fig)
+
+def show_timings():
+    """Soğuk başlangıç ve yeniden çalıştırma sürelerini yan menüde gösterir"""
+    elapsed = (time.perf_counter() - _RUN_STARTED) * 1000
+    if 'cold_start_ms' not in st.session_state:
+        st.session_state['cold_start_ms'] = elapsed
+    with st.sidebar:
+        st.caption(f"Soğuk başlangıç: {st.session_state['cold_start_ms']:.0f} ms · "
+                   f"Son yeniden çalıştırma: {elapsed:.0f} ms")
+
+def car_input(store, car_idx):
+    """Tek bir aracın giriş alanları; (kayıtlı araç adı ya da None, car_data) döndürür"""
+    car_name = st.text_input(f"Araç Adı (Kaydetmek için)", key=f"car_name_{car_idx}")
+    car_data_input = st.text_area(
+        f"Araç Özellikleri:",
+        """ortalama_hiz: 180
+viraj_performansi: 0.8
+ivmelenme: 0.7
+hava_direnci: 0.3""",
+        key=f"car_data_{car_idx}",
+        help="Araç özelliklerini 'anahtar: değer' formatında girin"
+    )
+
+    if car_name and st.button(f"Aracı Kaydet", key=f"save_car_{car_idx}"):
+        try:
+            car_data = parse_input(car_data_input)
+            store.save('cars', car_name, car_data)
+            st.success(f"{car_name} aracı kaydedildi!")
+        except ValueError as e:
+            st.error(str(e))
+
+    saved_car = st.selectbox(
+        "Kayıtlı Araçlar",
+        options=["Yeni Araç"] + store.list_names('cars'),
+        key=f"saved_car_{car_idx}"
+    )
+
+    if saved_car != "Yeni Araç":
+        return saved_car, store.get('cars', saved_car)
+    try:
+        return None, parse_input(car_data_input)
+    except ValueError as e:
+        st.error(str(e))
+        return None
 
 def main():
     st.title("🏎️ Yarış Pistleri Tur Süresi Simülasyonu")
     
-    configs = load_saved_configs()
+    store = get_config_store()
     
     # Yan menü
     with st.sidebar:
         st.header("Simülasyon Modu")
         simulation_mode = st.radio(
             "Mod Seçin:",
-            ["Tek Araç Simülasyonu", "Araç Karşılaştırma"]
+            ["Tek Araç Simülasyonu", "Araç Karşılaştırma", "Ayar Optimizasyonu", "Strateji Planlama"]
         )
+        show_performance = st.checkbox("Performans Paneli", help="Simülasyon metotlarının sürelerini ölçer")
+        show_trace = st.checkbox("Tur İzi", value=True, help="Mesafeye bağlı hız, ivme ve vites grafikleri")
+        if st.button("Kayıtları JSON'a Aktar"):
+            store.export_json(CONFIG_PATH)
+            st.success(f"Kayıtlar {CONFIG_PATH} dosyasına aktarıldı")
     
     # Ana içerik alanı
     col1, col2 = st.columns(2)
@@ -51,79 +323,75 @@ duz_yol_yuzdesi: 0.6""",
         
         if track_name and st.button("Pisti Kaydet"):
             try:
-                track_data = DataProcessor().process_data(track_data_input)
-                save_config(configs, 'tracks', track_name, track_data)
+                track_data = parse_input(track_data_input)
+                store.save('tracks', track_name, track_data)
                 st.success(f"{track_name} pisti kaydedildi!")
             except ValueError as e:
                 st.error(str(e))
         
         saved_track = st.selectbox(
             "Kayıtlı Pistler",
-            options=["Yeni Pist"] + list(configs['tracks'].keys())
+            options=["Yeni Pist"] + store.list_names('tracks')
         )
         if saved_track != "Yeni Pist":
-            track_data = configs['tracks'][saved_track]
+            track_data = store.get('tracks', saved_track)
         else:
             try:
-                track_data = DataProcessor().process_data(track_data_input)
+                track_data = parse_input(track_data_input)
             except ValueError as e:
                 st.error(str(e))
                 return
     
     with col2:
         st.header("🚗 Araç Özellikleri")
-        if simulation_mode == "Tek Araç Simülasyonu":
+        if simulation_mode != "Araç Karşılaştırma":
             car_configs = ["Araç 1"]
         else:
-            car_configs = ["Araç 1", "Araç 2"]
+            car_count = st.number_input("Araç Sayısı", min_value=2, max_value=50, value=2)
+            car_configs = [f"Araç {i + 1}" for i in range(int(car_count))]
         
         car_data_list = []
+        car_labels = []
         for car_idx, car_label in enumerate(car_configs):
-            st.subheader(car_label)
-            car_name = st.text_input(f"Araç Adı (Kaydetmek için)", key=f"car_name_{car_idx}")
-            car_data_input = st.text_area(
-                f"Araç Özellikleri:",
-                """ortalama_hiz: 180
-viraj_performansi: 0.8
-ivmelenme: 0.7
-hava_direnci: 0.3""",
-                key=f"car_data_{car_idx}",
-                help="Araç özelliklerini 'anahtar: değer' formatında girin"
-            )
-            
-            if car_name and st.button(f"Aracı Kaydet", key=f"save_car_{car_idx}"):
-                try:
-                    car_data = DataProcessor().process_data(car_data_input)
-                    save_config(configs, 'cars', car_name, car_data)
-                    st.success(f"{car_name} aracı kaydedildi!")
-                except ValueError as e:
-                    st.error(str(e))
-            
-            saved_car = st.selectbox(
-                "Kayıtlı Araçlar",
-                options=["Yeni Araç"] + list(configs['cars'].keys()),
-                key=f"saved_car_{car_idx}"
-            )
-            
-            if saved_car != "Yeni Araç":
-                car_data = configs['cars'][saved_car]
+            if len(car_configs) == 1:
+                st.subheader(car_label)
+                entry = car_input(store, car_idx)
             else:
-                try:
-                    car_data = DataProcessor().process_data(car_data_input)
-                except ValueError as e:
-                    st.error(str(e))
-                    return
+                # Çok araçta giriş alanları katlanır; ilk iki araç açık gelir
+                with st.expander(car_label, expanded=car_idx < 2):
+                    entry = car_input(store, car_idx)
+            if entry is None:
+                return
+            saved_car, car_data = entry
+            label = saved_car or car_label
+            car_labels.append(label if label not in car_labels else f"{label} ({car_label})")
             car_data_list.append(car_data)
+
+        if simulation_mode == "Araç Karşılaştırma":
+            reference = st.selectbox("Referans Araç", options=range(len(car_labels)),
+                                     format_func=lambda i: car_labels[i])
     
+    if simulation_mode == "Ayar Optimizasyonu":
+        show_setup_optimizer(track_data, car_data_list[0])
+        return
+    if simulation_mode == "Strateji Planlama":
+        show_strategy_planner(track_data, car_data_list[0])
+        return
+
     # Simülasyon başlatma
     if st.button("🚦 Simülasyonu Başlat", type="primary"):
         st.header("📊 Simülasyon Sonuçları")
         
-        results_list = []
-        for idx, car_data in enumerate(car_data_list):
-            simulator = Simulator(track_data, car_data)
-            results = simulator.run()
-            results_list.append(results)
+        if simulation_mode == "Araç Karşılaştırma":
+            try:
+                results_list = run_comparison(track_data, car_data_list, show_trace)
+            except ValueError as e:
+                st.error(str(e))
+                return
+        else:
+            results_list = [run_simulation(track_data, car_data_list[0], show_trace)]
+        if show_performance:
+            show_performance_panel(track_data, car_data_list)
         
         # Sonuçları göster
         if simulation_mode == "Tek Araç Simülasyonu":
@@ -140,66 +408,40 @@ hava_direnci: 0.3""",
                 st.metric("Viraj Süresi", f"{corner_time:.2f} saniye")
             
             # Detaylı grafik
-            fig = plt.figure(figsize=(10, 6))
-            components = list(results['detaylar'].keys())
-            values = [float(v) if isinstance(v, (int, float, str)) and str(v).replace('.', '').isdigit() else 0.0 for v in results['detaylar'].values()]
-            plt.bar(components, values, color='skyblue')
-            plt.title("Tur Süresine Etki Eden Faktörler")
-            plt.ylabel("Süre (saniye)")
-            plt.xticks(rotation=45)
-            st.pyplot(fig)
+            st.image(render_details_chart(results['detaylar']))
+            if show_trace:
+                st.image(render_trace_chart([car_labels[0]], [results['iz']]))
             
         else:
-            # Karşılaştırmalı sonuçlar
+            # Karşılaştırmalı sonuçlar: araç sayısından bağımsız olarak tek tablo ve tek grafik
+            table = comparison_table(car_labels, results_list, reference)
+            best = table.iloc[0]
             col1, col2 = st.columns(2)
-            
+
             with col1:
                 st.metric(
-                    "Araç 1 Pistin Tamamını Tamamlama Süresi",
-                    f"{results_list[0]['tur_suresi']:.2f} saniye"
+                    f"En Hızlı: {best['Araç']}",
+                    f"{best['Tur Süresi']:.2f} saniye",
+                    delta=f"{best['Referansa Fark']:.2f}",
+                    delta_color="inverse"
                 )
             with col2:
                 st.metric(
-                    "Araç 2 Pistin Tamamını Tamamlama Süresi",
-                    f"{results_list[1]['tur_suresi']:.2f} saniye",
-                    delta=f"{results_list[1]['tur_suresi'] - results_list[0]['tur_suresi']:.2f}"
+                    f"Referans: {car_labels[reference]}",
+                    f"{float(results_list[reference]['tur_suresi']):.2f} saniye"
                 )
-            
-            # Karşılaştırma grafiğiToplam Tur Süresi
-
 
-            fig = plt.figure(figsize=(12, 6))
-            
-            # Sadece temel performans metriklerini seç
-            performance_metrics = ['temel_sure', 'viraj_etkisi', 'duz_yol_etkisi', 'hava_direnci', 'yakit_tuketimi', 'lastik_asinmasi']
-            car1_values = [results_list[0]['detaylar'][metric] for metric in performance_metrics]
-            car2_values = [results_list[1]['detaylar'][metric] for metric in performance_metrics]
-            
-            x = np.arange(len(performance_metrics))
-            width = 0.35
-            
-            plt.bar(x - width/2, car1_values, width, label='Araç 1')
-            plt.bar(x + width/2, car2_values, width, label='Araç 2')
-            
-            plt.title("Araç Performans Karşılaştırması")
-            plt.ylabel("Süre (saniye)")
-            plt.xticks(x, performance_metrics, rotation=45)
-            plt.legend()
-            st.pyplot(fig)
-            
-            # Detaylı karşılaştırma tablosu
-            comparison_data = {
-                'Faktör': performance_metrics,
-                'Araç 1': [float(value) for value in car1_values],
-                'Araç 2': [float(value) for value in car2_values],
-                'Fark': [float(car2) - float(car1) for car1, car2 in zip(car1_values, car2_values)]
-            }
+            st.image(render_ranking_chart(table['Araç'].tolist(), table['Referansa Fark'].tolist()))
+            if show_trace:
+                st.image(render_trace_chart(car_labels, [results['iz'] for results in results_list]))
             st.dataframe(
-                pd.DataFrame(comparison_data).style.background_gradient(
-                    subset=['Fark'],
+                table.style.background_gradient(
+                    subset=['Referansa Fark'],
                     cmap='RdYlGn_r'
-                )
+                ),
+                hide_index=True
             )
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
+    show_timings()
\ No newline at end of file
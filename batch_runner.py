@@ -0,0 +1,253 @@
+"""
+JSONL iş dosyalarını başsız (Streamlit olmadan) çalıştıran toplu simülasyon aracı.
+
+    python batch_runner.py jobs.jsonl -o results.jsonl --workers 8 --checkpoint run.ckpt
+    cat jobs.jsonl | python batch_runner.py - --order completion
+
+Her satır bir iştir:
+    {"id": "a1", "track": "ring", "car": "bmw m5", "physics": {"rain_intensity": 0.3}}
+    {"track_data": {...}, "car_data": {...}, "trace": true}
+track/car adları uygulamanın kullandığı yapılandırma deposundan (varsayılan
+saved_configs.sqlite ya da GPACE_CONFIG_STORE) çözülür.
+id verilmezse satır numarası (0 tabanlı) kullanılır. "trace": true verilen
+işlerin sonucuna mesafeye bağlı tur izi ('iz') eklenir. Hatalı işler
+{"status": "error"} satırı üretir; en az bir iş hatalıysa çıkış kodu 1'dir.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import fields
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List
+
+from result_cache import json_default
+from simulator import PhysicsConstants, Simulator
+
+PHYSICS_FIELDS = {field.name for field in fields(PhysicsConstants)}
+
+def read_jobs(lines: Iterable[str]) -> Iterator[Dict]:
+    """Boş olmayan her satırı bir iş olarak okur; id yoksa satır numarasını atar"""
+    index = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            job = json.loads(line)
+        except json.JSONDecodeError as e:
+            job = {'_error': f"Geçersiz JSON: {e}"}
+        if not isinstance(job, dict):
+            job = {'_error': f"İş bir JSON nesnesi olmalı: {type(job).__name__}"}
+        job.setdefault('id', index)
+        index += 1
+        yield job
+
+def resolve_job(job: Dict, store) -> Dict:
+    """Kayıtlı pist/araç adlarını verilere çevirir"""
+    if '_error' in job:
+        raise ValueError(job['_error'])
+    resolved = {'id': job['id'], 'physics': job.get('physics') or {}, 'trace': bool(job.get('trace', False))}
+    for kind, config_type in (('track', 'tracks'), ('car', 'cars')):
+        if f'{kind}_data' in job:
+            resolved[f'{kind}_data'] = job[f'{kind}_data']
+        elif kind in job:
+            data = store.get(config_type, job[kind]) if store is not None else None
+            if data is None:
+                raise ValueError(f"Kayıtlı {kind} bulunamadı: {job[kind]}")
+            resolved[f'{kind}_data'] = data
+        else:
+            raise ValueError(f"İşte '{kind}' ya da '{kind}_data' alanı yok")
+    unknown = set(resolved['physics']) - PHYSICS_FIELDS
+    if unknown:
+        raise ValueError(f"Bilinmeyen fizik alanı: {', '.join(sorted(unknown))}")
+    return resolved
+
+def run_job(job: Dict, cache=None) -> Dict:
+    """Çözümlenmiş tek bir işi çalıştırır; hatalar sonuç satırında raporlanır"""
+    try:
+        simulator = Simulator(job['track_data'], job['car_data'])
+        simulator.result_cache = cache
+        for name, value in job['physics'].items():
+            setattr(simulator.physics, name, value)
+        results = simulator.run(trace=job.get('trace', False))
+        return {'id': job['id'], 'status': 'ok', **results}
+    except Exception as e:  # Tek bir hatalı iş toplu çalıştırmayı durdurmamalı
+        return {'id': job['id'], 'status': 'error', 'error': f"{type(e).__name__}: {e}"}
+
+def _run_chunk(jobs: List[Dict], cache_path: str = None) -> List[Dict]:
+    cache = None
+    if cache_path:
+        from result_cache import open_cache
+        cache = open_cache(cache_path)
+    return [run_job(job, cache) for job in jobs]
+
+def _prepare(jobs: Iterable[Dict], store, done: Dict) -> Iterator[Dict]:
+    """İşleri çözümler; çözümlenemeyenler hata sonucu olarak işaretlenir"""
+    for job in jobs:
+        if job['id'] in done:
+            yield {'id': job['id'], '_done': True}
+            continue
+        try:
+            yield resolve_job(job, store)
+        except ValueError as e:
+            yield {'id': job['id'], 'status': 'error', 'error': str(e)}
+
+def run_batch(jobs: Iterable[Dict], store=None, workers: int = None, chunk_size: int = 8,
+              order: str = 'input', done: Dict = None, cache_path: str = None) -> Iterator[Dict]:
+    """
+    İşleri çalıştırır ve sonuçları akış halinde üretir.
+    order='input' sonuçları giriş sırasıyla, 'completion' bitiş sırasıyla verir.
+    done: {id: sonuç}; bu işler yeniden çalıştırılmaz, sonuçları sırası gelince
+    yeniden verilir. Aynı anda en fazla 2 × workers parça bellekte tutulur.
+    """
+    if order not in ('input', 'completion'):
+        raise ValueError(f"Bilinmeyen sıralama: {order}")
+    done = done or {}
+    prepared = _prepare(jobs, store, done)
+
+    def chunks():
+        while True:
+            chunk = list(islice(prepared, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def finish(chunk: List[Dict], results: List[Dict]) -> Iterator[Dict]:
+        pending = iter(results)
+        for job in chunk:
+            if job.get('_done'):
+                yield done[job['id']]
+            elif 'error' in job:
+                yield job
+            else:
+                yield next(pending)
+
+    def runnable(chunk: List[Dict]) -> List[Dict]:
+        return [job for job in chunk if not job.get('_done') and 'error' not in job]
+
+    if workers is not None and workers <= 1:
+        for chunk in chunks():
+            yield from finish(chunk, _run_chunk(runnable(chunk), cache_path))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        window = 2 * (workers or os.cpu_count() or 1)
+        if order == 'input':
+            queue = deque()
+            for chunk in chunks():
+                queue.append((chunk, executor.submit(_run_chunk, runnable(chunk), cache_path)))
+                if len(queue) >= window:
+                    chunk, future = queue.popleft()
+                    yield from finish(chunk, future.result())
+            while queue:
+                chunk, future = queue.popleft()
+                yield from finish(chunk, future.result())
+        else:
+            running = {}
+            for chunk in chunks():
+                running[executor.submit(_run_chunk, runnable(chunk), cache_path)] = chunk
+                if len(running) >= window:
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        yield from finish(running.pop(future), future.result())
+            while running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    yield from finish(running.pop(future), future.result())
+
+PARALLEL_MIN_JOBS = 16  # Daha az işte süreç havuzunu başlatmak kazançtan pahalıdır
+
+def run_cars(track_data: Dict, car_data_list: List[Dict], physics: Dict = None,
+             workers: int = None, cache_path: str = None, trace: bool = False) -> List[Dict]:
+    """
+    Aynı pistte birden çok aracı tek toplu çağrıda çalıştırır ve Simulator.run
+    sonuçlarını giriş sırasıyla döndürür. workers verilmezse az sayıda araç süreç
+    havuzu olmadan çalıştırılır. trace=True ise sonuçlar tur izini ('iz') içerir.
+    Çalıştırılamayan araç ValueError verir.
+    """
+    jobs = [{'id': i, 'track_data': track_data, 'car_data': car_data, 'physics': physics or {}, 'trace': trace}
+            for i, car_data in enumerate(car_data_list)]
+    if workers is None and len(jobs) < PARALLEL_MIN_JOBS:
+        workers = 1
+    results = []
+    for result in run_batch(jobs, workers=workers, cache_path=cache_path):
+        if result['status'] != 'ok':
+            raise ValueError(f"Araç {result['id'] + 1}: {result['error']}")
+        results.append({key: value for key, value in result.items() if key not in ('id', 'status')})
+    return results
+
+def load_checkpoint(path: str) -> Dict:
+    """Kontrol noktası dosyasındaki tamamlanmış sonuçları {id: sonuç} olarak okur"""
+    done = {}
+    try:
+        with open(path, 'r') as f:
+            for line in f:
+                try:
+                    result = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Kesintide yarım kalmış satır
+                done[result['id']] = result
+    except FileNotFoundError:
+        pass
+    return done
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='JSONL işlerini toplu simüle eder')
+    parser.add_argument('input', help="İş dosyası (JSONL) ya da standart girdi için '-'")
+    parser.add_argument('-o', '--output', default='-', help="Sonuç dosyası (JSONL); varsayılan standart çıktı")
+    parser.add_argument('--workers', type=int, default=None, help='Süreç sayısı (1: süreç havuzu yok)')
+    parser.add_argument('--chunk-size', type=int, default=8)
+    parser.add_argument('--order', choices=['input', 'completion'], default='input')
+    parser.add_argument('--checkpoint', help='Başarılı sonuçların yazıldığı, devam için okunan dosya '
+                                             '(hatalı işler devamda yeniden denenir)')
+    parser.add_argument('--configs', default=None,
+                        help='Kayıtlı pist/araç deposu (varsayılan uygulamanın deposu; .json da olabilir)')
+    parser.add_argument('--cache', help='Paylaşılan ResultCache dosyası')
+    args = parser.parse_args(argv)
+
+    from config_store import open_store
+    store = open_store(args.configs)
+    done = load_checkpoint(args.checkpoint) if args.checkpoint else {}
+
+    source = sys.stdin if args.input == '-' else open(args.input, 'r')
+    output = sys.stdout if args.output == '-' else open(args.output, 'w')
+    checkpoint = None
+    if args.checkpoint:
+        checkpoint = open(args.checkpoint, 'a+')
+        # Yarım kalmış son satır yeni kayıtla birleşmesin
+        if checkpoint.tell() > 0:
+            checkpoint.seek(checkpoint.tell() - 1)
+            if checkpoint.read(1) != '\n':
+                checkpoint.write('\n')
+
+    started = time.perf_counter()
+    counts = {'ok': 0, 'error': 0, 'resumed': 0}
+    try:
+        for result in run_batch(read_jobs(source), store, args.workers, args.chunk_size,
+                                args.order, done, args.cache):
+            line = json.dumps(result, default=json_default)
+            output.write(line + '\n')
+            output.flush()
+            if result['id'] in done:
+                counts['resumed'] += 1
+            else:
+                counts[result['status']] += 1
+                if checkpoint is not None and result['status'] == 'ok':
+                    checkpoint.write(line + '\n')
+                    checkpoint.flush()
+    finally:
+        for stream in (source, output, checkpoint):
+            if stream not in (None, sys.stdin, sys.stdout):
+                stream.close()
+
+    seconds = time.perf_counter() - started
+    computed = counts['ok'] + counts['error']
+    print(f"{computed} iş çalıştırıldı ({counts['error']} hata), {counts['resumed']} iş kontrol noktasından; "
+          f"{seconds:.2f} s, {computed / seconds if seconds > 0 else 0:.1f} iş/s", file=sys.stderr)
+    return 1 if counts['error'] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
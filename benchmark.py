@@ -0,0 +1,226 @@
+"""
+Simülatör, veri ayrıştırıcı ve harita çizici için performans ölçümleri.
+
+    python benchmark.py run [--history benchmark_history.json] [--quick] [--label ETIKET]
+    python benchmark.py compare [--history ...] [--threshold 0.10] [--baseline -2]
+
+Her ölçüm sabit tohumlu, çevrimdışı üretilen girdilerle yapılır; sonuçlar makine
+bilgileriyle birlikte JSON geçmişine eklenir. compare son çalıştırmayı temel
+çalıştırmayla karşılaştırır ve eşikten fazla yavaşlama varsa 1 ile çıkar.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+from typing import Callable, Dict, List
+
+import numpy as np
+
+BENCHMARK_SEED = 1234
+DEFAULT_HISTORY = 'benchmark_history.json'
+DEFAULT_THRESHOLD = 0.10  # %10'dan fazla yavaşlama gerileme sayılır
+
+TRACK_DATA = {'pist_uzunlugu': 5.4, 'viraj_sayisi': 16.0, 'duz_yol_yuzdesi': 0.6}
+CAR_DATA = {'ortalama_hiz': 310.0, 'viraj_performansi': 0.8, 'ivmelenme': 0.7, 'hava_direnci': 0.3}
+
+def machine_info() -> Dict[str, str]:
+    """Sonuçların karşılaştırılabilirliği için makine ve yazılım bilgileri"""
+    import matplotlib
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ''
+    return {
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'matplotlib': matplotlib.__version__,
+        'commit': commit
+    }
+
+def _fingerprint(machine: Dict) -> tuple:
+    return tuple(machine.get(key) for key in ('machine', 'processor', 'cpu_count', 'python', 'numpy'))
+
+def time_call(function: Callable[[], object], repeat: int = 5, min_seconds: float = 0.2) -> Dict[str, float]:
+    """
+    Fonksiyonun çağrı başına süresini ölçer. Döngü sayısı bir ölçüm en az
+    min_seconds sürecek şekilde seçilir; `repeat` ölçümün en küçüğü raporlanır.
+    """
+    timer = timeit.Timer(function)
+    loops = 1
+    while True:
+        if timer.timeit(loops) >= min_seconds or loops >= 1 << 20:
+            break
+        loops *= 2
+    runs = [seconds / loops for seconds in timer.repeat(repeat, loops)]
+    return {'seconds': min(runs), 'median': float(np.median(runs)), 'loops': loops, 'repeat': repeat}
+
+def _record_text(rng: np.random.Generator, lines: int) -> str:
+    keys = ['pist_uzunlugu', 'viraj_sayisi', 'duz_yol_yuzdesi', 'ortalama_hiz', 'viraj_performansi']
+    values = rng.random(lines) * 100
+    return '\n'.join(f'{keys[i % len(keys)]}_{i}: {value:.4f}' for i, value in enumerate(values))
+
+def _track_points(rng: np.random.Generator, count: int) -> np.ndarray:
+    angle = np.linspace(0, 2 * np.pi, count)
+    radius = 1000 + 80 * np.sin(7 * angle) + rng.normal(0, 0.05, count)
+    return np.stack([np.zeros(count), radius * np.cos(angle), radius * np.sin(angle)], axis=1)
+
+def benchmarks(quick: bool = False) -> Dict[str, Callable[[], object]]:
+    """Ölçüm adı → ölçülecek fonksiyon. Girdiler burada, sabit tohumla bir kez üretilir."""
+    import matplotlib
+    matplotlib.use('Agg')
+
+    from data_processor import DataProcessor
+    from map_creator import MapCreator
+    from simulator import CornerSpeedCache, Simulator, grip_surface
+
+    rng = np.random.default_rng(BENCHMARK_SEED)
+    simulator = Simulator(TRACK_DATA, CAR_DATA)
+    cold = Simulator(TRACK_DATA, CAR_DATA)
+
+    def corner_speed_cold():
+        cold.corner_cache = CornerSpeedCache()
+        return cold.calculate_corner_speed(30.0, 5.0)
+
+    loads = rng.uniform(5_000, 40_000, 10_000)
+    slip_angles = rng.uniform(0, 1.5, 10_000)
+    surface = grip_surface(simulator.physics)
+
+    small_text = 'pist_uzunlugu: 5.4\nviraj_sayisi: 16\nduz_yol_yuzdesi: 0.6'
+    large_text = _record_text(rng, 20_000 if quick else 200_000)
+    processor = DataProcessor()
+
+    cases = {
+        'simulator.corner_speed.cold': corner_speed_cold,
+        'simulator.corner_speed.cached': lambda: simulator.calculate_corner_speed(30.0, 5.0),
+        'simulator.acceleration': lambda: simulator.calculate_acceleration(50.0),
+        'simulator.tire_grip.analytic': lambda: simulator.calculate_tire_grip(loads, slip_angles),
+        'simulator.tire_grip.surface': lambda: surface.grip(loads, slip_angles),
+        'simulator.lap_time': lambda: simulator.calculate_lap_time(),
+        'simulator.run': lambda: simulator.run(),
+        'data_processor.process_data.small': lambda: processor.process_data(small_text),
+        'data_processor.process_data.large': lambda: processor.process_data(large_text),
+    }
+    from strategy_planner import StrategyPlanner
+    planner = StrategyPlanner(TRACK_DATA, CAR_DATA)
+    cases['strategy_planner.plan.cached'] = lambda: planner.plan(30 if quick else 60, mandatory_change=True)
+
+    from decimation import lttb
+    trace_distance = np.arange(200_000, dtype=float)
+    trace_speed = 40 + 20 * np.sin(trace_distance / 500) + rng.normal(0, 0.5, len(trace_distance))
+    cases['decimation.lttb.200000'] = lambda: lttb(trace_distance, trace_speed, 1500)
+    for count in ([10_000, 100_000] if quick else [10_000, 100_000, 1_000_000]):
+        creator = MapCreator(_track_points(rng, count))
+        cases[f'map_creator.create_map.{count}'] = lambda creator=creator: creator.render('png')
+    return cases
+
+def run_benchmarks(quick: bool = False, selected: List[str] = None,
+                   progress: Callable[[str, Dict], None] = None) -> Dict[str, Dict[str, float]]:
+    repeat = 3 if quick else 5
+    min_seconds = 0.05 if quick else 0.2
+    results = {}
+    for name, function in benchmarks(quick).items():
+        if selected and not any(name.startswith(prefix) for prefix in selected):
+            continue
+        function()  # Isınma: içe aktarmalar ve önbellekler ölçüme girmez
+        results[name] = time_call(function, repeat, min_seconds)
+        if progress is not None:
+            progress(name, results[name])
+    return results
+
+def load_history(path: str) -> List[Dict]:
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def save_history(path: str, history: List[Dict]):
+    # Geçici dosyaya yazıp yeniden adlandırma: yarım kalan yazma geçmişi bozmaz
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump(history, f, indent=2)
+    os.replace(temp_path, path)
+
+def compare_runs(baseline: Dict, current: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """
+    İki çalıştırmadaki ortak ölçümleri karşılaştırır. Her ölçüm için oran
+    (yeni / eski) ve eşiği aşan yavaşlamalar için regression=True döndürür.
+    """
+    rows = []
+    for name, result in current['results'].items():
+        if name not in baseline['results']:
+            continue
+        old, new = baseline['results'][name]['seconds'], result['seconds']
+        ratio = new / old if old > 0 else float('inf')
+        rows.append({'name': name, 'baseline': old, 'current': new, 'ratio': ratio,
+                     'regression': ratio > 1 + threshold})
+    return rows
+
+def _format_seconds(seconds: float) -> str:
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('µs', 1e-6)):
+        if seconds >= scale:
+            return f'{seconds / scale:.3f} {unit}'
+    return f'{seconds / 1e-9:.1f} ns'
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Performans ölçümleri ve gerileme kontrolü')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Ölçümleri çalıştırıp geçmişe ekler')
+    run_parser.add_argument('--history', default=DEFAULT_HISTORY)
+    run_parser.add_argument('--label', default='')
+    run_parser.add_argument('--quick', action='store_true', help='Küçük girdiler ve az tekrar')
+    run_parser.add_argument('--only', nargs='*', help='Yalnızca bu önekle başlayan ölçümler')
+
+    compare_parser = commands.add_parser('compare', help='Son çalıştırmayı temel çalıştırmayla karşılaştırır')
+    compare_parser.add_argument('--history', default=DEFAULT_HISTORY)
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    compare_parser.add_argument('--baseline', type=int, default=-2, help='Temel çalıştırmanın geçmiş indeksi')
+    compare_parser.add_argument('--current', type=int, default=-1, help='Karşılaştırılan çalıştırmanın indeksi')
+
+    args = parser.parse_args(argv)
+    if args.command == 'run':
+        def report(name, result):
+            print(f'{name:<40} {_format_seconds(result["seconds"]):>12}  ({result["loops"]} döngü)')
+
+        results = run_benchmarks(args.quick, args.only, report)
+        history = load_history(args.history)
+        history.append({'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'label': args.label,
+                        'quick': args.quick, 'machine': machine_info(), 'results': results})
+        save_history(args.history, history)
+        print(f'{len(results)} ölçüm {args.history} dosyasına eklendi')
+        return 0
+
+    history = load_history(args.history)
+    try:
+        baseline, current = history[args.baseline], history[args.current]
+    except IndexError:
+        print('Karşılaştırma için geçmişte yeterli çalıştırma yok', file=sys.stderr)
+        return 2
+    if _fingerprint(baseline['machine']) != _fingerprint(current['machine']):
+        print('Uyarı: çalıştırmalar farklı makine/yazılım üzerinde alınmış', file=sys.stderr)
+    if baseline.get('quick') != current.get('quick'):
+        print('Uyarı: çalıştırmalardan yalnızca biri --quick ile alınmış', file=sys.stderr)
+
+    rows = compare_runs(baseline, current, args.threshold)
+    for row in rows:
+        flag = 'GERİLEME' if row['regression'] else ''
+        print(f'{row["name"]:<40} {_format_seconds(row["baseline"]):>12} → {_format_seconds(row["current"]):>12}'
+              f'  {row["ratio"]:6.2f}x  {flag}')
+    regressions = [row for row in rows if row['regression']]
+    if regressions:
+        print(f'{len(regressions)} ölçümde %{args.threshold * 100:.0f} üzerinde yavaşlama', file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,208 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+CONFIG_TYPES = ('tracks', 'cars')
+LEGACY_JSON_PATH = 'saved_configs.json'  # Eski JSON deposu; boş SQLite deposu buradan doldurulur
+
+def default_store_path() -> str:
+    """Uygulama ve toplu çalıştırıcının paylaştığı depo yolu (GPACE_CONFIG_STORE ile değiştirilebilir)"""
+    return os.environ.get('GPACE_CONFIG_STORE', 'saved_configs.sqlite')
+
+class ConfigStore(ABC):
+    """
+    Kayıtlı pist ve araç yapılandırmaları için depo arayüzü.
+    config_type 'tracks' ya da 'cars' olabilir.
+    """
+
+    @abstractmethod
+    def list_names(self, config_type: str) -> List[str]:
+        """Yükleri okumadan kayıt adlarını (sıralı) döndürür"""
+
+    @abstractmethod
+    def get(self, config_type: str, name: str):
+        """Kaydı döndürür; yoksa None"""
+
+    @abstractmethod
+    def save(self, config_type: str, name: str, data: Dict):
+        """Kaydı ekler ya da günceller"""
+
+    @abstractmethod
+    def delete(self, config_type: str, name: str):
+        """Kaydı siler"""
+
+    def load_all(self) -> Dict[str, Dict]:
+        """saved_configs.json biçiminde tüm kayıtları döndürür"""
+        return {config_type: {name: self.get(config_type, name) for name in self.list_names(config_type)}
+                for config_type in CONFIG_TYPES}
+
+    def import_json(self, path: str):
+        """saved_configs.json biçimindeki dosyadan kayıtları içe aktarır"""
+        with open(path, 'r') as f:
+            configs = json.load(f)
+        for config_type in CONFIG_TYPES:
+            for name, data in configs.get(config_type, {}).items():
+                self.save(config_type, name, data)
+
+    def export_json(self, path: str):
+        """Tüm kayıtları saved_configs.json biçiminde atomik olarak yazar"""
+        _atomic_write_json(path, self.load_all())
+
+def _check_type(config_type: str):
+    if config_type not in CONFIG_TYPES:
+        raise ValueError(f"Bilinmeyen yapılandırma türü: {config_type}")
+
+def _atomic_write_json(path: str, data):
+    # Geçici dosyaya yazıp yeniden adlandırma: okuyucular yarım dosya görmez
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix='.json')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+class JsonConfigStore(ConfigStore):
+    """Tek JSON dosyası üzerinde depo; her kayıt dosyayı atomik olarak yeniden yazar"""
+
+    def __init__(self, path: str = 'saved_configs.json'):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.path):
+            return {config_type: {} for config_type in CONFIG_TYPES}
+        with open(self.path, 'r') as f:
+            configs = json.load(f)
+        for config_type in CONFIG_TYPES:
+            configs.setdefault(config_type, {})
+        return configs
+
+    def list_names(self, config_type: str) -> List[str]:
+        _check_type(config_type)
+        return sorted(self._read()[config_type])
+
+    def get(self, config_type: str, name: str):
+        _check_type(config_type)
+        return self._read()[config_type].get(name)
+
+    def load_all(self) -> Dict[str, Dict]:
+        return self._read()
+
+    def save(self, config_type: str, name: str, data: Dict):
+        _check_type(config_type)
+        with self._lock:
+            configs = self._read()
+            configs[config_type][name] = data
+            _atomic_write_json(self.path, configs)
+
+    def delete(self, config_type: str, name: str):
+        _check_type(config_type)
+        with self._lock:
+            configs = self._read()
+            if configs[config_type].pop(name, None) is not None:
+                _atomic_write_json(self.path, configs)
+
+class SQLiteConfigStore(ConfigStore):
+    """
+    SQLite tabanlı depo. (tür, ad) birincil anahtarı üzerinden indeksli arama yapar;
+    her yazma tek bir işlemde (transaction) atomiktir. Bağlantı nesne ömrü boyunca
+    yeniden kullanılır ve iş parçacıkları arasında kilitle paylaşılır.
+    """
+
+    def __init__(self, path: str = 'saved_configs.sqlite', import_from: str = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS configs (
+                config_type TEXT NOT NULL,
+                name TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                updated REAL NOT NULL,
+                PRIMARY KEY (config_type, name)
+            )""")
+
+        # Boş depoya ilk açılışta JSON dosyasındaki kayıtlar aktarılır
+        if import_from and os.path.exists(import_from) and self._is_empty():
+            self.import_json(import_from)
+
+    def _is_empty(self) -> bool:
+        with self._lock:
+            return self._connection.execute("SELECT 1 FROM configs LIMIT 1").fetchone() is None
+
+    def list_names(self, config_type: str) -> List[str]:
+        _check_type(config_type)
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT name FROM configs WHERE config_type = ? ORDER BY name", (config_type,)).fetchall()
+        return [name for name, in rows]
+
+    def get(self, config_type: str, name: str):
+        _check_type(config_type)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT payload FROM configs WHERE config_type = ? AND name = ?", (config_type, name)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def load_all(self) -> Dict[str, Dict]:
+        configs = {config_type: {} for config_type in CONFIG_TYPES}
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT config_type, name, payload FROM configs ORDER BY config_type, name").fetchall()
+        for config_type, name, payload in rows:
+            if config_type in configs:
+                configs[config_type][name] = json.loads(payload)
+        return configs
+
+    def save(self, config_type: str, name: str, data: Dict):
+        _check_type(config_type)
+        payload = json.dumps(data)
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO configs VALUES (?, ?, ?, ?)", (config_type, name, payload, time.time()))
+
+    def delete(self, config_type: str, name: str):
+        _check_type(config_type)
+        with self._lock:
+            self._connection.execute("DELETE FROM configs WHERE config_type = ? AND name = ?", (config_type, name))
+
+    def import_json(self, path: str):
+        # Tüm içe aktarma tek işlemde: ya hepsi yazılır ya hiçbiri
+        with open(path, 'r') as f:
+            configs = json.load(f)
+        rows = [(config_type, name, json.dumps(data), time.time())
+                for config_type in CONFIG_TYPES for name, data in configs.get(config_type, {}).items()]
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._connection.executemany("INSERT OR REPLACE INTO configs VALUES (?, ?, ?, ?)", rows)
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+def open_store(path: str = None, import_from: str = LEGACY_JSON_PATH) -> ConfigStore:
+    """
+    Uzantıya göre depo açar: .json dosyaları JsonConfigStore, diğerleri
+    SQLiteConfigStore olarak açılır (boşsa import_from dosyasından doldurulur).
+    path verilmezse default_store_path() kullanılır.
+    """
+    path = default_store_path() if path is None else path
+    if path.lower().endswith('.json'):
+        return JsonConfigStore(path)
+    return SQLiteConfigStore(path, import_from=import_from)
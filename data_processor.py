@@ -1,13 +1,28 @@
+import codecs
+import time
+
 import numpy as np
 
+from record_store import RecordStore, RecordView
+
 class DataProcessor:
-    def __init__(self):
-        self.processed_data = {}
+    def __init__(self, store: RecordStore = None, row: int = None):
+        """
+        store verilirse processed_data, RecordStore'daki tek bir satırın sözlük
+        görünümü olur (row verilmezse yeni bir satır eklenir); aksi halde düz sözlüktür.
+        """
+        self.store = store
+        if store is None:
+            self.processed_data = {}
+        else:
+            self.processed_data = store.row(store.append() if row is None else row)
 
     def get_formatted_data(self):
         """
         İşlenmiş verileri Formula 1 formatına uygun şekilde döndürür.
         """
+        if isinstance(self.processed_data, RecordView):
+            return self.processed_data.formatted()
         formatted_data = {}
         for key, value in self.processed_data.items():
             if isinstance(value, float):
@@ -20,7 +35,10 @@ class DataProcessor:
         """
         İşlenmiş verileri temizler.
         """
-        self.processed_data = {}
+        if isinstance(self.processed_data, RecordView):
+            self.processed_data.clear()
+        else:
+            self.processed_data = {}
         return self.processed_data
     def process_data(self, data_input):
         """
@@ -37,43 +55,156 @@ class DataProcessor:
             processed_data = {}
 
             for line in data_lines:
-                if ':' in line:
-                    key, value = line.split(':')
-                    try:
-                        # Formula 1 özel sayısal formatlama
-                        if key.strip().lower() in ['lap_time', 'top_speed', 'bhp', 'torque', 'weight', 'topspeed', 'acceleration', 'pwratio']:
-                            processed_data[key.strip()] = float(value.strip())
-                        else:
-                            processed_data[key.strip()] = value.strip()
-                    except ValueError:
-                        processed_data[key.strip()] = value.strip()
-                else:
-                    processed_data[line.strip()] = True
+                if line.strip():
+                    key, value = self._parse_line(line)
+                    processed_data[key] = value
 
             return processed_data
         except Exception as e:
             raise ValueError(f"Veri işleme hatası: {str(e)}")
+
+    @staticmethod
+    def _parse_line(line):
         """
-        Pist ve araç verilerini işler ve sözlük formatında döndürür.
-        Formula 1 verileri için özel işlemler eklenmiştir.
+        Tek bir 'anahtar: değer' satırını ayrıştırır.
+        Değer yalnızca ilk ':' karakterinden bölünür (değerde ':' olabilir);
+        sayısal değerler float'a çevrilir, iki nokta içermeyen satırlar True olur.
         """
+        if ':' not in line:
+            return line.strip(), True
+        key, value = line.split(':', 1)
+        value = value.strip()
         try:
-            data_lines = data_input.strip().split('\n')
-            processed_data = {}
-            
-            for line in data_lines:
-                if ':' in line:
-                    key, value = line.split(':')
-                    try:
-                        processed_data[key.strip()] = float(value.strip())
-                    except ValueError:
-                        processed_data[key.strip()] = value.strip()
+            return key.strip(), float(value)
+        except ValueError:
+            return key.strip(), value
+
+    @staticmethod
+    def _iter_lines(stream, chunk_size):
+        """
+        Dosya nesnesinden parça parça okuyup satırları üretir; okunan bayt sayısını da verir.
+        Bayt akışları artımlı çözülür: parça sınırına denk gelen çok baytlı UTF-8
+        karakterleri bir sonraki parçayla birleştirilir.
+        """
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        remainder = ''
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            size = len(chunk)
+            if isinstance(chunk, bytes):
+                chunk = decoder.decode(chunk)
+            lines = (remainder + chunk).split('\n')
+            remainder = lines.pop()
+            yield size, lines
+        remainder += decoder.decode(b'', final=True)
+        if remainder:
+            yield 0, [remainder]
+
+    def iter_records(self, stream, chunk_size=1 << 20):
+        """
+        Büyük, çok kayıtlı girdileri akış halinde ayrıştırır ve kayıtları tek tek üretir.
+        Kayıtlar boş satırlarla ayrılır; '|' içeren bir satır tek başına bir
+        (Formula 1 formatında) kayıttır. Bellek kullanımı girdi boyutundan bağımsızdır.
+        """
+        record = {}
+        for _, lines in self._iter_lines(stream, chunk_size):
+            for line in lines:
+                if '|' in line:
+                    if record:
+                        yield record
+                        record = {}
+                    yield dict(self._parse_line(part) for part in line.strip().split('|') if part.strip())
+                elif line.strip():
+                    key, value = self._parse_line(line)
+                    record[key] = value
+                elif record:
+                    yield record
+                    record = {}
+        if record:
+            yield record
+
+    def process_stream(self, stream, numeric_keys, chunk_size=1 << 20, initial_capacity=1024):
+        """
+        Akıştaki kayıtların sayısal anahtarlarını doğrudan NumPy sütunlarına toplar.
+        Her kayıt için sözlük oluşturulmaz: her parça (chunk) için satır indeksleri
+        ve ham değerler toplanır, sonra tek seferde önceden ayrılmış sütunlara
+        yazılır. Sütunlar kapasite dolduğunda ikiye katlanarak büyütülür; kayıtta
+        olmayan değerler NaN olur. i. satır iter_records'un i. kaydına karşılık gelir. Okunan bayt, kayıt sayısı ve işlem hızı (MB/s)
+        `self.stream_stats` içinde saklanır.
+        """
+        started = time.perf_counter()
+        index = {key: i for i, key in enumerate(numeric_keys)}
+        table = np.full((initial_capacity, len(numeric_keys)), np.nan)
+        row = 0
+        filled = False
+        bytes_read = 0
+
+        for size, lines in self._iter_lines(stream, chunk_size):
+            bytes_read += size
+            rows = [[] for _ in numeric_keys]
+            values = [[] for _ in numeric_keys]
+            for line in lines:
+                # Satır sınırları iter_records ile aynıdır; sayısal anahtarı
+                # olmayan kayıtlar da bir (NaN) satır tutar
+                if '|' in line:
+                    if filled:
+                        row += 1
+                    parts = line.split('|')
+                elif line.strip():
+                    parts = (line,)
+                    filled = True
                 else:
-                    processed_data[line.strip()] = True
-            
-            return processed_data
-        except Exception as e:
-            raise ValueError(f"Veri işleme hatası: {str(e)}")
+                    if filled:
+                        row += 1
+                        filled = False
+                    continue
+                for part in parts:
+                    key, separator, value = part.partition(':')
+                    column = index.get(key.strip())
+                    if column is not None and separator:
+                        rows[column].append(row)
+                        values[column].append(value)
+                if len(parts) > 1:
+                    row += 1
+                    filled = False
+
+            # Kapasite yetmiyorsa sütunları ikiye katlayarak büyüt
+            if row + 1 > len(table):
+                capacity = len(table)
+                while capacity < row + 1:
+                    capacity *= 2
+                grown = np.full((capacity, len(numeric_keys)), np.nan)
+                grown[:len(table)] = table
+                table = grown
+            for column in range(len(numeric_keys)):
+                if rows[column]:
+                    table[rows[column], column] = self._to_floats(values[column])
+
+        count = row + 1 if filled else row
+        seconds = time.perf_counter() - started
+        self.stream_stats = {
+            'records': count,
+            'bytes': bytes_read,
+            'seconds': seconds,
+            'mb_per_s': bytes_read / 1e6 / seconds if seconds > 0 else 0.0
+        }
+        return {key: table[:count, i].copy() for key, i in index.items()}
+
+    @staticmethod
+    def _to_floats(values):
+        """Metin değerlerini toplu olarak float dizisine çevirir; sayısal olmayanlar NaN olur"""
+        try:
+            return np.array(values, dtype=float)
+        except ValueError:
+            converted = np.empty(len(values))
+            for i, value in enumerate(values):
+                try:
+                    converted[i] = float(value)
+                except ValueError:
+                    converted[i] = np.nan
+            return converted
 
     def add_manual_data(self, data_dict):
         """
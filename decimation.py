@@ -0,0 +1,84 @@
+import numpy as np
+
+def _first_per_bucket(bucket: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    # Maskedeki noktalardan her kovanın ilkinin indeksi
+    candidates = np.flatnonzero(mask)
+    _, first = np.unique(bucket[candidates], return_index=True)
+    return candidates[first]
+
+def path_minmax(points: np.ndarray, buckets: int) -> np.ndarray:
+    """
+    2B yol için M4 benzeri indirgeme: yay uzunluğu boyunca ardışık noktalar
+    `buckets` eşit kovaya bölünür; her kovadan ilk ve son nokta ile x ve y'nin
+    en küçük/en büyük olduğu noktalar tutulur (kova başına en fazla 6 nokta).
+    Tüm adımlar vektöreldir; tutulacak indeksler sıralı döndürülür.
+    """
+    count = len(points)
+    if count <= 6 * buckets or buckets < 1:
+        return np.arange(count)
+    step = np.hypot(np.diff(points[:, 0]), np.diff(points[:, 1]))
+    arc = np.concatenate(([0.0], np.cumsum(step)))
+    if arc[-1] > 0:
+        bucket = np.minimum((arc * (buckets / arc[-1])).astype(np.intp), buckets - 1)
+    else:
+        bucket = np.arange(count) * buckets // count
+    # Kova sınırları (yay uzunluğu monoton olduğundan kovalar ardışık dizilir)
+    starts = np.flatnonzero(np.concatenate(([True], bucket[1:] != bucket[:-1])))
+    ends = np.append(starts[1:], count) - 1
+    ids = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, count)))
+    keep = [starts, ends]
+    for axis in (0, 1):
+        values = points[:, axis]
+        keep.append(_first_per_bucket(ids, values == np.minimum.reduceat(values, starts)[ids]))
+        keep.append(_first_per_bucket(ids, values == np.maximum.reduceat(values, starts)[ids]))
+    return np.unique(np.concatenate(keep))
+
+def decimate_path(points: np.ndarray, width_px: int, height_px: int, samples_per_pixel: float = 2.0) -> np.ndarray:
+    """
+    2B yolu ekran çözünürlüğüne göre sadeleştirir ve tutulacak indeksleri döndürür.
+    Yay uzunluğu piksel boyunda kovalara bölünür (en fazla
+    samples_per_pixel × (genişlik + yükseklik) kova) ve path_minmax uygulanır;
+    böylece her piksel sütunu/satırındaki zarf korunur.
+    """
+    if len(points) <= 2:
+        return np.arange(len(points))
+    span = points.max(axis=0) - points.min(axis=0)
+    pixel = max(span[0] / max(width_px, 1), span[1] / max(height_px, 1))
+    arc = float(np.hypot(np.diff(points[:, 0]), np.diff(points[:, 1])).sum())
+    limit = int(samples_per_pixel * (width_px + height_px))
+    buckets = limit if pixel <= 0 else max(1, min(int(np.ceil(arc / pixel)), limit))
+    return path_minmax(points, buckets)
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: monoton x eksenli seriyi `threshold`
+    noktaya indirger ve tutulacak indeksleri sıralı döndürür. İlk ve son nokta
+    korunur; aradaki her kovadan, önceki seçilen nokta ve sonraki kovanın
+    ortalamasıyla en büyük alanlı üçgeni oluşturan nokta seçilir.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    count = len(x)
+    if threshold >= count or threshold < 3:
+        return np.arange(count)
+
+    # Uçlar dışındaki noktalar threshold - 2 kovaya bölünür: [edges[k], edges[k + 1])
+    edges = np.linspace(1, count - 1, threshold - 1).astype(np.intp)
+    sizes = np.diff(edges)
+    sum_x = np.concatenate(([0.0], np.cumsum(x)))
+    sum_y = np.concatenate(([0.0], np.cumsum(y)))
+    # Kova ortalamaları; son kovanın "sonraki kovası" son noktadır
+    mean_x = np.append((sum_x[edges[1:]] - sum_x[edges[:-1]]) / sizes, x[-1])
+    mean_y = np.append((sum_y[edges[1:]] - sum_y[edges[:-1]]) / sizes, y[-1])
+
+    selected = np.empty(threshold, dtype=np.intp)
+    selected[0], selected[-1] = 0, count - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        ax, ay = x[previous], y[previous]
+        bx, by = mean_x[bucket + 1], mean_y[bucket + 1]
+        area = np.abs((ax - bx) * (y[start:end] - ay) - (ax - x[start:end]) * (by - ay))
+        previous = start + int(np.argmax(area))
+        selected[bucket + 1] = previous
+    return selected
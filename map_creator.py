@@ -1,33 +1,104 @@
-import matplotlib.pyplot as plt
+import io
+import time
+
+import numpy as np
+from matplotlib.figure import Figure
+
+from decimation import decimate_path
+from track_points import TrackPoints, parse_checkpoints
 
 class MapCreator:
     def __init__(self, track_data, checkpoints=None):
-        self.track_data = track_data
+        """
+        track_data: (N, 3+) dizi, nokta listesi ya da TrackPoints; ilk üç sütun kullanılır,
+        harita düzlemi 1. ve 2. sütunlardır. checkpoints: metinli kontrol noktası listesi ya da
+        parse_checkpoints çıktısı (TrackPoints verilirse dosyadakiler kullanılır).
+        """
+        if isinstance(track_data, TrackPoints):
+            if checkpoints is None:
+                checkpoints = track_data.checkpoints()
+            track_data = track_data.positions
+        points = np.asarray(track_data, dtype=float)
+        if points.size == 0:
+            points = points.reshape(0, 3)
+        if points.ndim != 2 or points.shape[1] < 3:
+            raise ValueError(f"Pist noktaları en az 3 sütunlu (N, 3) olmalı: {points.shape}")
+        self.points = points[:, :3]
+        self.track_data = self.points
         self.checkpoints = checkpoints
+        # Metin alanları bir kez, toplu olarak ayrıştırılır
+        if checkpoints is None or isinstance(checkpoints, dict):
+            self.checkpoint_arrays = checkpoints
+        else:
+            self.checkpoint_arrays = parse_checkpoints(checkpoints)
+        self.render_stats = {}
+
+    @classmethod
+    def from_file(cls, path: str) -> 'MapCreator':
+        """İkili pist noktası dosyasından (bellek eşlemeli) harita oluşturucu"""
+        return cls(TrackPoints(path))
+
+    def to_track(self, **kwargs):
+        """Nokta geometrisinden simülatöre verilebilecek segmentli Track çıkarır (bkz. extract_track)"""
+        from track_geometry import extract_track
+        return extract_track(self.points, **kwargs)
+
+    def plane_points(self) -> np.ndarray:
+        """Harita düzlemindeki (N, 2) koordinatlar"""
+        return self.points[:, 1:3]
+
+    def create_map(self, width=5544, height=8192, x_offset=11119.814453125, z_offset=10454.576171875, margin=0,
+                   scale_factor=3.30555129051209, drawing_size=10, figsize=(10, 6), dpi=100, decimate=True):
+        """
+        Pist haritasını çizer ve matplotlib Figure döndürür (pyplot kullanılmaz,
+        figür sızdırılmaz). decimate açıksa noktalar figürün piksel çözünürlüğüne
+        göre sadeleştirilir. Nokta sayıları ve süreler `render_stats`'ta tutulur.
+        """
+        started = time.perf_counter()
+        plane = self.plane_points()
+        if decimate:
+            plane = plane[decimate_path(plane, int(figsize[0] * dpi), int(figsize[1] * dpi))]
+        decimated = time.perf_counter()
 
-    def create_map(self, width=5544, height=8192, x_offset=11119.814453125, z_offset=10454.576171875, margin=0, scale_factor=3.30555129051209, drawing_size=10):
-        x_coords = [point[1] for point in self.track_data]
-        y_coords = [point[2] for point in self.track_data]
+        fig = Figure(figsize=figsize, dpi=dpi)
+        ax = fig.subplots()
+        ax.plot(plane[:, 0], plane[:, 1], 'b-')
+        ax.set_title('Shutoku Pist Haritası')
+        ax.set_xlabel('X Koordinatı')
+        ax.set_ylabel('Y Koordinatı')
+        ax.grid(True)
 
-        plt.figure(figsize=(10, 6))
-        plt.plot(x_coords, y_coords, 'b-')
-        plt.title('Shutoku Pist Haritası')
-        plt.xlabel('X Koordinatı')
-        plt.ylabel('Y Koordinatı')
-        plt.grid(True)
+        if self.checkpoint_arrays is not None:
+            labels = self.checkpoint_arrays['checkpoint_position'] + self.checkpoint_arrays['checkpoint_offset']
+            for i, (x, _, z) in enumerate(labels):
+                ax.text(x, z, f'Checkpoint {i}',
+                        rotation=45, color='red', fontsize=10,
+                        bbox=dict(facecolor='white', alpha=0.5))
 
-        if self.checkpoints:
-            for i, checkpoint in enumerate(self.checkpoints):
-                world_pos = list(map(float, checkpoint['WORLD_POSITION'].split(',')))
-                offset = list(map(float, checkpoint['OFFSET'].split(',')))
-                orientation = list(map(float, checkpoint['ORIENTATION'].split(',')))
-                plt.text(world_pos[0] + offset[0], world_pos[2] + offset[2], f'Checkpoint {i}',
-                         rotation=45, color='red', fontsize=10,
-                         bbox=dict(facecolor='white', alpha=0.5))
+        self.render_stats = {
+            'points': len(self.points),
+            'drawn_points': len(plane),
+            'decimate_seconds': decimated - started,
+            'figure_seconds': time.perf_counter() - decimated
+        }
+        return fig
 
-        plt.show()
+    def render(self, format='png', **kwargs) -> io.BytesIO:
+        """
+        Haritayı bellekteki bir PNG/SVG tamponuna çizer. Çizim (rasterleştirme)
+        süresi ve toplam süre de `render_stats`'a eklenir.
+        """
+        started = time.perf_counter()
+        fig = self.create_map(**kwargs)
+        drawn = time.perf_counter()
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=format, bbox_inches='tight')
+        buffer.seek(0)
+        self.render_stats['savefig_seconds'] = time.perf_counter() - drawn
+        self.render_stats['total_seconds'] = time.perf_counter() - started
+        return buffer
 
 # Örnek kullanım:
 # track_data = [...]  # Pist verileri
 # map_creator = MapCreator(track_data)
-# map_creator.create_map()
\ No newline at end of file
+# png = map_creator.render('png')
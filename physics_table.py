@@ -0,0 +1,129 @@
+from dataclasses import fields
+from typing import Dict, List
+
+import numpy as np
+
+from simulator import DerivedPhysics, PhysicsConstants
+
+# Liste alanları: sabit genişlikli sütunlarda tutulur, gerçek uzunluk ayrı sütundadır
+LIST_FIELDS = {'gear_ratios': 'gear_count', 'tire_grip_curve': 'grip_count'}
+SCALAR_FIELDS = tuple(field.name for field in fields(PhysicsConstants) if field.name not in LIST_FIELDS)
+
+def physics_dtype(gears: int = 6, grip_points: int = 7) -> np.dtype:
+    """Tek bir PhysicsConstants yapılandırmasının paketlenmiş kayıt tipi"""
+    return np.dtype([(name, np.float64) for name in SCALAR_FIELDS] + [
+        ('gear_ratios', np.float64, (gears,)),
+        ('tire_grip_curve', np.float64, (grip_points,)),
+        ('gear_count', np.uint8),
+        ('grip_count', np.uint8),
+    ])
+
+def _pad(values: List[float], width: int) -> List[float]:
+    # Kısa listeler son elemanla doldurulur: çekirdekler fazladan vitesi hiç
+    # seçmez (aynı orandaki önceki vites önce uyar), seçerse de sonuç aynıdır.
+    if len(values) > width:
+        raise ValueError(f"Liste alanı sütun genişliğinden uzun: {len(values)} > {width}")
+    return list(values) + [values[-1]] * (width - len(values))
+
+class PhysicsTable:
+    """
+    Çok sayıda PhysicsConstants yapılandırmasını tek bir NumPy yapılı dizisinde
+    (satır başına yalnızca ham float'lar) tutar.
+
+    Alanlar öznitelik olarak okunduğunda sütun dizisi döner (gear_ratios (N, G)),
+    böylece tablo vektörel fizik çekirdeklerine doğrudan PhysicsConstants yerine
+    verilebilir. Dilimleme ve maskeyle filtreleme yeni bir tablo döndürür; nesne
+    oluşturulmaz. PhysicsConstants'a dönüşüm kayıpsızdır.
+    """
+
+    def __init__(self, data: np.ndarray):
+        object.__setattr__(self, 'data', data)
+        object.__setattr__(self, '_derived', None)
+
+    @classmethod
+    def empty(cls, size: int, gears: int = 6, grip_points: int = 7) -> 'PhysicsTable':
+        """Varsayılan PhysicsConstants değerleriyle doldurulmuş tablo"""
+        return cls.from_constants([PhysicsConstants()], gears, grip_points).repeat(size)
+
+    @classmethod
+    def from_constants(cls, constants: List[PhysicsConstants], gears: int = None,
+                       grip_points: int = None) -> 'PhysicsTable':
+        """PhysicsConstants listesinden tablo; sütun genişlikleri verilmezse en uzun listeye göre"""
+        gears = gears or max(len(physics.gear_ratios) for physics in constants)
+        grip_points = grip_points or max(len(physics.tire_grip_curve) for physics in constants)
+        rows = [tuple(float(getattr(physics, name)) for name in SCALAR_FIELDS) + (
+            _pad(physics.gear_ratios, gears), _pad(physics.tire_grip_curve, grip_points),
+            len(physics.gear_ratios), len(physics.tire_grip_curve)) for physics in constants]
+        return cls(np.array(rows, dtype=physics_dtype(gears, grip_points)))
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getattr__(self, name):
+        data = object.__getattribute__(self, 'data')
+        if name in data.dtype.names:
+            return data[name]
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        # Sütun ataması: tüm satırlara yayınlanır ve türetilmiş değerler geçersiz olur
+        if name in self.data.dtype.names:
+            if name in LIST_FIELDS:
+                value = np.asarray(value, dtype=float)
+                self.data[LIST_FIELDS[name]] = value.shape[-1]
+                value = np.concatenate([value, np.repeat(value[..., -1:], self.data[name].shape[-1] - value.shape[-1],
+                                                         axis=-1)], axis=-1)
+            self.data[name] = value
+            object.__setattr__(self, '_derived', None)
+        else:
+            object.__setattr__(self, name, value)
+
+    def __getitem__(self, index) -> 'PhysicsTable':
+        """Dilim, tamsayı dizisi ya da boolean maske ile alt tablo (tamsayı için 1 satırlık)"""
+        if isinstance(index, (int, np.integer)):
+            index = slice(index, index + 1 if index != -1 else None)
+        return PhysicsTable(self.data[index])
+
+    @property
+    def derived(self) -> DerivedPhysics:
+        """Tüm satırlar için türetilmiş değerler (önbellekli)"""
+        if self._derived is None:
+            object.__setattr__(self, '_derived', DerivedPhysics.from_physics(self))
+        return self._derived
+
+    def invalidate(self):
+        """data dizisi doğrudan değiştirildiğinde türetilmiş değerleri geçersiz kılar"""
+        object.__setattr__(self, '_derived', None)
+
+    def filter(self, mask) -> 'PhysicsTable':
+        return self[np.asarray(mask, dtype=bool)]
+
+    def repeat(self, count: int) -> 'PhysicsTable':
+        return PhysicsTable(np.repeat(self.data, count))
+
+    def to_constants(self, index: int) -> PhysicsConstants:
+        """Tek bir satırı PhysicsConstants'a çevirir"""
+        row = self.data[index]
+        values = {name: row[name].item() for name in SCALAR_FIELDS}
+        for name, count in LIST_FIELDS.items():
+            values[name] = row[name][:row[count]].tolist()
+        return PhysicsConstants(**values)
+
+    def to_list(self) -> List[PhysicsConstants]:
+        return [self.to_constants(i) for i in range(len(self))]
+
+    def memory(self) -> Dict[str, float]:
+        """
+        Bellek raporu: toplam bayt, yapılandırma başına bayt ve aynı bilgiyi
+        yalnızca float64 olarak tutmanın (ham) maliyetine oranı.
+        """
+        raw = (len(SCALAR_FIELDS) + self.data['gear_ratios'].shape[-1] +
+               self.data['tire_grip_curve'].shape[-1]) * 8
+        per_config = self.data.dtype.itemsize
+        return {
+            'configs': len(self),
+            'bytes': int(self.data.nbytes),
+            'bytes_per_config': per_config,
+            'raw_float_bytes_per_config': raw,
+            'overhead_ratio': per_config / raw
+        }
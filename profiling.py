@@ -0,0 +1,91 @@
+import json
+import time
+from array import array
+from collections import defaultdict
+from typing import Dict
+
+import numpy as np
+
+# Profil açıkken süresi ölçülen Simulator metotları
+PROFILED_METHODS = (
+    'calculate_aero_forces', 'calculate_engine_torque', 'calculate_engine_power',
+    'calculate_acceleration', 'calculate_tire_grip', 'calculate_corner_speed',
+    'calculate_corner_speeds', 'calculate_lap_time', 'solve_lap', 'lap_consumption', 'run',
+)
+
+class Profiler:
+    """
+    Simulator için isteğe bağlı ölçüm katmanı.
+
+    attach() yalnızca profil açıkken simülatör nesnesinin metotlarını süre ölçen
+    sarmalayıcılarla gölgeler (sınıf değişmez); detach() sarmalayıcıları kaldırır.
+    Profil kapalıyken ek maliyet yoktur. Süreler iç içe çağrıları da kapsar
+    (ör. run → solve_lap). Aynı Profiler birden çok simülatörde toplanabilir.
+    """
+
+    def __init__(self):
+        self.samples: Dict[str, array] = defaultdict(lambda: array('d'))
+        self.counters: Dict[str, int] = defaultdict(int)
+        self.started = time.perf_counter()
+
+    def _wrap(self, name: str, method):
+        samples = self.samples[name]
+        clock = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                samples.append(clock() - start)
+        timed.__wrapped__ = method
+        return timed
+
+    def attach(self, simulator):
+        for name in PROFILED_METHODS:
+            if name not in simulator.__dict__:
+                setattr(simulator, name, self._wrap(name, getattr(simulator, name)))
+
+    def detach(self, simulator):
+        for name in PROFILED_METHODS:
+            simulator.__dict__.pop(name, None)
+
+    def timed(self, name: str, function, *args, **kwargs):
+        """Metot olmayan çekirdek çağrılarının (ör. ivmelenme tablosu) süresini ölçer"""
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self.samples[name].append(time.perf_counter() - start)
+
+    def count(self, name: str, value: int = 1):
+        self.counters[name] += value
+
+    def to_dict(self) -> Dict:
+        """
+        Ölçüm başına çağrı sayısı, toplam/ortalama süre ve p50/p90/p99/max (saniye),
+        sayaçlar ve viraj çözümü başına ikiye bölme adımı.
+        """
+        timings = {}
+        for name, samples in self.samples.items():
+            if not samples:
+                continue
+            values = np.frombuffer(samples, dtype=float)
+            p50, p90, p99 = np.percentile(values, [50, 90, 99])
+            timings[name] = {
+                'calls': len(values),
+                'total': float(values.sum()),
+                'mean': float(values.mean()),
+                'p50': float(p50),
+                'p90': float(p90),
+                'p99': float(p99),
+                'max': float(values.max())
+            }
+        counters = dict(self.counters)
+        solves = counters.get('corner_solves', 0)
+        if solves:
+            counters['iterations_per_corner_solve'] = counters.get('corner_iterations', 0) / solves
+        return {'wall_time': time.perf_counter() - self.started, 'timings': timings, 'counters': counters}
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
@@ -0,0 +1,264 @@
+from collections.abc import MutableMapping
+from typing import Dict, List
+
+import numpy as np
+
+# Bilinen anahtarlar ve sütun tipleri (DataProcessor ve F1 formatındaki pist/araç alanları)
+RECORD_SCHEMA = {
+    'track_length': np.float64,
+    'corner_count': np.int64,
+    'average_speed': np.float64,
+    'width': np.float64,
+    'pitboxes': np.int64,
+    'pist_uzunlugu': np.float64,
+    'viraj_sayisi': np.float64,
+    'duz_yol_yuzdesi': np.float64,
+    'ortalama_hiz': np.float64,
+    'viraj_performansi': np.float64,
+    'ivmelenme': np.float64,
+    'hava_direnci': np.float64,
+}
+
+class RecordStore:
+    """
+    Pist/araç kayıtları için tipli sütun deposu.
+
+    Şemadaki her anahtar kendi NumPy sütununda tutulur; hangi hücrenin dolu olduğu
+    ayrı bir maskede işaretlenir. Şemada olmayan ya da sütun tipine çevrilemeyen
+    değerler satır başına küçük bir sözlükte (extras) saklanır. Biçimlendirilmiş
+    çıktı satır başına önbelleklenir ve yalnızca değişen satırlar için yeniden
+    üretilir.
+    """
+
+    def __init__(self, schema: Dict[str, type] = None, capacity: int = 16):
+        self.schema = dict(RECORD_SCHEMA if schema is None else schema)
+        self.keys = list(self.schema)
+        self._index = {key: i for i, key in enumerate(self.keys)}
+        self._columns = {key: np.zeros(capacity, dtype=dtype) for key, dtype in self.schema.items()}
+        self._present = np.zeros((capacity, len(self.keys)), dtype=bool)
+        self._extras: List[Dict] = []
+        self._formatted: List[Dict[str, str]] = []
+        self._stale = np.zeros(capacity, dtype=bool)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return len(self._present)
+
+    def _reserve(self, size: int):
+        # Kapasite ikiye katlanarak büyütülür
+        if size <= self.capacity:
+            return
+        capacity = max(self.capacity, 1)
+        while capacity < size:
+            capacity *= 2
+        for key, column in self._columns.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[key] = grown
+        present = np.zeros((capacity, len(self.keys)), dtype=bool)
+        present[:self._size] = self._present[:self._size]
+        self._present = present
+        stale = np.zeros(capacity, dtype=bool)
+        stale[:self._size] = self._stale[:self._size]
+        self._stale = stale
+
+    def _check_row(self, row: int) -> int:
+        if not -self._size <= row < self._size:
+            raise IndexError(f"Geçersiz kayıt satırı: {row}")
+        return row % self._size
+
+    def append(self, record: Dict = None) -> int:
+        """Tek bir kaydı ekler ve satır indeksini döndürür"""
+        row = self._size
+        self._reserve(row + 1)
+        self._size += 1
+        self._extras.append({})
+        self._formatted.append(None)
+        self._stale[row] = True
+        for key, value in (record or {}).items():
+            self.set(row, key, value)
+        return row
+
+    def append_rows(self, columns: Dict[str, np.ndarray]) -> range:
+        """
+        Birçok kaydı sütunlar halinde tek seferde ekler ve eklenen satırları döndürür.
+        Tüm sütunlar aynı uzunlukta olmalıdır; kayan noktalı sütunlardaki NaN
+        değerleri boş hücre sayılır. Şemada olmayan sütunlar ve sütun tipine
+        kayıpsız çevrilemeyen değerler set() gibi satır başına saklanır.
+        """
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("Eklenen sütunlar aynı uzunlukta olmalıdır")
+        count = lengths.pop() if lengths else 0
+        start = self._size
+        self._reserve(start + count)
+
+        extras = [{} for _ in range(count)]
+        for key, values in columns.items():
+            if key not in self._index:
+                for extra, value in zip(extras, values):
+                    extra[key] = value
+                continue
+            values = np.asarray(values)
+            column = self._columns[key]
+            # set() ile aynı kural: sütuna yalnızca kayıpsız çevrilebilen değerler yazılır,
+            # diğerleri (ör. tam sayı sütununda 3.7) satırın ek sözlüğüne gider
+            if values.dtype.kind in 'iu':
+                present = np.ones(count, dtype=bool)
+                fits = present
+                if column.dtype.kind in 'iu':
+                    limits = np.iinfo(column.dtype)
+                    fits = (values >= limits.min) & (values <= limits.max)
+            elif values.dtype.kind == 'f':
+                present = ~np.isnan(values)
+                fits = present
+                if column.dtype.kind in 'iu':
+                    # Üst sınır max + 1 ile karşılaştırılır: 2**63 float'ta tam temsil edilir
+                    limits = np.iinfo(column.dtype)
+                    fits = present & np.isfinite(values) & (values == np.floor(values)) & \
+                        (values >= limits.min) & (values < limits.max + 1.0)
+            else:
+                present = np.ones(count, dtype=bool)
+                fits = np.array([self._fits(column.dtype, value) for value in values], dtype=bool)
+            column[start:start + count][fits] = values[fits].astype(column.dtype)
+            self._present[start:start + count, self._index[key]] = fits
+            for i in np.flatnonzero(present & ~fits):
+                extras[i][key] = values[i].item() if isinstance(values[i], np.generic) else values[i]
+
+        self._size += count
+        self._extras.extend(extras)
+        self._formatted.extend([None] * count)
+        self._stale[start:start + count] = True
+        return range(start, start + count)
+
+    def get(self, row: int, key: str, default=None):
+        row = self._check_row(row)
+        i = self._index.get(key)
+        if i is not None and self._present[row, i]:
+            return self._columns[key][row].item()
+        return self._extras[row].get(key, default)
+
+    def set(self, row: int, key: str, value):
+        """Hücreyi yazar; değer sütun tipine çevrilemezse satırın ek sözlüğüne konur"""
+        row = self._check_row(row)
+        i = self._index.get(key)
+        if i is not None and self._fits(self._columns[key].dtype, value):
+            self._columns[key][row] = value
+            self._present[row, i] = True
+            self._extras[row].pop(key, None)
+        else:
+            if i is not None:
+                self._present[row, i] = False
+            self._extras[row][key] = value
+        self._stale[row] = True
+
+    @staticmethod
+    def _fits(dtype, value) -> bool:
+        # Tam sayı sütunlarına yalnızca kayıpsız çevrilebilen ve aralığa sığan değerler yazılır
+        if isinstance(value, bool) or not isinstance(value, (int, float, np.number)):
+            return False
+        if dtype.kind == 'f':
+            return True
+        if not float(value).is_integer():
+            return False
+        limits = np.iinfo(dtype)
+        return limits.min <= int(value) <= limits.max
+
+    def delete(self, row: int, key: str):
+        row = self._check_row(row)
+        i = self._index.get(key)
+        if i is not None and self._present[row, i]:
+            self._present[row, i] = False
+        elif key in self._extras[row]:
+            del self._extras[row][key]
+        else:
+            raise KeyError(key)
+        self._stale[row] = True
+
+    def row_keys(self, row: int) -> List[str]:
+        """Satırdaki dolu anahtarlar: önce şema sırasıyla sütunlar, sonra ek anahtarlar"""
+        row = self._check_row(row)
+        return [self.keys[i] for i in np.flatnonzero(self._present[row])] + list(self._extras[row])
+
+    def row(self, row: int) -> 'RecordView':
+        return RecordView(self, self._check_row(row))
+
+    def column(self, key: str) -> np.ndarray:
+        """Sütunun salt okunur görünümü (boş hücreler geçersizdir, bkz. present)"""
+        view = self._columns[key][:self._size].view()
+        view.setflags(write=False)
+        return view
+
+    def present(self, key: str) -> np.ndarray:
+        """Sütunda dolu hücrelerin maskesi"""
+        return self._present[:self._size, self._index[key]].copy()
+
+    def formatted_rows(self) -> List[Dict[str, str]]:
+        """
+        Tüm satırların biçimlendirilmiş çıktısını döndürür. Yalnızca değişmiş
+        satırlar, sütun başına toplu olarak yeniden biçimlendirilir.
+        """
+        stale = np.flatnonzero(self._stale[:self._size])
+        if len(stale):
+            rows = {row: {} for row in stale.tolist()}
+            for key, i in self._index.items():
+                filled = stale[self._present[stale, i]]
+                if not len(filled):
+                    continue
+                values = self._columns[key][filled]
+                if values.dtype.kind == 'f':
+                    text = np.char.mod('%.3f', values)
+                else:
+                    text = values.astype(str)
+                for row, value in zip(filled.tolist(), text.tolist()):
+                    rows[row][key] = value
+            for row, formatted in rows.items():
+                for key, value in self._extras[row].items():
+                    formatted[key] = f"{value:.3f}" if isinstance(value, float) else str(value)
+                self._formatted[row] = formatted
+            self._stale[stale] = False
+        return self._formatted[:self._size]
+
+    def formatted(self, row: int) -> Dict[str, str]:
+        """Tek satırın biçimlendirilmiş çıktısı (önbellekli)"""
+        row = self._check_row(row)
+        if self._stale[row]:
+            self.formatted_rows()
+        return dict(self._formatted[row])
+
+class RecordView(MutableMapping):
+    """RecordStore'daki tek bir satırın sözlük arayüzü"""
+
+    def __init__(self, store: RecordStore, row: int):
+        self.store = store
+        self.row = row
+
+    def __getitem__(self, key):
+        value = self.store.get(self.row, key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.store.set(self.row, key, value)
+
+    def __delitem__(self, key):
+        self.store.delete(self.row, key)
+
+    def __iter__(self):
+        return iter(self.store.row_keys(self.row))
+
+    def __len__(self):
+        return len(self.store.row_keys(self.row))
+
+    def __repr__(self):
+        return f"RecordView({dict(self)!r})"
+
+    def formatted(self) -> Dict[str, str]:
+        return self.store.formatted(self.row)
+
+_MISSING = object()
@@ -0,0 +1,222 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict
+from typing import Dict
+
+import numpy as np
+
+from simulator import MODEL_VERSION
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MB
+PAYLOAD_FORMAT = 'json'  # Kayıt biçimi değişince eski kayıtlar açılışta temizlenir
+
+def json_default(value):
+    """Sonuç sözlüklerindeki NumPy sayılarını/dizilerini JSON'a çevirir"""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f"JSON'a çevrilemeyen değer: {type(value).__name__}")
+
+def _canonical(value):
+    """JSON'a çevrilemeyen değerleri (NumPy dizileri/sayıları) kararlı biçime getirir"""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Önbellek anahtarına çevrilemeyen değer: {type(value).__name__}")
+
+def simulation_key(simulator, model_version=MODEL_VERSION) -> str:
+    """
+    Simülasyon girdilerinin kararlı özetini (SHA-256) döndürür.
+    track_data, car_data, tüm PhysicsConstants alanları, pist segmentleri,
+    güç aktarma ve tutunma yüzeyi ayarları ve model sürümü anahtara dahildir.
+    """
+    track = simulator.track
+    payload = json.dumps({
+        'model_version': model_version,
+        'track_data': simulator.track_data,
+        'car_data': simulator.car_data,
+        'physics': asdict(simulator.physics),
+        'powertrain_resolution': simulator.powertrain_resolution,
+        'grip_resolution': simulator.grip_resolution,
+        'segments': [track.kind, track.length, track.radius, track.bank],
+    }, sort_keys=True, default=_canonical)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class ResultCache:
+    """
+    Simülasyon sonuçları için içerik adresli, SQLite tabanlı kalıcı önbellek.
+
+    Birden çok süreç ve iş parçacığı aynı dosyayı güvenle okuyup yazabilir (WAL
+    kipi, her süreç ve iş parçacığı kendi bağlantısını açar). Sonuçlar JSON
+    olarak saklanır; okumalar yazma kilidi almaz. Toplam boyut max_bytes'ı aşınca en uzun süredir
+    kullanılmayan kayıtlar silinir. Farklı model sürümüyle yazılmış kayıtlar
+    açılışta temizlenir.
+    """
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES, model_version=MODEL_VERSION):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.model_version = f'{model_version}/{PAYLOAD_FORMAT}'
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM results WHERE model_version != ?", (self.model_version,))
+            self._update_size(connection)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Bağlantı iş parçacığına özeldir; fork sonrası üst sürecin bağlantısı kullanılmaz
+        local = self._local
+        if getattr(local, 'connection', None) is None or local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS results (
+                    key TEXT PRIMARY KEY,
+                    model_version TEXT NOT NULL,
+                    payload BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access REAL NOT NULL
+                )""")
+            connection.execute("CREATE INDEX IF NOT EXISTS results_last_access ON results (last_access)")
+            connection.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            connection.execute("INSERT OR IGNORE INTO meta VALUES ('bytes', 0), ('hits', 0), ('misses', 0)")
+            local.connection = connection
+            local.pid = os.getpid()
+        return local.connection
+
+    @contextmanager
+    def _transaction(self):
+        connection = self._connect()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        else:
+            connection.execute("COMMIT")
+
+    def _update_size(self, connection):
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        connection.execute("UPDATE meta SET value = ? WHERE name = 'bytes'", (total,))
+
+    def get(self, key: str):
+        """
+        Anahtara karşılık gelen sonucu döndürür; yoksa None. Okuma kilitsizdir;
+        yalnızca isabette erişim zamanı ayrı, kısa bir yazmayla güncellenir.
+        Iskalar dosyadaki sayaca put() ile birlikte yazılır.
+        """
+        row = self._connect().execute("SELECT payload FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        with self._transaction() as connection:
+            connection.execute("UPDATE results SET last_access = ? WHERE key = ?", (time.time(), key))
+            connection.execute("UPDATE meta SET value = value + 1 WHERE name = 'hits'")
+        return json.loads(row[0])
+
+    def put(self, key: str, result, missed: bool = False):
+        """
+        Sonucu saklar ve gerekirse boyut sınırına kadar eski kayıtları siler.
+        missed=True ise dosyadaki ıska sayacı da artırılır (get_or_run).
+        """
+        payload = json.dumps(result, default=json_default)
+        with self._transaction() as connection:
+            if missed:
+                connection.execute("UPDATE meta SET value = value + 1 WHERE name = 'misses'")
+            inserted = connection.execute(
+                "INSERT OR IGNORE INTO results VALUES (?, ?, ?, ?, ?)",
+                (key, self.model_version, payload, len(payload.encode('utf-8')), time.time())
+            ).rowcount
+            if inserted:
+                connection.execute("UPDATE meta SET value = value + ? WHERE name = 'bytes'", (len(payload),))
+            total = connection.execute("SELECT value FROM meta WHERE name = 'bytes'").fetchone()[0]
+            if total > self.max_bytes:
+                evicted = []
+                for old_key, size in connection.execute("SELECT key, size FROM results ORDER BY last_access"):
+                    if total <= self.max_bytes:
+                        break
+                    evicted.append((old_key,))
+                    total -= size
+                connection.executemany("DELETE FROM results WHERE key = ?", evicted)
+                connection.execute("UPDATE meta SET value = ? WHERE name = 'bytes'", (max(total, 0),))
+
+    def get_or_run(self, simulator, compute):
+        """Simülatörün sonucunu önbellekten döndürür ya da compute() ile hesaplayıp saklar"""
+        key = simulation_key(simulator, self.model_version)
+        result = self.get(key)
+        if result is None:
+            result = compute()
+            self.put(key, result, missed=True)
+        return result
+
+    def clear(self):
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM results")
+            connection.execute("UPDATE meta SET value = 0")
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Önbellek istatistiklerini döndürür. hits/misses bu süreçteki, total_hits/
+        total_misses dosyayı kullanan tüm süreçlerdeki sayımlardır.
+        """
+        connection = self._connect()
+        meta = dict(connection.execute("SELECT name, value FROM meta").fetchall())
+        entries = connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        lookups = self.hits + self.misses
+        total_lookups = meta['hits'] + meta['misses']
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'total_hits': meta['hits'],
+            'total_misses': meta['misses'],
+            'total_hit_rate': meta['hits'] / total_lookups if total_lookups else 0.0,
+            'entries': entries,
+            'bytes': meta['bytes'],
+            'max_bytes': self.max_bytes
+        }
+
+    def __getstate__(self):
+        # Bağlantı süreçler arasında taşınmaz; her süreç yeniden açar
+        state = self.__dict__.copy()
+        del state['_local']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+_open_caches: Dict[str, ResultCache] = {}
+
+def open_cache(path: str) -> ResultCache:
+    """Yola ait ResultCache'i bu süreç içinde bir kez açar ve yeniden kullanır"""
+    cache = _open_caches.get(path)
+    if cache is None:
+        cache = ResultCache(path)
+        _open_caches[path] = cache
+    return cache
+
+def default_cache():
+    """
+    GPACE_RESULT_CACHE ortam değişkenindeki (varsayılan ~/.cache/gpace/results.sqlite)
+    paylaşılan önbelleği döndürür. Değişken boş ya da '0' ise önbellek kapalıdır (None).
+    """
+    path = os.environ.get('GPACE_RESULT_CACHE',
+                          os.path.join(os.path.expanduser('~'), '.cache', 'gpace', 'results.sqlite'))
+    if path in ('', '0'):
+        return None
+    return open_cache(path)
@@ -0,0 +1,273 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, replace
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from simulator import PhysicsConstants, Simulator, derived_physics
+
+ENGINE_EFFICIENCY = 0.3  # Yakıt enerjisinin tekerleğe ulaşan oranı
+FUEL_ENERGY_DENSITY = 34.2e6  # Benzinin hacimsel enerji yoğunluğu (J/L)
+
+# Aranan alanların varsayılan sınırları; gear_ratios sınırı her vites için geçerlidir
+SETUP_BOUNDS = {
+    'final_drive': (2.5, 4.5),
+    'downforce_coefficient': (0.5, 5.0),
+    'drag_coefficient': (0.2, 0.6),
+    'gear_ratios': (0.6, 4.0),
+}
+
+OBJECTIVES = ('tur_suresi', 'yakit_tuketimi', 'lastik_asinmasi')
+
+PARALLEL_MIN_CANDIDATES = 16  # Daha az adayı süreç havuzuna göndermek kazançtan pahalıdır
+
+def _parallel(workers: int, count: int) -> bool:
+    """count aday için süreç havuzu kullanılıp kullanılmayacağı; tek çekirdekte havuz yalnızca ek yüktür"""
+    if workers is not None:
+        return workers > 1
+    return count >= PARALLEL_MIN_CANDIDATES and (os.cpu_count() or 1) > 1
+
+def lap_loads(simulator: Simulator, trace) -> Tuple[float, float]:
+    """
+    Tur izinden ayara bağlı yakıt (L) ve lastik aşınmasını tahmin eder.
+    Yakıt: ivmelenme, aerodinamik sürükleme ve yuvarlanma direnci için motorun
+    yaptığı iş / (verim × enerji yoğunluğu). Aşınma: tire_wear_rate × kilometre
+    başına toplam (boyuna + yanal) g yükü. Hava ve pist çarpanları uygulanır.
+    """
+    physics = simulator.physics
+    derived = derived_physics(physics)
+    speed = trace.speed
+    step = trace.distance[1] - trace.distance[0] if len(speed) > 1 else simulator.track.total_length
+
+    # Kapalı tur: a = v dv/ds merkezi farkla
+    longitudinal = (np.roll(speed, -1) ** 2 - np.roll(speed, 1) ** 2) / (4 * step)
+    radius = simulator.track.radius[simulator.track.segment_at(trace.distance)]
+    lateral = speed ** 2 / radius
+
+    drag = 0.5 * derived.air_density * physics.drag_coefficient * physics.frontal_area * speed ** 2
+    tractive = np.maximum(derived.mass * longitudinal + drag + derived.rolling_force, 0.0)
+    fuel = tractive.sum() * step / (ENGINE_EFFICIENCY * FUEL_ENERGY_DENSITY)
+
+    g_load = np.hypot(longitudinal, lateral) / physics.gravity
+    wear = physics.tire_wear_rate * g_load.sum() * step / 1000
+    return float(fuel * simulator.weather_impact()), float(wear * simulator.track_condition())
+
+def _evaluate_chunk(track_data, car_data, physics, fields, vectors, ds):
+    """Bir parça aday ayarı tek süreçte değerlendirir; (n, 3) amaç dizisi döndürür"""
+    simulator = Simulator(track_data, car_data)
+    simulator.physics = replace(physics)
+    objectives = np.full((len(vectors), len(OBJECTIVES)), np.inf)
+    for i, vector in enumerate(vectors):
+        for name, value in _decode(fields, vector).items():
+            setattr(simulator.physics, name, value)
+        try:
+            trace = simulator.solve_lap(ds)
+        except ValueError:
+            continue  # Araç bu ayarla hızlanamıyor
+        fuel, wear = lap_loads(simulator, trace)
+        objectives[i] = trace.lap_time * simulator.weather_impact(), fuel, wear
+    return objectives
+
+def _decode(fields: List[str], vector) -> Dict:
+    setup = {}
+    for name, value in zip(fields, vector):
+        if name.startswith('gear_ratios'):
+            setup.setdefault('gear_ratios', []).append(float(value))
+        else:
+            setup[name] = float(value)
+    return setup
+
+def pareto_front(objectives: np.ndarray) -> np.ndarray:
+    """
+    Baskın olunmayan (Pareto) noktaların maskesini döndürür; tüm amaçlar küçültülür.
+    Bir nokta, başka bir nokta her amaçta ondan kötü değilse ve en az birinde
+    daha iyiyse baskılanmıştır.
+    """
+    objectives = np.asarray(objectives, dtype=float)
+    finite = np.isfinite(objectives).all(axis=1)
+    front = finite.copy()
+    candidates = objectives[finite]
+    for i in np.flatnonzero(finite):
+        point = objectives[i]
+        dominated = ((candidates <= point).all(axis=1) & (candidates < point).any(axis=1)).any()
+        front[i] = not dominated
+    return front
+
+@dataclass
+class OptimizationResult:
+    """Ayar optimizasyonu sonucu"""
+    evaluations: object  # Tüm değerlendirilen adaylar (pandas DataFrame)
+    pareto: object  # Tur süresi / yakıt / aşınma Pareto cephesi (pandas DataFrame)
+    best: Dict  # En kısa tur süreli uygun ayar (PhysicsConstants alanları)
+    stats: Dict[str, float]  # Değerlendirme sayıları, süre ve saniyedeki değerlendirme
+
+class SetupOptimizer:
+    """
+    gear_ratios, final_drive, downforce_coefficient ve drag_coefficient için
+    tur süresini küçülten ayar araması (çapraz entropi yöntemi).
+
+    Her nesilde aday topluluğu normal dağılımdan örneklenir, sınırlara kırpılır ve
+    vites oranları azalan sıraya dizilir. Kısıtlar: vites oranları kesin azalan
+    olmalı ve son viteste devir sınırındaki hız en az min_top_speed olmalıdır;
+    uymayan adaylar çözülmeden elenir. Adaylar toplu halde (workers > 1 ise ya da
+    workers verilmeyip topluluk yeterince büyükse tüm nesillerde ortak bir süreç
+    havuzunda) değerlendirilir; aynı aday tekrar çözülmez.
+    """
+
+    def __init__(self, track_data: Dict[str, float], car_data: Dict[str, float],
+                 physics: PhysicsConstants = None, bounds: Dict[str, Tuple[float, float]] = None,
+                 min_top_speed: float = 60.0, min_ratio_step: float = 0.05, ds: float = 2.0, seed: int = 0):
+        self.track_data = track_data
+        self.car_data = car_data
+        self.physics = replace(physics) if physics is not None else PhysicsConstants()
+        self.bounds = {**SETUP_BOUNDS, **(bounds or {})}
+        self.min_top_speed = min_top_speed
+        self.min_ratio_step = min_ratio_step
+        self.ds = ds
+        self.seed = seed
+
+        gears = len(self.physics.gear_ratios)
+        self.fields = ['final_drive', 'downforce_coefficient', 'drag_coefficient'] + \
+                      [f'gear_ratios[{i}]' for i in range(gears)]
+        self.lower = np.array([self.bounds[name.split('[')[0]][0] for name in self.fields])
+        self.upper = np.array([self.bounds[name.split('[')[0]][1] for name in self.fields])
+        self._gears = slice(3, 3 + gears)
+
+        self._memo: Dict[bytes, np.ndarray] = {}
+        self.evaluations = 0
+        self.solves = 0
+        self.rejected = 0
+        self.eval_seconds = 0.0
+
+    def encode(self, physics: PhysicsConstants = None) -> np.ndarray:
+        """PhysicsConstants ayarını arama vektörüne çevirir"""
+        physics = physics or self.physics
+        return np.array([physics.final_drive, physics.downforce_coefficient, physics.drag_coefficient] +
+                        list(physics.gear_ratios), dtype=float)
+
+    def decode(self, vector) -> Dict:
+        """Arama vektörünü PhysicsConstants alanlarına çevirir"""
+        return _decode(self.fields, vector)
+
+    def repair(self, vectors: np.ndarray) -> np.ndarray:
+        """Adayları sınırlara kırpar ve vites oranlarını azalan sıraya dizer"""
+        vectors = np.clip(np.atleast_2d(vectors), self.lower, self.upper)
+        vectors[:, self._gears] = -np.sort(-vectors[:, self._gears], axis=1)
+        return vectors
+
+    def feasible(self, vectors: np.ndarray) -> np.ndarray:
+        """Kısıtları sağlayan adayların maskesi"""
+        vectors = np.atleast_2d(vectors)
+        gears = vectors[:, self._gears]
+        monotonic = (np.diff(gears, axis=1) <= -self.min_ratio_step).all(axis=1)
+        rpm_per_speed = 60 / (2 * np.pi * self.physics.tire_radius) * gears[:, -1] * vectors[:, 0]
+        top_speed = self.physics.redline / rpm_per_speed
+        return monotonic & (top_speed >= self.min_top_speed)
+
+    def evaluate(self, vectors: np.ndarray, workers: int = None, chunk_size: int = 16,
+                 executor: ProcessPoolExecutor = None) -> np.ndarray:
+        """
+        Adayları toplu değerlendirir ve (n, 3) amaç dizisi (tur süresi, yakıt, aşınma)
+        döndürür. Kısıtı sağlamayan adaylar inf alır. Daha önce çözülmüş ya da
+        toplu içinde yinelenen adaylar yeniden çözülmez.
+
+        executor verilirse çözümler o havuzda yapılır (nesiller arasında yeniden
+        kullanım için). workers verilmemişse PARALLEL_MIN_CANDIDATES'tan az aday
+        ya da tek çekirdekli makinede tüm adaylar süreç içinde çözülür.
+        """
+        started = time.perf_counter()
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=float))
+        keys = [np.round(vector, 9).tobytes() for vector in vectors]
+        feasible = self.feasible(vectors)
+
+        pending = {}
+        for key, vector, ok in zip(keys, vectors, feasible):
+            if key in self._memo or key in pending:
+                continue
+            if not ok:
+                self._memo[key] = np.full(len(OBJECTIVES), np.inf)
+                self.rejected += 1
+            else:
+                pending[key] = vector
+
+        if pending:
+            batch = np.array(list(pending.values()))
+            chunks = [batch[start:start + chunk_size] for start in range(0, len(batch), chunk_size)]
+            args = (self.track_data, self.car_data, self.physics, self.fields)
+            if not _parallel(workers, len(pending)):
+                results = [_evaluate_chunk(*args, chunk, self.ds) for chunk in chunks]
+            elif executor is not None:
+                results = list(executor.map(_evaluate_chunk, *zip(*[args + (chunk, self.ds) for chunk in chunks])))
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(_evaluate_chunk, *zip(*[args + (chunk, self.ds) for chunk in chunks])))
+            for key, objectives in zip(pending, np.concatenate(results)):
+                self._memo[key] = objectives
+            self.solves += len(pending)
+
+        self.evaluations += len(vectors)
+        self.eval_seconds += time.perf_counter() - started
+        return np.array([self._memo[key] for key in keys])
+
+    def optimize(self, generations: int = 8, population: int = 48, elite: int = 8,
+                 workers: int = None, chunk_size: int = 16) -> OptimizationResult:
+        """
+        Çapraz entropi araması yapar. İlk nesil mevcut ayar çevresinde ve sınırlar
+        içinde düzgün dağılımla örneklenir; sonraki nesiller en iyi `elite`
+        adayın ortalaması ve standart sapmasıyla örneklenir.
+        """
+        rng = np.random.default_rng(self.seed)
+        initial = self.repair(self.encode())
+        candidates = np.vstack([initial, self.repair(rng.uniform(self.lower, self.upper,
+                                                                 (population - 1, len(self.fields))))])
+        history = []
+        # Süreç havuzu tüm nesiller için bir kez açılır; küçük aramalarda hiç açılmaz
+        parallel = _parallel(workers, population)
+        with ExitStack() as stack:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers)) if parallel else None
+            for _ in range(generations):
+                objectives = self.evaluate(candidates, workers, chunk_size, executor)
+                history.append((candidates, objectives))
+
+                everything = np.vstack([c for c, _ in history])
+                scores = np.concatenate([o[:, 0] for _, o in history])
+                order = np.argsort(scores, kind='stable')[:elite]
+                elites = everything[order[np.isfinite(scores[order])]]
+                if not len(elites):
+                    elites = everything[order]
+                mean = elites.mean(axis=0)
+                std = np.maximum(elites.std(axis=0), 1e-3 * (self.upper - self.lower))
+                candidates = self.repair(rng.normal(mean, std, (population, len(self.fields))))
+
+        return self._result(np.vstack([c for c, _ in history]), np.vstack([o for _, o in history]))
+
+    def _result(self, vectors: np.ndarray, objectives: np.ndarray) -> OptimizationResult:
+        import pandas as pd
+
+        # Yinelenen adaylar tabloda bir kez yer alır
+        _, unique = np.unique(np.round(vectors, 9), axis=0, return_index=True)
+        unique = np.sort(unique)
+        vectors, objectives = vectors[unique], objectives[unique]
+        table = pd.DataFrame(vectors, columns=self.fields)
+        for i, name in enumerate(OBJECTIVES):
+            table[name] = objectives[:, i]
+        table['uygun'] = np.isfinite(objectives).all(axis=1)
+
+        front = pareto_front(objectives)
+        pareto = table[front].sort_values('tur_suresi').reset_index(drop=True)
+        best = self.decode(vectors[int(np.argmin(objectives[:, 0]))]) if table['uygun'].any() else {}
+        return OptimizationResult(evaluations=table, pareto=pareto, best=best, stats=self.stats())
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            'evaluations': self.evaluations,
+            'solves': self.solves,
+            'rejected': self.rejected,
+            'memo_hits': self.evaluations - self.solves - self.rejected,
+            'seconds': self.eval_seconds,
+            'evals_per_s': self.evaluations / self.eval_seconds if self.eval_seconds > 0 else 0.0,
+            'solves_per_s': self.solves / self.eval_seconds if self.eval_seconds > 0 else 0.0
+        }
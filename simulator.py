@@ -1,7 +1,11 @@
 import numpy as np
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Dict, List
 
+from track import Track
+
 @dataclass
 class PhysicsConstants:
     gravity: float = 9.81  # m/s²
@@ -10,6 +14,9 @@ class PhysicsConstants:
     rolling_resistance: float = 0.011  # Yuvarlanma direnci
     fuel_consumption_rate: float = 0.03  # L/km
     tire_wear_rate: float = 0.001  # Lastik aşınma oranı
+    vehicle_mass: float = 1500.0  # Yakıtsız araç kütlesi (kg)
+    fuel_mass: float = 0.0  # Depodaki yakıt kütlesi (kg)
+    tire_wear: float = 0.0  # Birikmiş lastik aşınması (0-1)
     
     # Motor karakteristikleri
     max_power: float = 735.0  # Motor maksimum gücü (kW)
@@ -48,54 +55,623 @@ class PhysicsConstants:
             # Lastik tutunma eğrisi (sıcaklığa bağlı)
             self.tire_grip_curve = [0.85, 0.90, 0.95, 1.0, 0.98, 0.94, 0.88]
 
+    def __setattr__(self, name, value):
+        # Herhangi bir alan değiştiğinde türetilmiş değerler geçersiz olur
+        object.__setattr__(self, name, value)
+        if name != '_derived':
+            object.__setattr__(self, '_derived', None)
+
+    @property
+    def derived(self) -> 'DerivedPhysics':
+        """Yalnızca koşullara bağlı türetilmiş değerleri (önbellekli) döndürür"""
+        derived = self.__dict__.get('_derived')
+        if derived is None:
+            derived = DerivedPhysics.from_physics(self)
+            object.__setattr__(self, '_derived', derived)
+        return derived
+
+    def invalidate(self):
+        """
+        Türetilmiş değerleri elle geçersiz kılar.
+        Alan atamaları bunu otomatik yapar; yalnızca gear_ratios gibi liste
+        alanları yerinde değiştirildiğinde çağrılması gerekir.
+        """
+        object.__setattr__(self, '_derived', None)
+
+TIRE_WEAR_GRIP_LOSS = 0.3  # Tamamen aşınmış lastikte tutunma kaybı oranı
+
+@dataclass
+class DerivedPhysics:
+    """PhysicsConstants alanlarından bir kez hesaplanan, hıza bağlı olmayan değerler"""
+    air_density: float  # Sıcaklık ve nem düzeltmeli hava yoğunluğu (kg/m³)
+    wind_x: float  # Rüzgarın araç eksenindeki bileşeni (m/s)
+    wind_y: float  # Rüzgarın yanal bileşeni (m/s)
+    temp_grip: float  # Lastik sıcaklığı tutunma çarpanı
+    tire_temp: float  # Pist sıcaklığından tahmin edilen lastik sıcaklığı (°C)
+    pressure_factor: float  # Lastik basıncı tutunma çarpanı
+    track_grip: float  # Islaklık ve yağmur tutunma çarpanı
+    base_grip: float  # Sürtünme × sıcaklık × basınç çarpanı
+    rolling_force: float  # Yuvarlanma direnci kuvveti (N)
+    mass: float  # Yakıt dahil toplam kütle (kg)
+    reference_load: float  # Yakıtsız araç ağırlığı (N), optimal yük referansı
+    wear_grip: float  # Lastik aşınması tutunma çarpanı
+    overall_ratios: np.ndarray  # gear_ratios × final_drive, (..., G)
+    rpm_per_speed: np.ndarray  # 1 m/s hızda her vitesin motor devri, (..., G)
+    corner_key: int = None  # Viraj önbelleği anahtarı (ilk kullanımda hesaplanır)
+
+    @classmethod
+    def from_physics(cls, physics) -> 'DerivedPhysics':
+        # Hava yoğunluğu düzeltmesi (sıcaklık ve nem etkisi)
+        temp_factor = (273.15 + 15) / (273.15 + np.asarray(physics.air_temperature))  # 15°C referans
+        humidity_factor = 1 + (np.asarray(physics.humidity) - 0.5) * 0.1
+
+        # Rüzgar bileşenleri
+        wind_angle = np.radians(physics.wind_direction)
+
+        # Lastik sıcaklığı ve basıncı etkisi
+        tire_temp = np.minimum(np.asarray(physics.track_temperature) * 1.2, 120)
+        temp_grip = 1 - np.abs(tire_temp - physics.tire_temp_optimal) / 100
+        pressure_factor = 1 - np.abs(np.asarray(physics.tire_pressure) - 2.3) / 2
+
+        # Pist koşulları
+        wet_grip_reduction = np.asarray(physics.track_wetness) * 0.4
+        rain_effect = 1 - (np.asarray(physics.rain_intensity) * 0.3)
+
+        # Kütle ve lastik aşınması
+        mass = np.asarray(physics.vehicle_mass) + physics.fuel_mass
+        wear_grip = 1 - TIRE_WEAR_GRIP_LOSS * np.clip(physics.tire_wear, 0, 1)
+
+        # Aktarma oranları
+        overall_ratios = np.asarray(physics.gear_ratios, dtype=float) * \
+                         np.asarray(physics.final_drive, dtype=float)[..., None]
+        wheel_rpm_per_speed = 60 / (2 * np.pi * np.asarray(physics.tire_radius, dtype=float))
+
+        return cls(
+            air_density=physics.air_density * temp_factor * humidity_factor,
+            wind_x=physics.wind_speed * np.cos(wind_angle),
+            wind_y=physics.wind_speed * np.sin(wind_angle),
+            temp_grip=temp_grip,
+            tire_temp=tire_temp,
+            pressure_factor=pressure_factor,
+            track_grip=0.95 * (1 - wet_grip_reduction) * rain_effect,
+            base_grip=physics.friction_coefficient * temp_grip * pressure_factor * wear_grip,
+            rolling_force=physics.rolling_resistance * mass * physics.gravity,
+            mass=mass,
+            reference_load=physics.vehicle_mass * 9.81,
+            wear_grip=wear_grip,
+            overall_ratios=overall_ratios,
+            rpm_per_speed=np.asarray(wheel_rpm_per_speed)[..., None] * overall_ratios
+        )
+
+def derived_physics(physics) -> DerivedPhysics:
+    """PhysicsConstants için önbellekteki, diğer nesneler için yeni türetilmiş değerler"""
+    derived = getattr(physics, 'derived', None)
+    if derived is None:
+        derived = DerivedPhysics.from_physics(physics)
+    return derived
+
+def _as_output(value):
+    """0 boyutlu sonuçları Python float'a çevirir, dizileri olduğu gibi bırakır."""
+    return float(value) if np.ndim(value) == 0 else value
+
+# Vektörel fizik çekirdekleri
+#
+# Aşağıdaki fonksiyonlar `physics` olarak PhysicsConstants benzeri herhangi bir
+# nesne alır. Alanlar skaler ya da NumPy dizisi olabilir (örn. araç başına
+# drag_coefficient dizisi); tüm girdiler NumPy yayınlama (broadcasting)
+# kurallarıyla birleştirilir. gear_ratios son eksende vitesleri tutar: (G,) ya da
+# (..., G) şeklinde verilebilir.
+
+def aero_forces(physics, velocity):
+    """Aerodinamik kuvvetleri (sürükleme, downforce) dizi olarak hesaplar"""
+    velocity = np.asarray(velocity, dtype=float)
+    derived = derived_physics(physics)
+
+    # Rüzgar etkisi
+    relative_wind_x = velocity + derived.wind_x
+    relative_wind_y = derived.wind_y
+    relative_wind = np.sqrt(relative_wind_x**2 + relative_wind_y**2)
+
+    # Yaw açısı etkisi
+    yaw_angle = np.arctan2(relative_wind_y, relative_wind_x)
+    yaw_factor = 1 + 0.2 * np.abs(np.sin(yaw_angle))  # Yan rüzgar etkisi
+
+    # Sürükleme kuvveti
+    drag_coefficient = physics.drag_coefficient * yaw_factor
+    drag_force = 0.5 * derived.air_density * drag_coefficient * physics.frontal_area * relative_wind**2
+
+    # Downforce hesaplama
+    ground_effect = 1 + 0.3 * np.exp(-velocity / 50)  # Düşük hızlarda yer etkisi
+    ride_height_factor = 1.0  # İdeal sürüş yüksekliği varsayımı
+    downforce = 0.5 * derived.air_density * physics.downforce_coefficient * \
+               physics.frontal_area * velocity**2 * ground_effect * ride_height_factor
+
+    return drag_force, downforce
+
+def engine_torque(physics, rpm):
+    """Motor tork eğrisini dizi olarak hesaplar (dallanmalar maskeye çevrilmiştir)"""
+    rpm = np.asarray(rpm, dtype=float)
+    torque_rpm = np.asarray(physics.torque_rpm, dtype=float)
+    redline = np.asarray(physics.redline, dtype=float)
+
+    # Tork eğrisi modellemesi (basitleştirilmiş)
+    x = rpm / torque_rpm
+    rising = (4 * x - 3 * x * x) / 1.0  # Düşük devirlerde artış
+    falling = 1.0 - 0.3 * ((rpm - torque_rpm) / (redline - torque_rpm))
+    torque_factor = np.where(rpm <= torque_rpm, rising, falling)
+
+    torque = physics.max_torque * np.maximum(0, torque_factor)
+    return np.where((rpm < 1000) | (rpm > redline), 0.0, torque)
+
+def gear_rpms(physics, velocity):
+    """Her vites için motor devrini (..., G) şeklinde döndürür"""
+    velocity = np.asarray(velocity, dtype=float)
+    return velocity[..., None] * derived_physics(physics).rpm_per_speed
+
+def select_gear(physics, rpm_by_gear):
+    """Devir sınırını aşmayan ilk vitesi seçer; hiçbiri uymazsa son vitesi döndürür"""
+    fits = rpm_by_gear <= np.asarray(physics.redline, dtype=float)[..., None]
+    # PhysicsTable'da vites sayısı satıra göre değişir (dolgu sütunları son vitesin kopyası)
+    last_gear = np.asarray(getattr(physics, 'gear_count', rpm_by_gear.shape[-1])) - 1
+    return np.where(fits.any(axis=-1), fits.argmax(axis=-1), last_gear)
+
+def drive_state(physics, velocity, gear=None):
+    """Seçilen vites, motor devri, motor torku ve tekerlek çekiş kuvvetini döndürür"""
+    velocity = np.asarray(velocity, dtype=float)
+    derived = derived_physics(physics)
+    rpm_by_gear = gear_rpms(physics, velocity)
+    if gear is None:
+        gear = select_gear(physics, rpm_by_gear)
+
+    # Seçilen vitesin devri ve toplam aktarma oranı
+    gear = np.broadcast_to(np.asarray(gear, dtype=np.intp), rpm_by_gear.shape[:-1])
+    engine_rpm = np.take_along_axis(rpm_by_gear, gear[..., None], axis=-1)[..., 0]
+    ratios = np.broadcast_to(derived.overall_ratios, rpm_by_gear.shape)
+    overall_ratio = np.take_along_axis(ratios, gear[..., None], axis=-1)[..., 0]
+
+    # Tork ve güç hesaplama
+    torque = engine_torque(physics, engine_rpm)
+    wheel_torque = torque * overall_ratio * 0.9  # %90 aktarma verimi
+    return gear, engine_rpm, torque, wheel_torque / physics.tire_radius
+
+def acceleration(physics, velocity, gear=None, powertrain=None):
+    """
+    Anlık ivmelenmeyi dizi olarak hesaplar; gear None ise vites otomatik seçilir.
+    powertrain (PowertrainMap) verilirse otomatik viteste çekiş kuvveti tablodan
+    doğrusal enterpolasyonla okunur.
+    """
+    velocity = np.asarray(velocity, dtype=float)
+    derived = derived_physics(physics)
+
+    # Kuvvetler
+    if powertrain is not None and gear is None:
+        drive_force = powertrain.drive_force_at(velocity)
+    else:
+        drive_force = drive_state(physics, velocity, gear)[3]
+    drag_force, _ = aero_forces(physics, velocity)
+
+    # Lastik tutuşu
+    tire_grip = np.maximum(0.7, derived.temp_grip * derived.wear_grip * (1 - physics.tire_wear_rate * velocity / 50))
+
+    # Net kuvvet hesaplama
+    net_force = np.minimum(drive_force * tire_grip, derived.mass * 9.81 * 1.5)  # Maksimum çekiş sınırı
+    net_force = net_force - (drag_force + derived.rolling_force)
+
+    return net_force / derived.mass  # Araç kütlesi
+
+def tire_grip(physics, load, slip_angle):
+    """Lastik tutunma katsayısını dizi olarak hesaplar"""
+    load = np.asarray(load, dtype=float)
+    slip_angle = np.asarray(slip_angle, dtype=float)
+    derived = derived_physics(physics)
+
+    # Yük ve kayma açısı etkisi
+    load_factor = 1 - (load / derived.reference_load - 0.25) ** 2  # Optimal yük dağılımı
+    slip_factor = np.sin(2 * np.arctan(slip_angle / 8))  # Magic Formula benzeri
+
+    return derived.base_grip * load_factor * slip_factor * derived.track_grip
+
+TIRE_GRIP_CURVE_STEP = 10.0  # tire_grip_curve noktaları arasındaki lastik sıcaklığı farkı (°C)
+
+def tire_curve_temperatures(physics) -> np.ndarray:
+    """tire_grip_curve noktalarının lastik sıcaklıkları; eğrinin tepesi tire_temp_optimal'a denk gelir"""
+    curve = np.asarray(physics.tire_grip_curve, dtype=float)
+    peak = int(np.argmax(curve))
+    return physics.tire_temp_optimal + (np.arange(len(curve)) - peak) * TIRE_GRIP_CURVE_STEP
+
+# Tutunma yüzeyini etkileyen PhysicsConstants alanları
+GRIP_SURFACE_FIELDS = (
+    'friction_coefficient', 'vehicle_mass', 'tire_wear', 'track_temperature', 'tire_temp_optimal',
+    'tire_pressure', 'tire_grip_curve', 'track_wetness', 'rain_intensity',
+)
+
+class GripSurface:
+    """
+    Mevcut lastik ve pist koşullarında (yük, kayma açısı) ızgarasında önceden
+    hesaplanmış tutunma katsayısı tablosu. Sorgular (dizi de olabilir) çift
+    doğrusal (bilinear) enterpolasyonla yanıtlanır; ızgara dışındaki noktalar
+    analitik modelle hesaplanır.
+
+    tire_grip_curve sıcaklık ekseni olarak kullanılır: tire_temperature
+    verilen sorgular, eğrinin o sıcaklıktaki değerinin mevcut lastik
+    sıcaklığındaki değerine oranıyla ölçeklenir.
+    """
+
+    def __init__(self, physics, load_points: int = 64, slip_points: int = 64,
+                 load_max: float = None, slip_max: float = np.pi / 2):
+        derived = derived_physics(physics)
+        self._physics = physics
+        self.load_max = 5 * float(derived.reference_load) if load_max is None else load_max
+        self.slip_max = slip_max
+        self.load = np.linspace(0.0, self.load_max, load_points)
+        self.slip_angle = np.linspace(0.0, slip_max, slip_points)
+        self.values = tire_grip(physics, self.load[:, None], self.slip_angle[None, :])
+
+        # Hücre başına çift doğrusal katsayılar: v = a + b·tx + (c + d·tx)·ty
+        values = self.values
+        a = values[:-1, :-1]
+        self._coefficients = tuple(np.ascontiguousarray(coefficient).ravel() for coefficient in (
+            a, values[1:, :-1] - a, values[:-1, 1:] - a, values[1:, 1:] - values[1:, :-1] - values[:-1, 1:] + a))
+
+        # Sıcaklık ekseni
+        self.temperatures = tire_curve_temperatures(physics)
+        self.curve = np.asarray(physics.tire_grip_curve, dtype=float)
+        self.tire_temperature = float(derived.tire_temp)
+        self._curve_reference = float(np.interp(self.tire_temperature, self.temperatures, self.curve))
+        self._max_error = None
+
+    def _interpolate(self, load, slip_angle):
+        # Hücre indeksi ve hücre içi konum; son hücrede kalmak için indeks sınırlanır
+        rows, columns = len(self.load) - 1, len(self.slip_angle) - 1
+        x = load * (rows / self.load_max)
+        y = slip_angle * (columns / self.slip_max)
+        i = np.clip(x.astype(np.intp), 0, rows - 1)
+        j = np.clip(y.astype(np.intp), 0, columns - 1)
+        tx, ty = x - i, y - j
+        cell = i * columns + j
+        a, b, c, d = self._coefficients
+        return a.take(cell) + b.take(cell) * tx + (c.take(cell) + d.take(cell) * tx) * ty
+
+    def temperature_factor(self, tire_temperature):
+        """tire_grip_curve'e göre verilen lastik sıcaklığının mevcut sıcaklığa göre tutunma oranı"""
+        return np.interp(tire_temperature, self.temperatures, self.curve) / self._curve_reference
+
+    def grip(self, load, slip_angle, tire_temperature=None):
+        """Tutunma katsayısını tablodan döndürür"""
+        load = np.asarray(load, dtype=float)
+        slip_angle = np.asarray(slip_angle, dtype=float)
+        outside = (load < 0) | (load > self.load_max) | (slip_angle < 0) | (slip_angle > self.slip_max)
+        result = self._interpolate(load, slip_angle)
+        if outside.any():
+            result = np.where(outside, tire_grip(self._physics, load, slip_angle), result)
+        if tire_temperature is not None:
+            result = result * self.temperature_factor(tire_temperature)
+        return result
+
+    def max_error(self, refinement: int = 8) -> Dict[str, float]:
+        """
+        Tablonun analitik modele göre en büyük enterpolasyon hatasını döndürür.
+        Her hücre her iki eksende `refinement` parçaya bölünerek karşılaştırılır.
+        """
+        if self._max_error is None:
+            steps = np.arange(refinement + 1) / refinement
+            load = (self.load[:-1, None] + np.diff(self.load)[:, None] * steps).ravel()
+            slip_angle = (self.slip_angle[:-1, None] + np.diff(self.slip_angle)[:, None] * steps).ravel()
+            exact = tire_grip(self._physics, load[:, None], slip_angle[None, :])
+            error = np.abs(self._interpolate(load[:, None], slip_angle[None, :]) - exact)
+            scale = np.abs(self.values).max()
+            self._max_error = {
+                'grip': float(error.max()),
+                'relative': float(error.max() / scale) if scale > 0 else 0.0,
+                'samples': self.values.size
+            }
+        return self._max_error
+
+_grip_surfaces = OrderedDict()
+
+def grip_surface(physics, points: int = 64, maxsize: int = 32) -> GripSurface:
+    """Tutunma yüzeyini ilk ihtiyaçta oluşturur; yalnızca lastik/pist alanları değişince yeniden kurar"""
+    key = (points,) + tuple(
+        tuple(np.ravel(getattr(physics, field)).tolist()) for field in GRIP_SURFACE_FIELDS
+    )
+    surface = _grip_surfaces.get(key)
+    if surface is None:
+        surface = GripSurface(physics, points, points)
+        _grip_surfaces[key] = surface
+        while len(_grip_surfaces) > maxsize:
+            _grip_surfaces.popitem(last=False)
+    else:
+        _grip_surfaces.move_to_end(key)
+    return surface
+
+MAX_SPEED = 100.0  # Maksimum hız (m/s)
+
+# Fizik modeli sonuçları değiştiğinde artırılır; eski önbellek kayıtları geçersiz olur
+MODEL_VERSION = 1
+
+@dataclass
+class LapTrace:
+    """Tur boyunca mesafeye bağlı hız, vites ve devir izi"""
+    distance: np.ndarray  # Örnek noktasının tur başından uzaklığı (m)
+    speed: np.ndarray  # Hız (m/s)
+    gear: np.ndarray  # Vites indeksi (0 tabanlı)
+    rpm: np.ndarray  # Motor devri (rpm)
+    time: np.ndarray  # Örnek noktasına kadar geçen süre (s)
+    lap_time: float  # Tur süresi (s)
+
+# Güç aktarma tablosunu etkileyen PhysicsConstants alanları
+POWERTRAIN_FIELDS = ('gear_ratios', 'final_drive', 'tire_radius', 'max_torque', 'torque_rpm', 'redline')
+
+class PowertrainMap:
+    """
+    Hıza göre örneklenmiş vites, motor devri, motor torku ve çekiş kuvveti tablosu.
+    Vites değişimi, 1000 rpm ve maksimum tork devri noktaları tabloya kırılma
+    noktası olarak eklenir; böylece doğrusal enterpolasyon süreksizliklerde
+    bulanıklaşmaz.
+    """
+
+    def __init__(self, physics, resolution: float = 0.25, v_max: float = MAX_SPEED):
+        self.resolution = resolution
+        self._physics = physics
+
+        # Kırılma noktaları: her viteste 1000 rpm, tork devri ve devir sınırı hızları
+        rpm_per_speed = np.asarray(derived_physics(physics).rpm_per_speed, dtype=float)
+        corners = np.array([1000.0, physics.torque_rpm, physics.redline])[:, None] / rpm_per_speed
+        corners = corners[(corners > 0) & (corners < v_max)]
+        grid = np.append(np.arange(0.0, v_max, resolution), v_max)
+        if corners.size:
+            grid = grid[np.abs(grid[:, None] - corners).min(axis=1) > 1e-3 * resolution]
+        velocity = np.concatenate((grid, corners * (1 - 1e-9), corners * (1 + 1e-9)))
+        self.velocity = np.unique(velocity)
+        self.gear, self.rpm, self.torque, self.drive_force = drive_state(physics, self.velocity)
+        self._max_error = None
+
+    def _index(self, velocity):
+        return np.clip(np.searchsorted(self.velocity, velocity, side='right') - 1, 0, len(self.velocity) - 1)
+
+    def gear_at(self, velocity):
+        """Hızdaki otomatik vitesi döndürür"""
+        return self.gear[self._index(velocity)]
+
+    def rpm_at(self, velocity):
+        return np.interp(velocity, self.velocity, self.rpm)
+
+    def torque_at(self, velocity):
+        return np.interp(velocity, self.velocity, self.torque)
+
+    def drive_force_at(self, velocity):
+        return np.interp(velocity, self.velocity, self.drive_force)
+
+    def max_error(self, refinement: int = 8) -> Dict[str, float]:
+        """
+        Tablonun analitik eğriye göre en büyük enterpolasyon hatasını döndürür.
+        Her tablo aralığı `refinement` parçaya bölünerek karşılaştırılır; kırılma
+        noktalarını saran çok dar aralıklar (süreksizliğin kendisi) dışarıda kalır.
+        """
+        if self._max_error is None:
+            steps = np.arange(1, refinement) / refinement
+            width = np.diff(self.velocity)
+            cells = width > 1e-3 * self.resolution
+            velocity = (self.velocity[:-1][cells, None] + width[cells, None] * steps).ravel()
+            _, rpm, torque, drive_force = drive_state(self._physics, velocity)
+            self._max_error = {
+                'rpm': float(np.abs(self.rpm_at(velocity) - rpm).max()),
+                'torque': float(np.abs(self.torque_at(velocity) - torque).max()),
+                'drive_force': float(np.abs(self.drive_force_at(velocity) - drive_force).max()),
+                'samples': len(self.velocity)
+            }
+        return self._max_error
+
+_powertrain_maps = OrderedDict()
+
+def powertrain_map(physics, resolution: float = 0.25, maxsize: int = 64) -> PowertrainMap:
+    """Güç aktarma tablosunu ilk ihtiyaçta oluşturur ve alanlarına göre önbellekler"""
+    key = (resolution,) + tuple(
+        tuple(np.ravel(getattr(physics, field)).tolist()) for field in POWERTRAIN_FIELDS
+    )
+    table = _powertrain_maps.get(key)
+    if table is None:
+        table = PowertrainMap(physics, resolution)
+        _powertrain_maps[key] = table
+        while len(_powertrain_maps) > maxsize:
+            _powertrain_maps.popitem(last=False)
+    else:
+        _powertrain_maps.move_to_end(key)
+    return table
+
+def acceleration_distance_table(physics, v_max: float = MAX_SPEED, samples: int = 2048, powertrain=None):
+    """
+    Tam gaz hızlanma için (v, D(v)) tablosunu döndürür.
+    D(v) = ∫ v / a(v) dv, ivmelenme sınırında 0'dan v hızına çıkmak için gereken
+    mesafedir. Birinci viteste 1000 rpm altındaki hızlarda debriyaj kaydırıldığı
+    varsayılır. Tablo araç ivmelenemediği hızda (son hız) kesilir.
+    """
+    launch_speed = 1000 / derived_physics(physics).rpm_per_speed[..., 0]
+    launch_speed *= 1 + 1e-9  # Yuvarlama hatasıyla 1000 rpm altına düşmemek için
+
+    v = np.linspace(0.0, v_max, samples)
+    a = acceleration(physics, np.maximum(v, launch_speed), powertrain=powertrain)
+    stalled = np.flatnonzero(a <= 0)
+    if stalled.size:
+        if stalled[0] == 0:
+            raise ValueError("Araç bu koşullarda hızlanamıyor")
+        v = np.linspace(0.0, v[stalled[0] - 1], samples)
+        a = acceleration(physics, np.maximum(v, launch_speed), powertrain=powertrain)
+
+    dv = v[1] - v[0]
+    ratio = v / a
+    d = np.concatenate(([0.0], np.cumsum(0.5 * (ratio[1:] + ratio[:-1]) * dv)))
+    return v, d
+
+CORNER_SPEED_TOLERANCE = 1e-3  # Viraj hızı çözüm toleransı (m/s)
+
+# Viraj hızını etkileyen PhysicsConstants alanları (önbellek anahtarı)
+CORNER_SPEED_FIELDS = (
+    'gravity', 'vehicle_mass', 'fuel_mass', 'tire_wear',
+    'air_density', 'air_temperature', 'humidity',
+    'downforce_coefficient', 'frontal_area', 'friction_coefficient',
+    'track_temperature', 'tire_temp_optimal', 'tire_pressure',
+    'track_wetness', 'rain_intensity',
+)
+
+def corner_physics_key(physics) -> int:
+    """Viraj hızını etkileyen fizik alanlarının özetini (hash) döndürür"""
+    derived = derived_physics(physics)
+    if derived.corner_key is None:
+        derived.corner_key = hash(tuple(float(getattr(physics, field)) for field in CORNER_SPEED_FIELDS))
+    return derived.corner_key
+
+def corner_margin(physics, v, radius, bank_angle, grip=None):
+    """
+    Verilen hızda yanal kuvvet kapasitesi ile merkezcil gereksinim farkı.
+    grip (GripSurface) verilirse tutunma katsayısı tablodan okunur.
+    """
+    # Temel fizik hesaplamaları
+    gravity_normal = physics.gravity * np.cos(np.radians(bank_angle))
+    gravity_lateral = physics.gravity * np.sin(np.radians(bank_angle))
+
+    # Normal kuvvet (ağırlık + downforce)
+    mass = derived_physics(physics).mass
+    _, downforce = aero_forces(physics, v)
+    normal_force = mass * gravity_normal + downforce
+
+    # Merkezcil kuvvet gereksinimi
+    centripetal_req = mass * v**2 / radius - mass * gravity_lateral
+
+    # Lastik tutunma hesabı
+    slip_angle = np.arctan(v**2 / (radius * gravity_normal))
+    if grip is None:
+        available_force = normal_force * tire_grip(physics, normal_force, slip_angle)
+    else:
+        available_force = normal_force * grip.grip(normal_force, slip_angle)
+
+    # Net yanal kuvvet kapasitesi
+    return available_force - centripetal_req
+
+def corner_speed_iterations(tol: float, v_max: float = MAX_SPEED) -> int:
+    """[0, v_max] aralığını tol genişliğine indirmek için gereken ikiye bölme adımı"""
+    return max(1, int(np.ceil(np.log2(v_max / tol))))
+
+def corner_speeds(physics, radius, bank_angle=0.0, tol: float = CORNER_SPEED_TOLERANCE, v_max: float = MAX_SPEED,
+                  grip=None):
+    """
+    Tüm virajlar için aynı anda ikiye bölme (bisection) yapar.
+    Aralık genişliği tol altına inene kadar daraltılır; kapasitenin pozitif
+    kaldığı alt sınır döndürülür.
+    """
+    radius = np.asarray(radius, dtype=float)
+    bank_angle = np.asarray(bank_angle, dtype=float)
+    shape = np.broadcast_shapes(radius.shape, bank_angle.shape)
+    iterations = corner_speed_iterations(tol, v_max)
+    v_min, v_max = np.zeros(shape), np.full(shape, float(v_max))
+    for _ in range(iterations):
+        v = (v_min + v_max) / 2
+        feasible = corner_margin(physics, v, radius, bank_angle, grip) > 0
+        v_min = np.where(feasible, v, v_min)
+        v_max = np.where(feasible, v_max, v)
+    return v_min
+
+class CornerSpeedCache:
+    """Viraj hızları için sınırlı boyutlu LRU önbellek"""
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        speed = self._entries.get(key)
+        if speed is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return speed
+
+    def put(self, key, speed: float):
+        self._entries[key] = speed
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Önbellek isabet/ıskalama istatistiklerini döndürür"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': len(self._entries),
+            'maxsize': self.maxsize
+        }
+
+# Tüm Simulator örnekleri arasında paylaşılan önbellek
+corner_speed_cache = CornerSpeedCache()
+
 class Simulator:
-    def __init__(self, track_data: Dict[str, float], car_data: Dict[str, float]):
+    def __init__(self, track_data: Dict[str, float], car_data: Dict[str, float], track: Track = None):
         self.track_data = track_data
         self.car_data = car_data
+        self.track = track if track is not None else Track.from_track_data(track_data)
         self.physics = PhysicsConstants()
+        self.corner_cache = corner_speed_cache
+        self.powertrain_resolution = None  # m/s; None ise tork eğrisi her çağrıda hesaplanır
+        self.grip_resolution = None  # Tutunma yüzeyi eksen başına nokta; None ise analitik model
+        self.result_cache = None  # ResultCache; verilirse run() sonuçları kalıcı önbellekten gelir
+        self.profiler = None  # Profiler; yalnızca profile() bağlamında ayarlanır
+
+    @contextmanager
+    def profile(self, profiler=None):
+        """
+        Bağlam süresince metot sürelerini ve viraj çözümü sayaçlarını toplar:
+            with simulator.profile() as profiler:
+                simulator.run()
+            profiler.to_dict()
+        Birden çok simülatörü toplamak için aynı Profiler verilebilir.
+        """
+        from profiling import Profiler
+        profiler = profiler if profiler is not None else Profiler()
+        previous = self.profiler
+        if previous is not None:
+            previous.detach(self)
+        self.profiler = profiler
+        profiler.attach(self)
+        try:
+            yield profiler
+        finally:
+            profiler.detach(self)
+            self.profiler = previous
+            if previous is not None:
+                previous.attach(self)
+
+    @property
+    def powertrain_map(self):
+        """Etkinse aracın güç aktarma tablosunu döndürür"""
+        if self.powertrain_resolution is None:
+            return None
+        return powertrain_map(self.physics, self.powertrain_resolution)
+
+    @property
+    def grip_surface(self):
+        """Etkinse mevcut koşulların tutunma yüzeyini döndürür"""
+        if self.grip_resolution is None:
+            return None
+        return grip_surface(self.physics, self.grip_resolution)
         
     def calculate_aero_forces(self, velocity: float) -> tuple[float, float]:
         """Aerodinamik kuvvetleri (sürükleme ve downforce) hesaplar"""
-        # Hava yoğunluğu düzeltmesi (sıcaklık ve nem etkisi)
-        temp_factor = (273.15 + 15) / (273.15 + self.physics.air_temperature)  # 15°C referans
-        humidity_factor = 1 + (self.physics.humidity - 0.5) * 0.1
-        adjusted_air_density = self.physics.air_density * temp_factor * humidity_factor
-        
-        # Rüzgar etkisi
-        wind_angle = np.radians(self.physics.wind_direction)
-        relative_wind_x = velocity + self.physics.wind_speed * np.cos(wind_angle)
-        relative_wind_y = self.physics.wind_speed * np.sin(wind_angle)
-        relative_wind = np.sqrt(relative_wind_x**2 + relative_wind_y**2)
-        
-        # Yaw açısı etkisi
-        yaw_angle = np.arctan2(relative_wind_y, relative_wind_x)
-        yaw_factor = 1 + 0.2 * abs(np.sin(yaw_angle))  # Yan rüzgar etkisi
-        
-        # Sürükleme kuvveti
-        drag_coefficient = self.physics.drag_coefficient * yaw_factor
-        drag_force = 0.5 * adjusted_air_density * drag_coefficient * self.physics.frontal_area * relative_wind**2
-        
-        # Downforce hesaplama
-        ground_effect = 1 + 0.3 * np.exp(-velocity / 50)  # Düşük hızlarda yer etkisi
-        ride_height_factor = 1.0  # İdeal sürüş yüksekliği varsayımı
-        downforce = 0.5 * adjusted_air_density * self.physics.downforce_coefficient * \
-                   self.physics.frontal_area * velocity**2 * ground_effect * ride_height_factor
-        
-        return drag_force, downforce
+        drag_force, downforce = aero_forces(self.physics, velocity)
+        return _as_output(drag_force), _as_output(downforce)
     
     def calculate_engine_torque(self, rpm: float) -> float:
         """Motor tork eğrisini hesaplar"""
-        if rpm < 1000 or rpm > self.physics.redline:
-            return 0.0
-        
-        # Tork eğrisi modellemesi (basitleştirilmiş)
-        x = rpm / self.physics.torque_rpm
-        if rpm <= self.physics.torque_rpm:
-            torque_factor = (4 * x - 3 * x * x) / 1.0  # Düşük devirlerde artış
-        else:
-            torque_factor = 1.0 - 0.3 * ((rpm - self.physics.torque_rpm) / (self.physics.redline - self.physics.torque_rpm))
-        
-        return self.physics.max_torque * max(0, torque_factor)
+        return _as_output(engine_torque(self.physics, rpm))
     
     def calculate_engine_power(self, rpm: float) -> float:
         """Motor gücünü hesaplar"""
@@ -104,188 +680,212 @@ class Simulator:
     
     def calculate_acceleration(self, velocity: float, gear: int = None) -> float:
         """Anlık ivmelenmeyi hesaplar"""
-        if gear is None:
-            # Otomatik vites seçimi
-            wheel_rpm = velocity * 60 / (2 * np.pi * self.physics.tire_radius)
-            for i, ratio in enumerate(self.physics.gear_ratios):
-                engine_rpm = wheel_rpm * ratio * self.physics.final_drive
-                if engine_rpm <= self.physics.redline:
-                    gear = i
-                    break
-            if gear is None:
-                gear = len(self.physics.gear_ratios) - 1
-        
-        # Motor devri hesaplama
-        wheel_rpm = velocity * 60 / (2 * np.pi * self.physics.tire_radius)
-        engine_rpm = wheel_rpm * self.physics.gear_ratios[gear] * self.physics.final_drive
-        
-        # Tork ve güç hesaplama
-        engine_torque = self.calculate_engine_torque(engine_rpm)
-        wheel_torque = engine_torque * self.physics.gear_ratios[gear] * self.physics.final_drive * 0.9  # %90 aktarma verimi
-        
-        # Kuvvetler
-        drive_force = wheel_torque / self.physics.tire_radius
-        drag_force, downforce = self.calculate_aero_forces(velocity)
-        rolling_resistance = self.physics.rolling_resistance * 1500 * self.physics.gravity
-        
-        # Lastik tutuşu
-        tire_temp = min(self.physics.track_temperature * 1.2, 120)
-        temp_grip = 1 - abs(tire_temp - self.physics.tire_temp_optimal) / 100
-        tire_grip = max(0.7, temp_grip * (1 - self.physics.tire_wear_rate * velocity / 50))
-        
-        # Net kuvvet hesaplama
-        net_force = min(drive_force * tire_grip, 1500 * 9.81 * 1.5)  # Maksimum çekiş sınırı
-        net_force -= (drag_force + rolling_resistance)
-        
-        return net_force / 1500  # Araç kütlesi
+        return _as_output(acceleration(self.physics, velocity, gear, self.powertrain_map))
 
     def calculate_tire_grip(self, load: float, slip_angle: float) -> float:
         """Lastik tutunma katsayısını hesaplar"""
-        # Lastik sıcaklığı etkisi
-        tire_temp = min(self.physics.track_temperature * 1.2, 120)
-        temp_factor = 1 - abs(tire_temp - self.physics.tire_temp_optimal) / 100
-        
-        # Lastik basıncı etkisi
-        pressure_factor = 1 - abs(self.physics.tire_pressure - 2.3) / 2
-        
-        # Yük ve kayma açısı etkisi
-        load_factor = 1 - (load / (1500 * 9.81) - 0.25) ** 2  # Optimal yük dağılımı
-        slip_factor = np.sin(2 * np.arctan(slip_angle / 8))  # Magic Formula benzeri
-        
-        # Pist koşulları
-        wet_grip_reduction = self.physics.track_wetness * 0.4
-        rain_effect = 1 - (self.physics.rain_intensity * 0.3)
-        track_grip = 0.95 * (1 - wet_grip_reduction) * rain_effect
-        
-        base_grip = self.physics.friction_coefficient * temp_factor * pressure_factor
-        return base_grip * load_factor * slip_factor * track_grip
+        surface = self.grip_surface
+        if surface is not None:
+            return _as_output(surface.grip(load, slip_angle))
+        return _as_output(tire_grip(self.physics, load, slip_angle))
     
-    def calculate_corner_speed(self, radius: float, bank_angle: float = 0) -> float:
+    def calculate_corner_speed(self, radius: float, bank_angle: float = 0, tol: float = None) -> float:
         """Viraj hızını hesaplar"""
-        # Temel fizik hesaplamaları
-        gravity_normal = self.physics.gravity * np.cos(np.radians(bank_angle))
-        gravity_lateral = self.physics.gravity * np.sin(np.radians(bank_angle))
-        
-        def solve_corner_speed(v):
-            # Aerodinamik kuvvetler
-            drag_force, downforce = self.calculate_aero_forces(v)
-            
-            # Normal kuvvet (ağırlık + downforce)
-            normal_force = 1500 * gravity_normal + downforce
-            
-            # Merkezcil kuvvet gereksinimi
-            centripetal_req = 1500 * v**2 / radius - 1500 * gravity_lateral
-            
-            # Lastik tutunma hesabı
-            slip_angle = np.arctan(v**2 / (radius * gravity_normal))
-            grip = self.calculate_tire_grip(normal_force, slip_angle)
-            available_force = normal_force * grip
-            
-            # Net yanal kuvvet kapasitesi
-            return available_force - centripetal_req
-        
-        # İkili arama ile maksimum viraj hızını bul
-        v_min, v_max = 0, 100
-        for _ in range(10):
-            v = (v_min + v_max) / 2
-            if solve_corner_speed(v) > 0:
-                v_min = v
+        return float(self.calculate_corner_speeds([radius], [bank_angle], tol)[0])
+
+    def calculate_corner_speeds(self, radii, bank_angles, tol: float = None) -> np.ndarray:
+        """
+        Birden çok virajın hızını tek seferde hesaplar.
+        Sonuçlar paylaşılan önbellekte (radius, bank_angle, tol, fizik alanları,
+        tutunma yüzeyi ayarı) anahtarıyla saklanır; yalnızca önbellekte olmayan virajlar çözülür.
+        """
+        tol = CORNER_SPEED_TOLERANCE if tol is None else tol
+        radii = np.asarray(radii, dtype=float).ravel()
+        bank_angles = np.broadcast_to(np.asarray(bank_angles, dtype=float), radii.shape)
+        physics_key = corner_physics_key(self.physics)
+
+        speeds = np.empty(radii.shape)
+        grip_resolution = self.grip_resolution
+        keys = [(radius, bank_angle, tol, physics_key, grip_resolution) for radius, bank_angle in zip(radii.tolist(), bank_angles.tolist())]
+        missing = []
+        for i, key in enumerate(keys):
+            cached = self.corner_cache.get(key)
+            if cached is None:
+                missing.append(i)
             else:
-                v_max = v
-        
-        return v_min
+                speeds[i] = cached
+
+        if missing:
+            solved = corner_speeds(self.physics, radii[missing], bank_angles[missing], tol, grip=self.grip_surface)
+            speeds[missing] = solved
+            for i, speed in zip(missing, solved.tolist()):
+                self.corner_cache.put(keys[i], speed)
+        if self.profiler is not None:
+            self.profiler.count('corner_lookups', len(keys))
+            self.profiler.count('corner_cache_hits', len(keys) - len(missing))
+            self.profiler.count('corner_solves', len(missing))
+            self.profiler.count('corner_iterations', len(missing) * corner_speed_iterations(tol))
+        return speeds
 
-    def calculate_lap_time(self) -> float:
+    def calculate_lap_time(self, ds: float = 1.0) -> float:
         """Gelişmiş tur süresi hesaplaması"""
-        # Pist segmentleri ve karakteristikleri
-        segments = [
-            {'type': 'straight', 'length': 800, 'bank_angle': 0},  # Ana düzlük
-            {'type': 'corner', 'radius': 30, 'bank_angle': 5, 'length': 150},  # 1. viraj
-            {'type': 'straight', 'length': 400, 'bank_angle': 0},  # Ara düzlük
-            {'type': 'corner', 'radius': 25, 'bank_angle': 8, 'length': 200},  # 2. viraj (banked)
-            {'type': 'straight', 'length': 300, 'bank_angle': 0},  # Kısa düzlük
-            {'type': 'corner', 'radius': 40, 'bank_angle': 0, 'length': 180}   # Son viraj
-        ]
-        
-        total_time = 0
-        current_speed = 0
-        
-        for i, segment in enumerate(segments):
-            next_segment = segments[(i + 1) % len(segments)]
-            
-            if segment['type'] == 'straight':
-                # Düz yol hesaplaması
-                max_speed = 100  # Maksimum hız (m/s)
-                distance = segment['length']
-                
-                # İvmelenme mesafesi ve süresi
-                acceleration = self.calculate_acceleration(current_speed)
-                accel_distance = min(distance / 2, (max_speed**2 - current_speed**2) / (2 * acceleration))
-                accel_time = (np.sqrt(2 * acceleration * accel_distance + current_speed**2) - current_speed) / acceleration
-                
-                # Sabit hız mesafesi ve süresi
-                const_speed = min(max_speed, np.sqrt(2 * acceleration * accel_distance + current_speed**2))
-                const_distance = max(0, distance - 2 * accel_distance)
-                const_time = const_distance / const_speed
-                
-                # Yavaşlama mesafesi ve süresi (bir sonraki viraj için)
-                if next_segment['type'] == 'corner':
-                    target_speed = self.calculate_corner_speed(next_segment['radius'], next_segment['bank_angle'])
-                    decel = self.car_data['viraj_performansi'] * 10  # Frenleme ivmesi
-                    brake_distance = min(distance / 2, (const_speed**2 - target_speed**2) / (2 * decel))
-                    brake_time = (const_speed - target_speed) / decel
-                else:
-                    brake_distance = 0
-                    brake_time = 0
-                
-                segment_time = accel_time + const_time + brake_time
-                current_speed = target_speed if next_segment['type'] == 'corner' else const_speed
-                
-            else:  # Viraj hesaplaması
-                corner_speed = max(0.1, self.calculate_corner_speed(segment['radius'], segment['bank_angle']))  # Ensure minimum speed
-                segment_time = segment['length'] / corner_speed
-                current_speed = corner_speed
-            
-            # Hava ve pist koşulları etkisi
-            weather_factor = 1 + (self.physics.rain_intensity * 0.3 + 
-                                 max(0, (self.physics.wind_speed - 5) * 0.02) + 
-                                 self.physics.track_wetness * 0.2)
-            
-            total_time += segment_time * weather_factor
-        
-        return total_time
-    
-    def run(self):
+        return self.solve_lap(ds).lap_time
+
+    def solve_lap(self, ds: float = 1.0) -> LapTrace:
         """
-        Simülasyonu çalıştırır ve sonuçları döndürür.
+        Yarı-durağan (quasi-steady-state) tur çözücüsü.
+        Pist `ds` metrelik adımlarla örneklenir; viraj hız tavanı, ileri
+        ivmelenme geçişi ve geri frenleme geçişinin noktasal minimumu alınır.
+        Tur kapalı kabul edilir (uçan tur).
         """
-        lap_time = self.calculate_lap_time()
-        fuel_consumption = self.physics.fuel_consumption_rate * self.track_data['pist_uzunlugu']
-        tire_wear = self.physics.tire_wear_rate * (self.track_data['viraj_sayisi'] + self.track_data['pist_uzunlugu'] / 100)
-        
-        # Hava koşulları etkisi
+        track = self.track
+        n = max(int(np.ceil(track.total_length / ds)), len(track))
+        step = track.total_length / n
+        distance = np.arange(n) * step
+
+        # Viraj sınırlı hız tavanı (her farklı yarıçap/eğim çifti için bir kez çözülür)
+        segment_ceiling = np.full(len(track), MAX_SPEED)
+        if len(track.corner_index):
+            speeds = self.calculate_corner_speeds(track.corner_profiles[:, 0], track.corner_profiles[:, 1])
+            segment_ceiling[track.corner_index] = np.clip(speeds, 0.1, MAX_SPEED)[track.corner_profile_index]
+        if self.profiler is None:
+            v_grid, d_grid = acceleration_distance_table(self.physics, powertrain=self.powertrain_map)
+        else:
+            v_grid, d_grid = self.profiler.timed('acceleration_distance_table', acceleration_distance_table,
+                                                 self.physics, powertrain=self.powertrain_map)
+        ceiling = np.minimum(segment_ceiling[track.segment_at(distance)], v_grid[-1])
+
+        # En düşük tavan noktasında hız tavana eşittir; geçişler oradan başlar
+        start = int(np.argmin(ceiling))
+        ceiling = np.roll(ceiling, -start)
+
+        # İleri geçiş: u = D(v) uzayında u[i] = min(tavan[i], u[i-1] + ds)
+        reach = np.arange(n) * step
+        u = reach + np.minimum.accumulate(np.interp(ceiling, v_grid, d_grid) - reach)
+        forward = np.interp(u, d_grid, v_grid)
+
+        # Geri geçiş: w = v² uzayında w[i] = min(tavan[i]², w[i+1] + 2·b·ds)
+        decel = self.car_data['viraj_performansi'] * 10  # Frenleme ivmesi
+        squared = np.append(ceiling, ceiling[0])[::-1] ** 2
+        reach = np.arange(n + 1) * 2 * decel * step
+        backward = np.sqrt(reach + np.minimum.accumulate(squared - reach))[::-1][:-1]
+
+        speed = np.roll(np.minimum(forward, backward), start)
+
+        # Hava ve pist koşulları etkisi
+        weather_factor = 1 + (self.physics.rain_intensity * 0.3 +
+                             max(0, (self.physics.wind_speed - 5) * 0.02) +
+                             self.physics.track_wetness * 0.2)
+
+        dt = 2 * step / (speed + np.roll(speed, -1)) * weather_factor
+        time = np.concatenate(([0.0], np.cumsum(dt[:-1])))
+
+        # Vites ve motor devri izi
+        rpm_by_gear = gear_rpms(self.physics, speed)
+        gear = select_gear(self.physics, rpm_by_gear)
+        rpm = np.take_along_axis(rpm_by_gear, gear[:, None], axis=-1)[:, 0]
+
+        return LapTrace(distance=distance, speed=speed, gear=gear, rpm=rpm,
+                        time=time, lap_time=float(dt.sum()))
+    
+    def weather_impact(self) -> float:
+        """Hava koşullarının tur süresi ve yakıta etkisi (çarpan)"""
         weather_impact = 1.0
         if self.physics.rain_intensity > 0:
             weather_impact += self.physics.rain_intensity * 0.3  # Yağmur etkisi
         if self.physics.wind_speed > 5:
             weather_impact += (self.physics.wind_speed - 5) * 0.02  # Rüzgar etkisi
-        
-        # Pist koşulları etkisi
+        return weather_impact
+
+    def track_condition(self) -> float:
+        """Pist koşullarının lastik aşınmasına etkisi (çarpan)"""
         track_condition = 1.0
         if self.physics.track_wetness > 0:
             track_condition += self.physics.track_wetness * 0.2  # Islak pist etkisi
         if abs(self.physics.track_temperature - 25) > 10:
             track_condition += abs(self.physics.track_temperature - 25) * 0.01  # Sıcaklık etkisi
-        
+        return track_condition
+
+    def lap_consumption(self) -> tuple[float, float]:
+        """Bir turdaki yakıt tüketimi (L) ve lastik aşınmasını döndürür"""
+        track_length = float(self.track_data['pist_uzunlugu'])
+        fuel_consumption = self.physics.fuel_consumption_rate * track_length
+        tire_wear = self.physics.tire_wear_rate * (float(self.track_data['viraj_sayisi']) + track_length / 100)
+        return fuel_consumption * self.weather_impact(), tire_wear * self.track_condition()
+
+    def trace_channels(self, lap: LapTrace = None) -> Dict[str, np.ndarray]:
+        """
+        Mesafeye bağlı tur izi kanalları (hepsi aynı uzunlukta NumPy dizisi):
+        mesafe (m), zaman (s), hiz (m/s), vites (0 tabanlı), devir (rpm),
+        boylamsal_g ve yanal_g (g cinsinden ivme) ve tutunma (viraj modelindeki
+        yük ve kayma açısında lastik tutunma katsayısı; düzlüklerde 0).
+        """
+        lap = self.solve_lap() if lap is None else lap
+        track = self.track
+        segment = track.segment_at(lap.distance)
+        radius, bank = track.radius[segment], track.bank[segment]
+        gravity = self.physics.gravity
+        speed = lap.speed
+
+        # Boylamsal ivme a = d(v²/2)/ds; tur kapalı olduğundan son nokta ilk noktaya bağlanır
+        step = track.total_length / len(speed)
+        longitudinal = (np.roll(speed, -1) ** 2 - speed ** 2) / (2 * step)
+
+        # Yanal ivme ve viraj modelindeki normal kuvvet / kayma açısı (düzlükte yarıçap sonsuz)
+        gravity_normal = gravity * np.cos(np.radians(bank))
+        _, downforce = aero_forces(self.physics, speed)
+        normal_force = derived_physics(self.physics).mass * gravity_normal + downforce
+        slip_angle = np.arctan(speed ** 2 / (radius * gravity_normal))
+
         return {
+            'mesafe': lap.distance,
+            'zaman': lap.time,
+            'hiz': speed,
+            'vites': lap.gear,
+            'devir': lap.rpm,
+            'boylamsal_g': longitudinal / gravity,
+            'yanal_g': speed ** 2 / radius / gravity,
+            'tutunma': np.asarray(self.calculate_tire_grip(normal_force, slip_angle))
+        }
+
+    def run(self, trace: bool = False):
+        """
+        Simülasyonu çalıştırır ve sonuçları döndürür.
+        trace=True ise sonuca mesafeye bağlı kanalları içeren 'iz' sözlüğü
+        eklenir (bkz. trace_channels). İz dizileri kalıcı önbelleğe yazılmaz:
+        skaler sonuçlar ResultCache'ten okunur, iz ayrıca tek tur çözümüyle üretilir.
+        """
+        if self.result_cache is None:
+            return self._simulate(trace)
+        if not trace:
+            return self.result_cache.get_or_run(self, self._simulate)
+
+        traced = {}
+
+        def compute():
+            # Iskada tur bir kez çözülür; iz bu çözümden alınır
+            traced.update(self._simulate(trace=True))
+            return {key: value for key, value in traced.items() if key != 'iz'}
+
+        results = dict(self.result_cache.get_or_run(self, compute))
+        results['iz'] = traced['iz'] if traced else self.trace_channels()
+        return results
+
+    def _simulate(self, trace: bool = False):
+        lap = self.solve_lap() if trace else None
+        lap_time = lap.lap_time if trace else self.calculate_lap_time()
+        fuel_consumption, tire_wear = self.lap_consumption()
+        weather_impact = self.weather_impact()
+        
+        results = {
             'tur_suresi': lap_time * weather_impact,
             'detaylar': {
                 'temel_sure': self.track_data['pist_uzunlugu'] / self.car_data['ortalama_hiz'],
                 'viraj_etkisi': self.track_data['viraj_sayisi'] * (1 / self.car_data['viraj_performansi']),
                 'duz_yol_etkisi': self.track_data['duz_yol_yuzdesi'] * (1 / self.car_data['ivmelenme']),
                 'hava_direnci': self.car_data['hava_direnci'] * self.track_data['pist_uzunlugu'] / 1000,
-                'yakit_tuketimi': fuel_consumption * weather_impact,
-                'lastik_asinmasi': tire_wear * track_condition,
+                'yakit_tuketimi': fuel_consumption,
+                'lastik_asinmasi': tire_wear,
                 'hava_kosullari': {
                     'sicaklik': self.physics.air_temperature,
                     'nem': self.physics.humidity,
@@ -298,4 +898,7 @@ class Simulator:
                     'islaklik': self.physics.track_wetness
                 }
             }
-        }
\ No newline at end of file
+        }
+        if trace:
+            results['iz'] = self.trace_channels(lap)
+        return results
\ No newline at end of file
@@ -0,0 +1,119 @@
+from dataclasses import fields, replace
+from typing import Dict
+
+import numpy as np
+
+from simulator import PhysicsConstants, Simulator
+
+FUEL_DENSITY = 0.75  # Yakıt yoğunluğu (kg/L)
+
+# Stint boyunca değişen alanlar; önbellek anahtarında ayrıca yer alır
+STINT_STATE_FIELDS = ('fuel_mass', 'tire_wear')
+
+def physics_fingerprint(physics: PhysicsConstants) -> tuple:
+    """Yakıt ve aşınma dışındaki tüm fizik alanlarının hash'lenebilir özeti"""
+    values = []
+    for field in fields(physics):
+        if field.name not in STINT_STATE_FIELDS:
+            value = getattr(physics, field.name)
+            values.append(tuple(value) if isinstance(value, list) else value)
+    return tuple(values)
+
+# Stint çıktısı: tur başına kompakt kayıt
+STINT_DTYPE = np.dtype([
+    ('lap', np.int32),  # Stint içindeki tur numarası (1 tabanlı)
+    ('lap_time', np.float64),  # Tur süresi (s)
+    ('fuel', np.float64),  # Tur başındaki yakıt kütlesi (kg)
+    ('wear', np.float64),  # Tur başındaki lastik aşınması (0-1)
+])
+
+class StintSimulator:
+    """
+    Yakıt kütlesi ve lastik aşınmasını turdan tura taşıyan çok turlu stint simülasyonu.
+
+    Tur süresi stint boyunca yumuşak değiştiği için her tur ayrı çözülmez: ilk ve
+    son tur çözülür, aradaki turlar doğrusal enterpolasyonla doldurulur. Aralığın
+    ortasındaki tur enterpolasyondan `time_tolerance` saniyeden fazla saparsa
+    aralık ikiye bölünür. Durumu (yakıt, aşınma) bir önceki çözülen turdan
+    eşiklerin altında farklı olan aralıklar hiç bölünmez. Çözülen turlar
+    (fizik alanları, yakıt, aşınma) anahtarıyla saklanır ve sonraki stintlerde
+    yeniden kullanılır; simulator.physics değiştirilirse eski süreler kullanılmaz.
+    """
+
+    def __init__(self, track_data: Dict[str, float], car_data: Dict[str, float],
+                 physics: PhysicsConstants = None, fuel_threshold: float = 2.0,
+                 wear_threshold: float = 0.02, time_tolerance: float = 1e-3, ds: float = 1.0):
+        self.simulator = Simulator(track_data, car_data)
+        if physics is not None:
+            # Yakıt ve aşınma alanları değiştirileceği için kopya kullanılır
+            self.simulator.physics = replace(physics)
+        self.fuel_threshold = fuel_threshold
+        self.wear_threshold = wear_threshold
+        self.time_tolerance = time_tolerance
+        self.ds = ds
+        self.solves = 0
+        self._lap_times = {}
+
+    def lap_time(self, fuel: float, wear: float) -> float:
+        """Verilen yakıt (kg) ve aşınma durumunda tek tur süresini (önbellekli) döndürür"""
+        physics = self.simulator.physics
+        key = (physics_fingerprint(physics), round(fuel, 9), round(wear, 9))
+        lap_time = self._lap_times.get(key)
+        if lap_time is None:
+            physics.fuel_mass = fuel
+            physics.tire_wear = wear
+            lap_time = self.simulator.calculate_lap_time(self.ds) * self.simulator.weather_impact()
+            self._lap_times[key] = lap_time
+            self.solves += 1
+        return lap_time
+
+    def run(self, laps: int, fuel_load: float = None, initial_wear: float = 0.0) -> np.ndarray:
+        """
+        `laps` turluk stinti simüle eder ve STINT_DTYPE yapılı dizisi döndürür.
+        fuel_load (kg) verilmezse stinti tam bitirecek kadar yakıtla başlanır.
+        """
+        fuel_per_lap, wear_per_lap = self.simulator.lap_consumption()
+        fuel_per_lap *= FUEL_DENSITY
+        if fuel_load is None:
+            fuel_load = fuel_per_lap * laps
+
+        stint = np.zeros(laps, dtype=STINT_DTYPE)
+        stint['lap'] = np.arange(1, laps + 1)
+        stint['fuel'] = np.maximum(fuel_load - fuel_per_lap * np.arange(laps), 0.0)
+        stint['wear'] = np.minimum(initial_wear + wear_per_lap * np.arange(laps), 1.0)
+        if laps == 0:
+            return stint
+
+        lap_time = stint['lap_time']
+        solved = np.zeros(laps, dtype=bool)
+
+        def solve(i):
+            if not solved[i]:
+                lap_time[i] = self.lap_time(stint['fuel'][i], stint['wear'][i])
+                solved[i] = True
+            return lap_time[i]
+
+        def interpolate(i, j):
+            lap_time[i:j + 1] = np.linspace(lap_time[i], lap_time[j], j - i + 1)
+
+        # Özyineleme yerine yığın: (i, j) uçları çözülmüş aralıklar
+        solve(0)
+        solve(laps - 1)
+        pending = [(0, laps - 1)]
+        while pending:
+            i, j = pending.pop()
+            if j - i <= 1:
+                continue
+            if abs(stint['fuel'][j] - stint['fuel'][i]) < self.fuel_threshold and \
+                    abs(stint['wear'][j] - stint['wear'][i]) < self.wear_threshold:
+                interpolate(i, j)
+                continue
+            m = (i + j) // 2
+            midpoint = lap_time[i] + (lap_time[j] - lap_time[i]) * (m - i) / (j - i)
+            if abs(solve(m) - midpoint) <= self.time_tolerance:
+                interpolate(i, m)
+                interpolate(m, j)
+            else:
+                pending.append((i, m))
+                pending.append((m, j))
+        return stint
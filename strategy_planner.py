@@ -0,0 +1,270 @@
+import time
+from dataclasses import dataclass, replace
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from simulator import PhysicsConstants
+from stint import StintSimulator
+
+@dataclass(frozen=True)
+class Compound:
+    """Lastik hamuru: fizik alanlarına uygulanan çarpanlar ve stint sınırı"""
+    name: str
+    grip: float = 1.0  # friction_coefficient çarpanı
+    wear: float = 1.0  # tire_wear_rate çarpanı
+    wet_protection: float = 0.0  # Pist ıslaklığının tutunma kaybından korunma oranı (0-1)
+    max_laps: int = None  # Bir stintte izin verilen en fazla tur
+
+DEFAULT_COMPOUNDS = (
+    Compound('yumusak', grip=1.08, wear=1.6, max_laps=25),
+    Compound('orta', grip=1.0, wear=1.0, max_laps=40),
+    Compound('sert', grip=0.94, wear=0.6),
+    Compound('ara', grip=0.9, wear=1.8, wet_protection=0.6, max_laps=30),
+    Compound('islak', grip=0.82, wear=2.5, wet_protection=0.9, max_laps=30),
+)
+
+# Hava durumu: (turdan itibaren, {'rain_intensity': ..., 'track_wetness': ...}) değişim listesi
+DRY = ((0, {'rain_intensity': 0.0, 'track_wetness': 0.0}),)
+
+@dataclass
+class Stint:
+    compound: str
+    start_lap: int  # Stintin ilk turu (0 tabanlı)
+    laps: int
+    time: float  # Stintteki turların toplam süresi (s), pit kaybı hariç
+
+@dataclass
+class StrategyPlan:
+    stints: List[Stint]
+    total_time: float  # Pit kayıpları dahil yarış süresi (s)
+
+    @property
+    def stops(self) -> int:
+        return len(self.stints) - 1
+
+    def to_rows(self) -> List[Dict]:
+        return [{'Stint': i + 1, 'Lastik': stint.compound, 'İlk Tur': stint.start_lap + 1,
+                 'Tur': stint.laps, 'Süre': stint.time} for i, stint in enumerate(self.stints)]
+
+def lap_conditions(weather: Sequence[Tuple[int, Dict[str, float]]], laps: int) -> Tuple[List[Tuple], np.ndarray]:
+    """
+    Hava durumu değişimlerinden her turun koşul indeksini çıkarır.
+    (koşullar, tur başına indeks) döndürür; koşul (rain_intensity, track_wetness) demetidir.
+    """
+    changes = sorted(weather, key=lambda change: change[0])
+    if not changes or changes[0][0] > 0:
+        raise ValueError("Hava durumu 0. turdan başlamalı")
+    conditions = []
+    index = np.empty(laps, dtype=np.intp)
+    for i, (start, values) in enumerate(changes):
+        condition = (float(values.get('rain_intensity', 0.0)), float(values.get('track_wetness', 0.0)))
+        if condition not in conditions:
+            conditions.append(condition)
+        end = changes[i + 1][0] if i + 1 < len(changes) else laps
+        index[start:end] = conditions.index(condition)
+    return conditions, index
+
+class StrategyPlanner:
+    """
+    Yarış mesafesi, pit kaybı ve izin verilen lastik/stint seçeneklerine göre en
+    hızlı pit planını bulur.
+
+    Lastik yıpranmalı tur süreleri her hamur-koşul çifti için bir kez kurulan tur
+    süresi yüzeyinden okunur: en uzun stint StintSimulator ile boş ve dolu depoyla
+    iki kez koşulur. Aşınma yalnızca lastik yaşına bağlı olduğundan her yaş için
+    iki süre elde edilir; kısa stintlerin turları bu ikisi arasında yakıta göre
+    doğrusal enterpolasyonla bulunur (tur süresi yakıtta neredeyse doğrusaldır).
+    Böylece tüm stint uzunlukları aynı çözümleri paylaşır; tur süreleri
+    (hamur, uzunluk, koşul) başına ayrıca saklanır. Plan araması tamamlanan tur sayısı üzerinde dinamik
+    programlamadır: her tur için en iyi süre, oradan başlayan her (hamur, uzunluk)
+    stintiyle genişletilir; planlar tek tek sayılmaz.
+
+    Stint süresi, stint içinde hava değişse bile her turda o turun koşulu için
+    hesaplanmış tur süresinden okunur (yakıt ve aşınma stint başından sayılır).
+    Yakıt her stintte yalnızca o stinti bitirecek kadar alınır.
+    """
+
+    def __init__(self, track_data: Dict[str, float], car_data: Dict[str, float],
+                 compounds: Sequence[Compound] = DEFAULT_COMPOUNDS, physics: PhysicsConstants = None,
+                 pit_loss: float = 20.0, min_stint: int = 1, ds: float = 5.0):
+        if not compounds:
+            raise ValueError("En az bir lastik hamuru gerekli")
+        self.track_data = track_data
+        self.car_data = car_data
+        self.compounds = list(compounds)
+        self.physics = physics if physics is not None else PhysicsConstants()
+        self.pit_loss = pit_loss
+        self.min_stint = max(1, int(min_stint))
+        self.ds = ds
+        self._stint_laps = {}
+        self._simulators = {}
+        self._surfaces = {}
+        self._stats = {'stint_runs': 0, 'stint_hits': 0, 'transitions': 0, 'seconds': 0.0}
+
+    def _simulator(self, compound: Compound, condition: Tuple[float, float]) -> StintSimulator:
+        key = (compound.name, condition)
+        simulator = self._simulators.get(key)
+        if simulator is None:
+            rain_intensity, track_wetness = condition
+            physics = replace(
+                self.physics,
+                friction_coefficient=self.physics.friction_coefficient * compound.grip,
+                tire_wear_rate=self.physics.tire_wear_rate * compound.wear,
+                rain_intensity=rain_intensity,
+                track_wetness=track_wetness * (1 - compound.wet_protection)
+            )
+            simulator = StintSimulator(self.track_data, self.car_data, physics, ds=self.ds)
+            self._simulators[key] = simulator
+        return simulator
+
+    def _surface(self, compound: Compound, laps: int, condition: Tuple[float, float]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        En az `laps` turluk yüzey: lastik yaşı başına boş depoyla ve en uzun stinti
+        bitirecek yakıtla tur süreleri. Daha uzun stint istenirse yeniden kurulur.
+        """
+        key = (compound.name, condition)
+        surface = self._surfaces.get(key)
+        if surface is None or len(surface[0]) < laps:
+            simulator = self._simulator(compound, condition)
+            empty = simulator.run(laps, fuel_load=0.0)['lap_time']
+            full = simulator.run(laps)['lap_time']
+            surface = self._surfaces[key] = (empty, full)
+            self._stats['stint_runs'] += 2
+            # Eski yüzeyden okunan süreler yeni yüzeyle tutarlı olsun diye atılır
+            self._stint_laps = {stint: times for stint, times in self._stint_laps.items()
+                                if (stint[0], stint[2]) != key}
+        return surface
+
+    def stint_lap_times(self, compound: Compound, laps: int, condition: Tuple[float, float]) -> np.ndarray:
+        """(hamur, stint uzunluğu, koşul) için tur başına süreleri döndürür (önbellekli)"""
+        key = (compound.name, laps, condition)
+        lap_times = self._stint_laps.get(key)
+        if lap_times is None:
+            empty, full = self._surface(compound, laps, condition)
+            # a. turdaki yakıt, yüzeyin dolu deposundaki yakıtın (laps - a) / (N - a) katıdır
+            ages = np.arange(laps)
+            share = (laps - ages) / (len(full) - ages)
+            lap_times = empty[:laps] + (full[:laps] - empty[:laps]) * share
+            lap_times.flags.writeable = False
+            self._stint_laps[key] = lap_times
+        else:
+            self._stats['stint_hits'] += 1
+        return lap_times
+
+    def _max_laps(self, compound: Compound, race_laps: int) -> int:
+        return race_laps if compound.max_laps is None else min(compound.max_laps, race_laps)
+
+    def stint_times(self, compound: Compound, conditions: List[Tuple], index: np.ndarray) -> np.ndarray:
+        """
+        S[a, L]: a. turda başlayan L turluk stintin süresi; izin verilmeyen
+        uzunluklar ve yarış sonunu aşan stintler inf.
+        """
+        race_laps = len(index)
+        longest = self._max_laps(compound, race_laps)
+        times = np.full((race_laps, race_laps + 1), np.inf)
+        ages = np.arange(longest)
+        for condition in conditions:
+            self._surface(compound, longest, condition)
+        for laps in range(self.min_stint, longest + 1):
+            by_condition = np.stack([self.stint_lap_times(compound, laps, condition) for condition in conditions])
+            starts = race_laps - laps + 1
+            if len(conditions) == 1:
+                times[:starts, laps] = by_condition[0].sum()
+            else:
+                # Her başlangıç turu için stint turlarının koşullarını topluca oku
+                lap_index = np.arange(starts)[:, None] + ages[:laps]
+                times[:starts, laps] = by_condition[index[lap_index], ages[:laps]].sum(axis=1)
+        return times
+
+    def plan(self, race_laps: int, weather: Sequence[Tuple[int, Dict[str, float]]] = DRY,
+             mandatory_change: bool = False) -> StrategyPlan:
+        """
+        En hızlı pit planını döndürür. mandatory_change=True ise plan en az iki
+        farklı hamur kullanmalıdır. Uygun plan yoksa ValueError verir.
+        """
+        if race_laps < 1:
+            raise ValueError("Yarış en az bir tur olmalı")
+        started = time.perf_counter()
+        conditions, index = lap_conditions(weather, race_laps)
+        stint_times = [self.stint_times(compound, conditions, index) for compound in self.compounds]
+
+        # Durum: (tamamlanan tur, etiket); etiket 0 = tek hamur henüz yok,
+        # 1 + c = yalnızca c hamuru kullanıldı, 1 + C = en az iki farklı hamur
+        count = len(self.compounds)
+        tags = count + 2
+        best = np.full((race_laps + 1, tags), np.inf)
+        previous = np.full((race_laps + 1, tags, 3), -1, dtype=np.intp)  # (başlangıç turu, etiket, hamur)
+        best[0, 0] = 0.0
+        lengths = np.arange(race_laps + 1)
+        transitions = 0
+        for start in range(race_laps):
+            for tag in range(tags):
+                elapsed = best[start, tag]
+                if not np.isfinite(elapsed):
+                    continue
+                if start > 0:
+                    elapsed += self.pit_loss
+                for c in range(count):
+                    new_tag = 1 + c if tag in (0, 1 + c) else count + 1
+                    candidate = elapsed + stint_times[c][start]
+                    ends = start + lengths
+                    valid = np.isfinite(candidate) & (ends <= race_laps)
+                    transitions += int(valid.sum())
+                    ends, candidate = ends[valid], candidate[valid]
+                    better = candidate < best[ends, new_tag]
+                    best[ends[better], new_tag] = candidate[better]
+                    previous[ends[better], new_tag] = (start, tag, c)
+
+        final_tags = [count + 1] if mandatory_change else list(range(1, tags))
+        final_tag = min(final_tags, key=lambda tag: best[race_laps, tag])
+        if not np.isfinite(best[race_laps, final_tag]):
+            raise ValueError("İzin verilen lastik ve stint seçenekleriyle uygun plan yok")
+
+        stints = []
+        lap, tag = race_laps, final_tag
+        while lap > 0:
+            start, tag_before, c = previous[lap, tag]
+            stints.append(Stint(self.compounds[c].name, int(start), int(lap - start),
+                                float(stint_times[c][start, lap - start])))
+            lap, tag = start, tag_before
+        stints.reverse()
+
+        self._stats['transitions'] += transitions
+        self._stats['seconds'] += time.perf_counter() - started
+        return StrategyPlan(stints, float(best[race_laps, final_tag]))
+
+    def evaluate(self, stints: Sequence[Tuple[str, int]], weather: Sequence[Tuple[int, Dict[str, float]]] = DRY
+                 ) -> StrategyPlan:
+        """Verilen [(hamur adı, tur sayısı), ...] planının süresini önbellekteki stint sürelerinden hesaplar"""
+        race_laps = sum(laps for _, laps in stints)
+        conditions, index = lap_conditions(weather, race_laps)
+        by_name = {compound.name: compound for compound in self.compounds}
+        result, start = [], 0
+        for name, laps in stints:
+            if name not in by_name:
+                raise ValueError(f"Bilinmeyen lastik hamuru: {name}")
+            compound = by_name[name]
+            longest = self._max_laps(compound, race_laps)
+            if laps > longest or laps < self.min_stint:
+                raise ValueError(f"{name} için izin verilmeyen stint uzunluğu: {laps}")
+            for condition in conditions:
+                self._surface(compound, longest, condition)
+            by_condition = [self.stint_lap_times(compound, laps, condition) for condition in conditions]
+            stint_time = sum(by_condition[index[start + age]][age] for age in range(laps))
+            result.append(Stint(name, start, laps, float(stint_time)))
+            start += laps
+        total = sum(stint.time for stint in result) + self.pit_loss * (len(result) - 1)
+        return StrategyPlan(result, float(total))
+
+    def plan_scenarios(self, race_laps: int, scenarios: Dict[str, Sequence[Tuple[int, Dict[str, float]]]],
+                       mandatory_change: bool = False) -> Dict[str, StrategyPlan]:
+        """Her hava durumu senaryosu için en hızlı planı döndürür (stint süreleri senaryolar arasında paylaşılır)"""
+        return {name: self.plan(race_laps, weather, mandatory_change) for name, weather in scenarios.items()}
+
+    def stats(self) -> Dict[str, float]:
+        """Stint simülasyonu sayısı, önbellek isabetleri, çözülen tur ve DP geçişleri"""
+        stats = dict(self._stats)
+        stats['lap_solves'] = sum(simulator.solves for simulator in self._simulators.values())
+        stats['cached_stints'] = len(self._stint_laps)
+        return stats
@@ -0,0 +1,162 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterator, List, Sequence
+
+import numpy as np
+
+from result_cache import open_cache
+from simulator import Simulator
+
+# Sonuç tablosuna alınan skaler detay alanları
+RESULT_FIELDS = ['temel_sure', 'viraj_etkisi', 'duz_yol_etkisi', 'hava_direnci', 'yakit_tuketimi', 'lastik_asinmasi']
+
+def _run_chunk(track_data, car_data, names, start, values, cache_path=None):
+    """
+    Bir parça (chunk) parametre noktasını tek süreçte çalıştırır.
+    names: eksen adları ('physics.<alan>' ya da 'car.<anahtar>'), values: (n, d) değerler.
+    cache_path verilirse sonuçlar o dosyadaki ResultCache'ten okunur/yazılır.
+    """
+    cache = open_cache(cache_path) if cache_path else None
+    columns = {'index': list(range(start, start + len(values)))}
+    for name in names:
+        columns[name] = []
+    columns['tur_suresi'] = []
+    for field in RESULT_FIELDS:
+        columns[field] = []
+
+    for row in values:
+        car = dict(car_data)
+        simulator = Simulator(track_data, car)
+        simulator.result_cache = cache
+        for name, value in zip(names, row):
+            scope, key = name.split('.', 1)
+            if scope == 'physics':
+                setattr(simulator.physics, key, value)
+            else:
+                car[key] = value
+            columns[name].append(value)
+
+        results = simulator.run()
+        columns['tur_suresi'].append(float(results['tur_suresi']))
+        for field in RESULT_FIELDS:
+            columns[field].append(float(results['detaylar'][field]))
+    return columns
+
+def _options(axis) -> np.ndarray:
+    """Eksen değerlerini 1 boyutlu nesne dizisine koyar; eşit uzunluklu listeler (ör. gear_ratios) 2B diziye dönüşmez"""
+    options = np.empty(len(axis), dtype=object)
+    options[:] = list(axis)
+    return options
+
+class ParameterSweep:
+    """
+    PhysicsConstants alanları ve car_data anahtarları üzerinde "ya olursa" taraması.
+
+    physics_axes / car_axes: {alan: değerler}. 'grid' modunda değer listelerinin
+    Kartezyen çarpımı, 'lhs' modunda Latin hiperküp örneği kullanılır. LHS'de
+    (alt, üst) demeti sürekli aralık, liste ise ayrık seçenekler olarak yorumlanır.
+    cache_path verilirse her nokta ResultCache üzerinden çalıştırılır.
+    """
+
+    def __init__(self, track_data: Dict[str, float], car_data: Dict[str, float],
+                 physics_axes: Dict[str, Sequence] = None, car_axes: Dict[str, Sequence] = None,
+                 mode: str = 'grid', samples: int = None, seed: int = 0, cache_path: str = None):
+        if mode not in ('grid', 'lhs'):
+            raise ValueError(f"Bilinmeyen tarama modu: {mode}")
+        if mode == 'lhs' and not samples:
+            raise ValueError("LHS modu için örnek sayısı (samples) gerekli")
+
+        self.track_data = track_data
+        self.car_data = car_data
+        self.mode = mode
+        self.seed = seed
+        self.cache_path = cache_path
+        self.names = [f'physics.{key}' for key in (physics_axes or {})] + \
+                     [f'car.{key}' for key in (car_axes or {})]
+        self.axes = list((physics_axes or {}).values()) + list((car_axes or {}).values())
+
+        if mode == 'grid':
+            self.shape = tuple(len(axis) for axis in self.axes)
+            self.size = int(np.prod(self.shape, dtype=np.int64))
+            self._lhs = None
+        else:
+            self.size = samples
+            self._lhs = self._latin_hypercube(samples)
+
+    def __len__(self):
+        return self.size
+
+    def _latin_hypercube(self, samples: int) -> np.ndarray:
+        """Her eksende tabakalı, sabit tohumlu (n, d) birim küp örneği üretir"""
+        rng = np.random.default_rng(self.seed)
+        strata = np.stack([rng.permutation(samples) for _ in self.axes], axis=1) if self.axes \
+            else np.empty((samples, 0))
+        return (strata + rng.random(strata.shape)) / samples
+
+    def points(self, start: int, stop: int) -> np.ndarray:
+        """[start, stop) aralığındaki tarama noktalarını (n, d) dizi olarak döndürür"""
+        count = stop - start
+        values = np.empty((count, len(self.axes)), dtype=object)
+        if self.mode == 'grid':
+            indices = np.unravel_index(np.arange(start, stop), self.shape) if self.axes else []
+            for column, (axis, index) in enumerate(zip(self.axes, indices)):
+                values[:, column] = _options(axis)[index]
+        else:
+            unit = self._lhs[start:stop]
+            for column, axis in enumerate(self.axes):
+                if isinstance(axis, tuple):
+                    low, high = axis
+                    values[:, column] = low + unit[:, column] * (high - low)
+                else:
+                    options = _options(axis)
+                    values[:, column] = options[(unit[:, column] * len(options)).astype(int)]
+        return values
+
+    def iter_batches(self, workers: int = None, chunk_size: int = 256,
+                     progress: Callable[[int, int], None] = None,
+                     as_dataframe: bool = True) -> Iterator:
+        """
+        Taramayı parçalar halinde çalıştırır ve sonuçları giriş sırasıyla akıtır.
+        Aynı anda en fazla 2 × workers parça bellekte tutulur. workers 0 ya da 1
+        ise süreç havuzu kullanılmaz. as_dataframe False ise her parça sütun
+        sözlüğü (kayıt grubu) olarak döner.
+        """
+        chunks = ((start, min(start + chunk_size, self.size)) for start in range(0, self.size, chunk_size))
+        done = 0
+
+        def emit(columns):
+            nonlocal done
+            done += len(columns['index'])
+            if progress is not None:
+                progress(done, self.size)
+            if as_dataframe:
+                import pandas as pd
+                return pd.DataFrame(columns)
+            return columns
+
+        if workers is not None and workers <= 1:
+            for start, stop in chunks:
+                yield emit(_run_chunk(self.track_data, self.car_data, self.names, start,
+                                      self.points(start, stop), self.cache_path))
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            window = 2 * (workers or os.cpu_count() or 1)
+            pending = deque()
+            for start, stop in chunks:
+                pending.append(executor.submit(_run_chunk, self.track_data, self.car_data,
+                                               self.names, start, self.points(start, stop), self.cache_path))
+                if len(pending) >= window:
+                    yield emit(pending.popleft().result())
+            while pending:
+                yield emit(pending.popleft().result())
+
+    def run(self, workers: int = None, chunk_size: int = 256,
+            progress: Callable[[int, int], None] = None):
+        """Tüm taramayı çalıştırır ve tek bir pandas DataFrame döndürür"""
+        import pandas as pd
+        batches: List = list(self.iter_batches(workers, chunk_size, progress))
+        if not batches:
+            return pd.DataFrame(columns=['index'] + self.names + ['tur_suresi'] + RESULT_FIELDS)
+        return pd.concat(batches, ignore_index=True)
@@ -0,0 +1,175 @@
+import csv
+import json
+import os
+from collections import OrderedDict
+from typing import Dict, List
+
+import numpy as np
+
+STRAIGHT = 0
+CORNER = 1
+
+# Pist segmentleri ve karakteristikleri (track_data'da pist tanımı yoksa kullanılır)
+DEFAULT_TRACK_SEGMENTS = [
+    {'type': 'straight', 'length': 800, 'bank_angle': 0},  # Ana düzlük
+    {'type': 'corner', 'radius': 30, 'bank_angle': 5, 'length': 150},  # 1. viraj
+    {'type': 'straight', 'length': 400, 'bank_angle': 0},  # Ara düzlük
+    {'type': 'corner', 'radius': 25, 'bank_angle': 8, 'length': 200},  # 2. viraj (banked)
+    {'type': 'straight', 'length': 300, 'bank_angle': 0},  # Kısa düzlük
+    {'type': 'corner', 'radius': 40, 'bank_angle': 0, 'length': 180}   # Son viraj
+]
+
+def _read_only(values, dtype) -> np.ndarray:
+    array = np.array(values, dtype=dtype)
+    array.setflags(write=False)
+    return array
+
+class Track:
+    """
+    Segmentleri NumPy dizileri olarak tutan salt okunur pist modeli.
+    kind: STRAIGHT/CORNER, length (m), radius (m, düzlüklerde inf), bank (derece),
+    start/end: segment başlangıç ve bitişinin tur başından uzaklığı (m).
+    Aynı pist birden çok Simulator arasında paylaşılabilir.
+    """
+
+    def __init__(self, kind, length, radius, bank, name: str = None):
+        self.name = name
+        self.kind = _read_only(kind, np.int8)
+        self.length = _read_only(length, float)
+        self.radius = _read_only(np.where(self.kind == CORNER, radius, np.inf), float)
+        self.bank = _read_only(bank, float)
+        if not (len(self.kind) == len(self.length) == len(self.radius) == len(self.bank)) or not len(self.kind):
+            raise ValueError("Pist segment dizileri boş olamaz ve aynı uzunlukta olmalıdır")
+        if (self.length <= 0).any():
+            raise ValueError("Segment uzunlukları pozitif olmalıdır")
+
+        self.end = _read_only(np.cumsum(self.length), float)
+        self.start = _read_only(self.end - self.length, float)
+
+        # Aynı (yarıçap, eğim) çiftine sahip virajlar bir kez çözülür
+        corners = np.flatnonzero(self.kind == CORNER)
+        profiles, inverse = np.unique(np.stack([self.radius[corners], self.bank[corners]], axis=1),
+                                      axis=0, return_inverse=True)
+        self.corner_index = _read_only(corners, np.intp)
+        self.corner_profiles = _read_only(profiles.reshape(-1, 2), float)
+        self.corner_profile_index = _read_only(np.ravel(inverse), np.intp)
+
+    def __len__(self):
+        return len(self.kind)
+
+    @property
+    def total_length(self) -> float:
+        return float(self.end[-1])
+
+    def segment_at(self, distance):
+        """Tur başından uzaklığa (m) karşılık gelen segment indeksini döndürür (ikili arama)"""
+        distance = np.mod(distance, self.total_length)
+        return np.searchsorted(self.end, distance, side='right')
+
+    def to_segments(self) -> List[Dict[str, float]]:
+        """Pisti segment sözlükleri listesine çevirir"""
+        segments = []
+        for kind, length, radius, bank in zip(self.kind, self.length, self.radius, self.bank):
+            segment = {'type': 'corner' if kind == CORNER else 'straight',
+                       'length': float(length), 'bank_angle': float(bank)}
+            if kind == CORNER:
+                segment['radius'] = float(radius)
+            segments.append(segment)
+        return segments
+
+    @classmethod
+    def from_segments(cls, segments: List[Dict[str, float]], name: str = None) -> 'Track':
+        """{'type', 'length', 'radius', 'bank_angle'} sözlüklerinden pist oluşturur"""
+        return cls(
+            kind=[CORNER if segment['type'] == 'corner' else STRAIGHT for segment in segments],
+            length=[float(segment['length']) for segment in segments],
+            radius=[float(segment.get('radius', np.inf)) for segment in segments],
+            bank=[float(segment.get('bank_angle', 0)) for segment in segments],
+            name=name
+        )
+
+    @classmethod
+    def from_file(cls, path: str) -> 'Track':
+        """
+        Segment dosyasından pist yükler.
+        .json: segment sözlükleri listesi; .csv: type,length,radius,bank_angle sütunları;
+        .gtp: ikili pist noktası dosyası (segmentler geometriden çıkarılır, 'bank'
+        nokta sütunu varsa eğim olarak kullanılır).
+        """
+        name = os.path.splitext(os.path.basename(path))[0]
+        if path.lower().endswith('.gtp'):
+            from track_geometry import extract_track
+            from track_points import TrackPoints
+            points = TrackPoints(path)
+            return extract_track(points.positions, bank=points.attributes.get('bank'), name=name)
+        with open(path, 'r', newline='') as f:
+            if path.lower().endswith('.csv'):
+                segments = [{key: value for key, value in row.items() if value not in (None, '')}
+                            for row in csv.DictReader(f)]
+            else:
+                segments = json.load(f)
+        return cls.from_segments(segments, name=name)
+
+    @classmethod
+    def from_track_data(cls, track_data: Dict[str, float]) -> 'Track':
+        """
+        saved_configs.json pist kaydından pist oluşturur (aynı içerik için önbellekli).
+        'segmentler' anahtarı varsa doğrudan kullanılır; yoksa pist_uzunlugu (km),
+        viraj_sayisi ve duz_yol_yuzdesi alanlarından düzlük/viraj dizisi üretilir.
+        Viraj yarıçapı ve eğimi 'viraj_yaricapi'/'viraj_egimi' ile verilmezse
+        varsayılan pistin virajları sırayla kullanılır. Pist tanımı yoksa
+        varsayılan pist döner.
+        """
+        key = json.dumps(track_data, sort_keys=True, default=str)
+        track = _track_cache.get(key)
+        if track is None:
+            track = cls._build_from_track_data(track_data)
+            _track_cache[key] = track
+            while len(_track_cache) > TRACK_CACHE_SIZE:
+                _track_cache.popitem(last=False)
+        else:
+            _track_cache.move_to_end(key)
+        return track
+
+    @classmethod
+    def _build_from_track_data(cls, track_data: Dict[str, float]) -> 'Track':
+        if 'segmentler' in track_data:
+            return cls.from_segments(track_data['segmentler'])
+        if 'pist_uzunlugu' not in track_data:
+            return cls.default()
+
+        total_length = float(track_data['pist_uzunlugu']) * 1000
+        corner_count = int(float(track_data.get('viraj_sayisi', 0)))
+        if corner_count <= 0:
+            return cls([STRAIGHT], [total_length], [np.inf], [0.0])
+
+        straight_share = min(max(float(track_data.get('duz_yol_yuzdesi', 0.5)), 0.0), 1.0)
+        default_corners = [segment for segment in DEFAULT_TRACK_SEGMENTS if segment['type'] == 'corner']
+        corners = [default_corners[i % len(default_corners)] for i in range(corner_count)]
+        radius = [float(track_data.get('viraj_yaricapi', corner['radius'])) for corner in corners]
+        bank = [float(track_data.get('viraj_egimi', corner['bank_angle'])) for corner in corners]
+
+        # Her virajdan önce eşit uzunlukta bir düzlük
+        straight_length = total_length * straight_share / corner_count
+        corner_length = total_length * (1 - straight_share) / corner_count
+        segments = []
+        for i in range(corner_count):
+            if straight_length > 0:
+                segments.append((STRAIGHT, straight_length, np.inf, 0.0))
+            if corner_length > 0:
+                segments.append((CORNER, corner_length, radius[i], bank[i]))
+        kind, length, radius, bank = zip(*segments)
+        return cls(kind, length, radius, bank)
+
+    @classmethod
+    def default(cls) -> 'Track':
+        """Varsayılan altı segmentli pist"""
+        global _default_track
+        if _default_track is None:
+            _default_track = cls.from_segments(DEFAULT_TRACK_SEGMENTS, name='varsayilan')
+        return _default_track
+
+TRACK_CACHE_SIZE = 256
+
+_default_track = None
+_track_cache: Dict[str, Track] = OrderedDict()
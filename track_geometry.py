@@ -0,0 +1,129 @@
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from track import CORNER, STRAIGHT, Track
+
+def resample_arc_length(plane: np.ndarray, spacing: float,
+                        closed: bool = True) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (N, 2) yolu eşit yay uzunluğu aralıklarıyla yeniden örnekler.
+    (s, noktalar, kaynak indeks) döndürür; kaynak indeks her örneğin ham noktalar
+    üzerindeki kesirli konumudur. closed ise son noktadan ilk noktaya dönüş de
+    yola katılır. Örnek aralığından çok sık ölçülmüş noktalar önce bloklar halinde
+    ortalanır: aksi halde ölçüm gürültüsü yay uzunluğunu şişirir.
+    """
+    plane = np.asarray(plane, dtype=float)
+    index = np.arange(len(plane), dtype=float)
+    stride = max(len(plane) // 10000, 1)
+    rough = np.hypot(*np.diff(plane[::stride], axis=0).T).sum()
+    block = int(len(plane) * spacing / (4 * rough)) if rough > 0 else 1
+    if block > 1:
+        usable = len(plane) // block * block
+        plane = plane[:usable].reshape(-1, block, 2).mean(axis=1)
+        index = index[:usable].reshape(-1, block).mean(axis=1)
+    if closed:
+        plane = np.concatenate([plane, plane[:1]])
+        index = np.append(index, index[-1] + (index[1] - index[0] if len(index) > 1 else 1))
+    steps = np.hypot(*np.diff(plane, axis=0).T)
+    moving = np.concatenate([[True], steps > 0])
+    plane, index = plane[moving], index[moving]
+    distance = np.concatenate([[0.0], np.cumsum(steps[steps > 0])])
+    total = distance[-1]
+    if total <= 0:
+        raise ValueError("Pist geometrisinin uzunluğu sıfır olamaz")
+
+    count = max(int(round(total / spacing)), 3)
+    s = np.linspace(0.0, total, count, endpoint=not closed)
+    resampled = np.stack([np.interp(s, distance, plane[:, 0]), np.interp(s, distance, plane[:, 1])], axis=1)
+    return s, resampled, np.interp(s, distance, index)
+
+def _moving_average(values: np.ndarray, window: int, closed: bool) -> np.ndarray:
+    # Kümülatif toplamla O(N) kayan ortalama; kapalı pistte uçlar sarmalanır
+    if window <= 1:
+        return values
+    half = window // 2
+    if closed:
+        padded = np.concatenate([values[-half:], values, values[:half]])
+    else:
+        padded = np.concatenate([np.repeat(values[:1], half), values, np.repeat(values[-1:], half)])
+    cumulative = np.concatenate([[0.0], np.cumsum(padded)])
+    return (cumulative[2 * half + 1:] - cumulative[:-2 * half - 1]) / (2 * half + 1)
+
+def curvature(points: np.ndarray, spacing: float, smoothing: float = 20.0, closed: bool = True) -> np.ndarray:
+    """
+    Eşit aralıklı (N, 2) yolun işaretli eğriliğini (1/m) döndürür; pozitif sol viraj.
+    Koordinatlar önce `smoothing` metre pencereli iki geçişli kayan ortalamayla
+    yumuşatılır (ölçüm gürültüsü ikinci türevde büyür).
+    """
+    window = max(min(int(round(smoothing / spacing)), len(points) - 1), 1)
+    x = _moving_average(_moving_average(points[:, 0], window, closed), window, closed)
+    y = _moving_average(_moving_average(points[:, 1], window, closed), window, closed)
+    if closed:
+        dx = (np.roll(x, -1) - np.roll(x, 1)) / (2 * spacing)
+        dy = (np.roll(y, -1) - np.roll(y, 1)) / (2 * spacing)
+        ddx = (np.roll(x, -1) - 2 * x + np.roll(x, 1)) / spacing ** 2
+        ddy = (np.roll(y, -1) - 2 * y + np.roll(y, 1)) / spacing ** 2
+    else:
+        dx, dy = np.gradient(x, spacing), np.gradient(y, spacing)
+        ddx, ddy = np.gradient(dx, spacing), np.gradient(dy, spacing)
+    speed = np.maximum(np.hypot(dx, dy), 1e-12)
+    return (dx * ddy - dy * ddx) / speed ** 3
+
+def _runs(labels: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Ardışık aynı etiketli koşuların başlangıç indeksleri ve uzunlukları"""
+    starts = np.flatnonzero(np.concatenate([[True], labels[1:] != labels[:-1]]))
+    return starts, np.diff(np.append(starts, len(labels)))
+
+def extract_track(points, spacing: float = 2.0, smoothing: float = 20.0, straight_radius: float = 400.0,
+                  min_segment: float = 20.0, bank: np.ndarray = None, plane: Sequence[int] = (1, 2),
+                  closed: bool = True, name: str = None) -> Track:
+    """
+    Pist nokta geometrisinden düzlük/viraj segmentleri çıkarır ve Track döndürür.
+
+    Noktalar eşit yay uzunluğuna örneklenir, yumuşatılmış eğrilik hesaplanır;
+    yarıçapı straight_radius'tan büyük bölümler düzlük, diğerleri (yönüne göre
+    sol/sağ) viraj sayılır. min_segment metreden kısa bölümler öncekiyle
+    birleştirilir. Viraj yarıçapı bölümdeki en yüksek eğrilikten alınır (en dar
+    nokta). bank verilirse (nokta başına derece) bölüm ortalaması kullanılır.
+    Aynı girdi her zaman aynı pisti verir.
+    """
+    points = np.asarray(points, dtype=float)
+    coordinates = points[:, list(plane)] if points.shape[1] > 2 else points
+    s, resampled, source = resample_arc_length(coordinates, spacing, closed)
+    step = s[1] - s[0]
+    kappa = curvature(resampled, step, smoothing, closed)
+
+    labels = np.where(np.abs(kappa) * straight_radius > 1, np.sign(kappa), 0).astype(np.int8)
+    shortest = max(int(round(min_segment / step)), 1)
+    starts, lengths = _runs(labels)
+    while len(starts) > 1 and lengths.min() < shortest:
+        # En kısa bölüm komşusuna katılır (ilk bölüm sonrakine, diğerleri öncekine)
+        i = int(np.argmin(lengths))
+        neighbour = starts[1] if i == 0 else starts[i - 1]
+        labels[starts[i]:starts[i] + lengths[i]] = labels[neighbour]
+        starts, lengths = _runs(labels)
+
+    if bank is not None:
+        # Nokta başına eğim, örneklerin ham nokta indeksleri üzerinden taşınır
+        bank = np.asarray(bank, dtype=float)
+        bank_samples = np.interp(source, np.arange(len(bank)), bank)
+    else:
+        bank_samples = np.zeros(len(s))
+
+    ends = starts + lengths
+    segment_kind = np.where(labels[starts] == 0, STRAIGHT, CORNER)
+    segment_length = lengths * step
+    peak = np.maximum.reduceat(np.abs(kappa), starts)
+    segment_radius = np.where(segment_kind == CORNER, 1 / np.maximum(peak, 1e-12), np.inf)
+    segment_bank = np.add.reduceat(bank_samples, starts) / (ends - starts)
+    return Track(segment_kind, segment_length, segment_radius, np.where(segment_kind == CORNER, segment_bank, 0.0),
+                 name=name)
+
+def curvature_profile(points, spacing: float = 2.0, smoothing: float = 20.0, plane: Sequence[int] = (1, 2),
+                      closed: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """İnceleme/çizim için (s, eğrilik) profilini döndürür"""
+    points = np.asarray(points, dtype=float)
+    coordinates = points[:, list(plane)] if points.shape[1] > 2 else points
+    s, resampled, _ = resample_arc_length(coordinates, spacing, closed)
+    return s, curvature(resampled, s[1] - s[0], smoothing, closed)
@@ -0,0 +1,137 @@
+import json
+import struct
+from typing import Dict, List
+
+import numpy as np
+
+# Dosya düzeni: MAGIC | sürüm (u32) | başlık uzunluğu (u32) | JSON başlık | hizalı sütun blokları
+MAGIC = b'GPTP'
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+_PREFIX = struct.Struct('<4sII')
+
+# Kontrol noktası sütunları ve karşılık gelen metin alanları
+CHECKPOINT_FIELDS = {
+    'checkpoint_position': 'WORLD_POSITION',
+    'checkpoint_offset': 'OFFSET',
+    'checkpoint_orientation': 'ORIENTATION',
+}
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+def parse_checkpoints(checkpoints: List[Dict[str, str]]) -> Dict[str, np.ndarray]:
+    """
+    'x,y,z' metinli kontrol noktalarını (M, 3) dizilere çevirir.
+    Her alan için tüm metinler birleştirilip tek seferde ayrıştırılır.
+    """
+    columns = {}
+    for column, field in CHECKPOINT_FIELDS.items():
+        text = ','.join(checkpoint.get(field, '0,0,0') for checkpoint in checkpoints)
+        values = np.array(text.split(','), dtype=float) if checkpoints else np.empty(0)
+        if len(values) != 3 * len(checkpoints):
+            raise ValueError(f"Kontrol noktası alanı 3 bileşenli olmalıdır: {field}")
+        columns[column] = values.reshape(-1, 3)
+    return columns
+
+def write_track_points(path: str, points, attributes: Dict[str, np.ndarray] = None,
+                       checkpoints=None, position_dtype=np.float64):
+    """
+    Pist noktalarını ikili dosyaya yazar.
+    points: (N, 3) konumlar; attributes: nokta başına (N,) ek sütunlar;
+    checkpoints: parse_checkpoints çıktısı ya da metinli kontrol noktası listesi.
+    """
+    points = np.asarray(points, dtype=position_dtype).reshape(-1, 3)
+    if checkpoints is None:
+        checkpoints = parse_checkpoints([])
+    elif not isinstance(checkpoints, dict):
+        checkpoints = parse_checkpoints(checkpoints)
+
+    columns = {'position': points}
+    for name, values in (attributes or {}).items():
+        values = np.asarray(values)
+        if len(values) != len(points):
+            raise ValueError(f"Nokta sütunu uzunluğu nokta sayısıyla aynı olmalıdır: {name}")
+        columns[name] = values
+    for name in CHECKPOINT_FIELDS:
+        columns[name] = np.asarray(checkpoints[name], dtype=float).reshape(-1, 3)
+
+    # Başlık uzunluğu sütun ofsetlerini etkilediği için önce yer ayrılıp sonra yazılır
+    descriptors = [{'name': name, 'dtype': values.dtype.newbyteorder('<').str, 'shape': list(values.shape)}
+                   for name, values in columns.items()]
+    header = {'version': FORMAT_VERSION, 'points': len(points),
+              'checkpoints': len(columns['checkpoint_position']), 'columns': descriptors}
+    reserve = len(json.dumps(header)) + 32 * len(descriptors) + 64
+    offset = _aligned(_PREFIX.size + reserve)
+    for descriptor, values in zip(descriptors, columns.values()):
+        descriptor['offset'] = offset
+        offset = _aligned(offset + values.nbytes)
+    encoded = json.dumps(header).encode('utf-8')
+    if _PREFIX.size + len(encoded) > descriptors[0]['offset']:
+        raise ValueError("Pist noktası başlığı ayrılan alana sığmadı")
+
+    with open(path, 'wb') as f:
+        f.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(encoded)))
+        f.write(encoded)
+        for descriptor, values in zip(descriptors, columns.values()):
+            f.seek(descriptor['offset'])
+            np.ascontiguousarray(values, dtype=descriptor['dtype']).tofile(f)
+        f.truncate(offset)
+
+def read_header(path: str) -> Dict:
+    with open(path, 'rb') as f:
+        magic, version, length = _PREFIX.unpack(f.read(_PREFIX.size))
+        if magic != MAGIC:
+            raise ValueError(f"Pist noktası dosyası değil: {path}")
+        if version > FORMAT_VERSION:
+            raise ValueError(f"Desteklenmeyen pist noktası dosya sürümü: {version}")
+        return json.loads(f.read(length))
+
+class TrackPoints:
+    """
+    İkili pist noktası dosyasının bellek eşlemeli (numpy.memmap) görünümü.
+    Açılış yalnızca başlığı okur; sütunlar kopyalanmaz, bir bölgeyi dilimlemek
+    yalnızca o bölgenin sayfalarını diskten okur.
+    """
+
+    def __init__(self, path: str, mode: str = 'r'):
+        self.path = path
+        self.header = read_header(path)
+        self.columns: Dict[str, np.ndarray] = {}
+        for descriptor in self.header['columns']:
+            shape = tuple(descriptor['shape'])
+            if 0 in shape:
+                self.columns[descriptor['name']] = np.empty(shape, dtype=descriptor['dtype'])
+            else:
+                self.columns[descriptor['name']] = np.memmap(path, dtype=descriptor['dtype'], mode=mode,
+                                                             offset=descriptor['offset'], shape=shape)
+
+    def __len__(self):
+        return self.header['points']
+
+    @property
+    def positions(self) -> np.ndarray:
+        """(N, 3) nokta konumları"""
+        return self.columns['position']
+
+    @property
+    def attributes(self) -> Dict[str, np.ndarray]:
+        """Nokta başına ek sütunlar"""
+        return {name: values for name, values in self.columns.items()
+                if name != 'position' and name not in CHECKPOINT_FIELDS}
+
+    def region(self, start: int, stop: int) -> Dict[str, np.ndarray]:
+        """[start, stop) nokta aralığındaki tüm nokta sütunlarının görünümleri"""
+        region = {'position': self.positions[start:stop]}
+        for name, values in self.attributes.items():
+            region[name] = values[start:stop]
+        return region
+
+    def checkpoints(self) -> Dict[str, np.ndarray]:
+        """Kontrol noktası konum/ofset/yönelim dizileri, (M, 3)"""
+        return {name: self.columns[name] for name in CHECKPOINT_FIELDS}
+
+def convert(track_data, checkpoints, path: str, **kwargs):
+    """Liste/metin girdilerini (MapCreator biçimi) tek seferlik ikili dosyaya dönüştürür"""
+    write_track_points(path, track_data, checkpoints=checkpoints or [], **kwargs)
+    return TrackPoints(path)